@@ -7,15 +7,37 @@ Source address type is configurable via ``BUYER_ROUTING_ADDRESS_TYPE``
 
 ``UserAddress`` is imported lazily so this module can load before
 ``app_models.user_profile`` is registered (e.g. Payment INSTALLED_APPS).
+
+Caching: ``resolve_buyer_country`` memoizes per request (inside ``buyer_routing_scope()``)
+and across requests in the Django cache (``BUYER_ROUTING_CACHE_ALIAS``) for
+``BUYER_COUNTRY_CACHE_TTL_SECONDS``. ``UserAddress`` save/delete receivers in
+``app_models.user_profile.models`` call ``invalidate_buyer_country``, so with a shared cache
+backend (e.g. Redis) an address change is visible to every service immediately; with a
+per-process backend other processes see it within one TTL.
 """
 
 from __future__ import annotations
 
-from typing import Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterable, Iterator, Optional
+
+from django.core.cache import caches
+from app_models.shared.instrumentation import instrumented
 
 # Address type used for price/currency/gateway routing. Swap to 'billing' later if needed.
 BUYER_ROUTING_ADDRESS_TYPE = 'tax'
 
+BUYER_ROUTING_CACHE_ALIAS = 'default'
+BUYER_COUNTRY_CACHE_TTL_SECONDS = 300
+# Bulk lookups split ``user_id__in`` into chunks of this size.
+BUYER_COUNTRY_BULK_CHUNK_SIZE = 1000
+
+# Cached stand-in for "no routing country" (None cannot be told apart from a cache miss).
+_NO_COUNTRY = ''
+
+_request_memo: ContextVar[Optional[Dict[int, Optional[str]]]] = ContextVar('buyer_routing_memo', default=None)
+
 
 def normalize_country_code(code: str | None) -> str | None:
     if not code:
@@ -28,6 +50,7 @@ def normalize_country_code(code: str | None) -> str | None:
     return normalized
 
 
+@instrumented()
 def get_buyer_routing_address(user):
     """UserAddress used for checkout/catalog routing, or None."""
     if user is None or not getattr(user, 'is_authenticated', True):
@@ -43,12 +66,130 @@ def get_buyer_routing_address(user):
     )
 
 
+def _cache_key(user_id) -> str:
+    return f'buyer_routing:country:{BUYER_ROUTING_ADDRESS_TYPE}:{user_id}'
+
+
+def _cache():
+    return caches[BUYER_ROUTING_CACHE_ALIAS]
+
+
+@contextmanager
+def buyer_routing_scope() -> Iterator[None]:
+    """
+    Memoize buyer countries for the duration of the block (one HTTP request or job).
+    Nested scopes share the outermost memo.
+    """
+    if _request_memo.get() is not None:
+        yield
+        return
+    token = _request_memo.set({})
+    try:
+        yield
+    finally:
+        _request_memo.reset(token)
+
+
+def buyer_routing_scope_middleware(get_response):
+    """Django middleware wrapping each request in ``buyer_routing_scope()``."""
+
+    def middleware(request):
+        with buyer_routing_scope():
+            return get_response(request)
+
+    return middleware
+
+
+def _remember(countries: Dict[int, Optional[str]]) -> None:
+    memo = _request_memo.get()
+    if memo is not None:
+        memo.update(countries)
+    _cache().set_many(
+        {_cache_key(user_id): country or _NO_COUNTRY for user_id, country in countries.items()},
+        timeout=BUYER_COUNTRY_CACHE_TTL_SECONDS,
+    )
+
+
+def invalidate_buyer_country(user_id) -> None:
+    """Drop the cached routing country for one user (called on UserAddress save/delete)."""
+    memo = _request_memo.get()
+    if memo is not None:
+        memo.pop(user_id, None)
+    _cache().delete(_cache_key(user_id))
+
+
+@instrumented()
 def resolve_buyer_country(user) -> Optional[str]:
     """
     ISO-2 from the buyer routing address ``country_code``, or None if missing.
     Callers that need a catalog default should treat None as US/USD.
     """
-    addr = get_buyer_routing_address(user)
-    if addr is None:
+    if user is None or not getattr(user, 'is_authenticated', True):
+        return None
+    user_id = getattr(user, 'pk', None)
+    if user_id is None:
         return None
-    return normalize_country_code(getattr(addr, 'country_code', None))
+    memo = _request_memo.get()
+    if memo is not None and user_id in memo:
+        return memo[user_id]
+    cached = _cache().get(_cache_key(user_id))
+    if cached is not None:
+        country = cached or None
+        if memo is not None:
+            memo[user_id] = country
+        return country
+
+    addr = get_buyer_routing_address(user)
+    country = None if addr is None else normalize_country_code(getattr(addr, 'country_code', None))
+    _remember({user_id: country})
+    return country
+
+
+@instrumented()
+def resolve_buyer_countries(user_ids: Iterable[int]) -> Dict[int, Optional[str]]:
+    """
+    ``{user_id: ISO-2 or None}`` for many users (renewals, payout and notification batches).
+    Cache misses are loaded with one query per ``BUYER_COUNTRY_BULK_CHUNK_SIZE`` users.
+    """
+    user_ids = [uid for uid in dict.fromkeys(user_ids) if uid is not None]
+    out: Dict[int, Optional[str]] = {}
+    memo = _request_memo.get() or {}
+    missing = []
+    for user_id in user_ids:
+        if user_id in memo:
+            out[user_id] = memo[user_id]
+        else:
+            missing.append(user_id)
+    if not missing:
+        return out
+
+    cached = _cache().get_many([_cache_key(uid) for uid in missing])
+    still_missing = []
+    for user_id in missing:
+        value = cached.get(_cache_key(user_id))
+        if value is None:
+            still_missing.append(user_id)
+        else:
+            out[user_id] = value or None
+    if not still_missing:
+        return out
+
+    from app_models.user_profile.models import UserAddress
+
+    loaded: Dict[int, Optional[str]] = {}
+    for start in range(0, len(still_missing), BUYER_COUNTRY_BULK_CHUNK_SIZE):
+        chunk = still_missing[start:start + BUYER_COUNTRY_BULK_CHUNK_SIZE]
+        rows = (
+            UserAddress.objects.filter(user_id__in=chunk, address_type=BUYER_ROUTING_ADDRESS_TYPE)
+            .order_by('user_id', '-updated_at')
+            .values_list('user_id', 'country_code')
+        )
+        for user_id, country_code in rows:
+            # First row per user is the most recently updated address.
+            if user_id not in loaded:
+                loaded[user_id] = normalize_country_code(country_code)
+        for user_id in chunk:
+            loaded.setdefault(user_id, None)
+    _remember(loaded)
+    out.update(loaded)
+    return out
@@ -0,0 +1,124 @@
+"""
+Redeem and clean up ``PaymentCheckoutSession`` rows.
+
+``redeem_checkout_session`` hashes the raw URL token and claims the session with a single
+conditional ``UPDATE ... RETURNING`` (PostgreSQL / SQLite), so two concurrent exchanges of the
+same link cannot both succeed and there is no read-then-write window. Other backends fall
+back to a conditional UPDATE followed by a read of the claimed row.
+
+``expire_checkout_sessions`` / ``purge_checkout_sessions`` walk the ``(status, expires_at)``
+index in small batches so pending rows flip to expired promptly and terminal rows are deleted
+after a retention window, keeping the ``token_hash`` unique index small.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+from django.db import connections, router
+from django.utils import timezone
+
+from app_models.app_payments.models import PaymentCheckoutSession
+from app_models.shared.instrumentation import instrumented
+
+CHECKOUT_SESSION_BATCH_SIZE = 1000
+CHECKOUT_SESSION_RETENTION = timedelta(days=30)
+
+PURGEABLE_STATUSES = (
+    PaymentCheckoutSession.STATUS_EXPIRED,
+    PaymentCheckoutSession.STATUS_REVOKED,
+    PaymentCheckoutSession.STATUS_FAILED,
+    PaymentCheckoutSession.STATUS_COMPLETED,
+)
+
+
+def hash_checkout_token(raw_token: str) -> str:
+    """SHA-256 hex digest stored in ``PaymentCheckoutSession.token_hash``."""
+    return hashlib.sha256(raw_token.encode('utf-8')).hexdigest()
+
+
+def _supports_update_returning(connection) -> bool:
+    return connection.vendor in ('postgresql', 'sqlite') and connection.features.can_return_columns_from_insert
+
+
+@instrumented()
+def redeem_checkout_session(raw_token: str, user, *, now: Optional[datetime] = None) -> Optional[PaymentCheckoutSession]:
+    """
+    Mark the pending, unexpired, unused session for ``raw_token`` owned by ``user`` as used and
+    return it; ``None`` when the token is unknown, belongs to someone else, expired, or was
+    already redeemed. ``status`` stays pending until the payment completes.
+    """
+    if not raw_token or user is None or getattr(user, 'pk', None) is None:
+        return None
+    now = now or timezone.now()
+    token_hash = hash_checkout_token(raw_token)
+    model = PaymentCheckoutSession
+    alias = router.db_for_write(model)
+    connection = connections[alias]
+
+    if not _supports_update_returning(connection):
+        claimed = model.objects.using(alias).filter(
+            token_hash=token_hash,
+            user_id=user.pk,
+            status=model.STATUS_PENDING,
+            used_at__isnull=True,
+            expires_at__gt=now,
+        ).update(used_at=now, updated_at=now)
+        if not claimed:
+            return None
+        return model.objects.using(alias).get(token_hash=token_hash)
+
+    qn = connection.ops.quote_name
+    opts = model._meta
+    col = {name: qn(opts.get_field(name).column) for name in ('token_hash', 'user', 'status', 'used_at', 'expires_at', 'updated_at')}
+    returning = ', '.join(qn(f.column) for f in opts.concrete_fields)
+    sql = (
+        f'UPDATE {qn(opts.db_table)} SET {col["used_at"]} = %s, {col["updated_at"]} = %s '
+        f'WHERE {col["token_hash"]} = %s AND {col["user"]} = %s AND {col["status"]} = %s '
+        f'AND {col["used_at"]} IS NULL AND {col["expires_at"]} > %s '
+        f'RETURNING {returning}'
+    )
+    ts = connection.ops.adapt_datetimefield_value(now)
+    params = [ts, ts, token_hash, user.pk, model.STATUS_PENDING, ts]
+    rows = list(model.objects.db_manager(alias).raw(sql, params))
+    return rows[0] if rows else None
+
+
+@instrumented()
+def expire_checkout_sessions(*, now: Optional[datetime] = None, batch_size: int = CHECKOUT_SESSION_BATCH_SIZE) -> int:
+    """Flip pending sessions past ``expires_at`` to expired, ``batch_size`` rows per UPDATE."""
+    now = now or timezone.now()
+    pending = PaymentCheckoutSession.objects.filter(
+        status=PaymentCheckoutSession.STATUS_PENDING,
+        expires_at__lte=now,
+    )
+    total = 0
+    while True:
+        ids = list(pending.order_by('expires_at').values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            return total
+        total += pending.filter(pk__in=ids).update(status=PaymentCheckoutSession.STATUS_EXPIRED, updated_at=now)
+
+
+@instrumented()
+def purge_checkout_sessions(
+    *,
+    retention: timedelta = CHECKOUT_SESSION_RETENTION,
+    statuses: Iterable[str] = PURGEABLE_STATUSES,
+    now: Optional[datetime] = None,
+    batch_size: int = CHECKOUT_SESSION_BATCH_SIZE,
+) -> int:
+    """Delete terminal sessions whose ``expires_at`` is older than ``retention``, in batches per status."""
+    cutoff = (now or timezone.now()) - retention
+    total = 0
+    for status in statuses:
+        stale = PaymentCheckoutSession.objects.filter(status=status, expires_at__lt=cutoff)
+        while True:
+            ids = list(stale.order_by('expires_at').values_list('pk', flat=True)[:batch_size])
+            if not ids:
+                break
+            deleted, _ = PaymentCheckoutSession.objects.filter(pk__in=ids).delete()
+            total += deleted
+    return total
@@ -0,0 +1,14 @@
+"""
+Payment choice enums shared by several apps.
+
+Kept out of ``app_payments.models`` so apps that only need the vocabulary (store, events,
+app subscriptions) do not import the payments models at startup. Still importable from
+``app_payments.models``.
+"""
+
+from django.db import models
+
+
+class PaymentGateway(models.TextChoices):
+    STRIPE = 'stripe', 'Stripe'
+    PAYSTACK = 'paystack', 'Paystack'
@@ -0,0 +1,196 @@
+"""
+``GatewayReference`` maintenance and webhook lookup.
+
+Stripe / Paystack identifiers live in several nullable columns across five models, most of
+them unindexed. Each save of one of those models mirrors its non-empty identifiers into
+``GatewayReference`` (gateway, kind, external_id -> content type + pk); a webhook then finds
+its subject with one query on the ``gatewayref_external_uq`` unique index:
+
+    purchase = resolve_gateway_subject('stripe', 'checkout_session', session_id, StorePurchase)
+
+Saves whose ``update_fields`` do not touch an identifier column skip the sync entirely; other
+saves cost one SELECT plus a write only when the identifiers changed. Rows written with
+``bulk_create`` / ``QuerySet.update`` bypass signals — call ``rebuild_gateway_references``
+for those models afterwards.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Type, Union
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.db import connections, models, router
+
+from app_models.app_payments.models import GatewayReference, GatewayReferenceKind, PaymentGateway
+from app_models.shared.instrumentation import instrumented
+
+REBUILD_CHUNK_SIZE = 2000
+
+_STRIPE_PAYMENT_INTENT = (PaymentGateway.STRIPE, GatewayReferenceKind.PAYMENT_INTENT)
+_STRIPE_CHECKOUT_SESSION = (PaymentGateway.STRIPE, GatewayReferenceKind.CHECKOUT_SESSION)
+_STRIPE_CHARGE = (PaymentGateway.STRIPE, GatewayReferenceKind.CHARGE)
+_STRIPE_SUBSCRIPTION = (PaymentGateway.STRIPE, GatewayReferenceKind.SUBSCRIPTION)
+_PAYSTACK_SUBSCRIPTION = (PaymentGateway.PAYSTACK, GatewayReferenceKind.SUBSCRIPTION)
+_PAYSTACK_REFERENCE = (PaymentGateway.PAYSTACK, GatewayReferenceKind.TRANSACTION_REFERENCE)
+
+# model label -> {column: (gateway, kind)}
+GATEWAY_REFERENCE_FIELDS: Dict[str, Dict[str, Tuple[str, str]]] = {
+    'app_payments.PaymentTransaction': {
+        'stripe_payment_intent_id': _STRIPE_PAYMENT_INTENT,
+        'stripe_charge_id': _STRIPE_CHARGE,
+        'paystack_transaction_reference': _PAYSTACK_REFERENCE,
+    },
+    'community_store.StorePurchase': {
+        'stripe_payment_intent_id': _STRIPE_PAYMENT_INTENT,
+        'stripe_checkout_session_id': _STRIPE_CHECKOUT_SESSION,
+        'paystack_subscription_code': _PAYSTACK_SUBSCRIPTION,
+        'paystack_transaction_reference': _PAYSTACK_REFERENCE,
+    },
+    'community_event.EventRegistration': {
+        'stripe_payment_intent_id': _STRIPE_PAYMENT_INTENT,
+        'stripe_checkout_session_id': _STRIPE_CHECKOUT_SESSION,
+        'paystack_transaction_reference': _PAYSTACK_REFERENCE,
+    },
+    'app_subscription.AppSubscription': {
+        'stripe_subscription_id': _STRIPE_SUBSCRIPTION,
+        'stripe_payment_intent_id': _STRIPE_PAYMENT_INTENT,
+        'paystack_subscription_code': _PAYSTACK_SUBSCRIPTION,
+        'paystack_transaction_reference': _PAYSTACK_REFERENCE,
+    },
+    'app_subscription.CommunityMemberSubscription': {
+        'stripe_subscription_id': _STRIPE_SUBSCRIPTION,
+        'stripe_payment_intent_id': _STRIPE_PAYMENT_INTENT,
+        'paystack_subscription_code': _PAYSTACK_SUBSCRIPTION,
+        'paystack_transaction_reference': _PAYSTACK_REFERENCE,
+    },
+}
+
+RefKey = Tuple[str, str, str]
+
+
+def _references_for(values: Dict[str, Optional[str]], fields: Dict[str, Tuple[str, str]]) -> Set[RefKey]:
+    refs = set()
+    for column, (gateway, kind) in fields.items():
+        external_id = values.get(column)
+        if external_id:
+            refs.add((gateway, kind, external_id))
+    return refs
+
+
+def _write_references(content_type: ContentType, rows: Iterable[Tuple[RefKey, int]]) -> None:
+    """Insert rows, re-pointing an existing (gateway, kind, external_id, type) at the new object."""
+    objs = [
+        GatewayReference(gateway=g, kind=k, external_id=e, content_type=content_type, object_id=object_id)
+        for (g, k, e), object_id in rows
+    ]
+    if not objs:
+        return
+    connection = connections[router.db_for_write(GatewayReference)]
+    if connection.features.supports_update_conflicts_with_target:
+        GatewayReference.objects.bulk_create(
+            objs,
+            update_conflicts=True,
+            unique_fields=['gateway', 'kind', 'external_id', 'content_type'],
+            update_fields=['object_id'],
+        )
+        return
+    for obj in objs:
+        GatewayReference.objects.update_or_create(
+            gateway=obj.gateway,
+            kind=obj.kind,
+            external_id=obj.external_id,
+            content_type=content_type,
+            defaults={'object_id': obj.object_id},
+        )
+
+
+@instrumented()
+def sync_gateway_references(instance: models.Model, *, update_fields=None) -> None:
+    """Mirror the instance's gateway identifier columns into GatewayReference."""
+    fields = GATEWAY_REFERENCE_FIELDS.get(instance._meta.label)
+    if not fields or instance.pk is None:
+        return
+    if update_fields is not None and not set(update_fields) & set(fields):
+        return
+    content_type = ContentType.objects.get_for_model(instance)
+    wanted = _references_for({c: getattr(instance, c) for c in fields}, fields)
+    existing = {
+        (g, k, e): pk
+        for pk, g, k, e in GatewayReference.objects.filter(
+            content_type=content_type,
+            object_id=instance.pk,
+        ).values_list('pk', 'gateway', 'kind', 'external_id')
+    }
+    stale = [pk for key, pk in existing.items() if key not in wanted]
+    if stale:
+        GatewayReference.objects.filter(pk__in=stale).delete()
+    _write_references(content_type, ((key, instance.pk) for key in wanted if key not in existing))
+
+
+@instrumented()
+def delete_gateway_references(instance: models.Model) -> None:
+    if instance._meta.label not in GATEWAY_REFERENCE_FIELDS or instance.pk is None:
+        return
+    GatewayReference.objects.filter(
+        content_type=ContentType.objects.get_for_model(instance),
+        object_id=instance.pk,
+    ).delete()
+
+
+@instrumented()
+def rebuild_gateway_references(
+    model_labels: Optional[Iterable[str]] = None,
+    *,
+    chunk_size: int = REBUILD_CHUNK_SIZE,
+) -> int:
+    """Re-derive references for whole tables (after bulk writes or as a repair job); returns rows written."""
+    written = 0
+    for label in model_labels or GATEWAY_REFERENCE_FIELDS:
+        fields = GATEWAY_REFERENCE_FIELDS[label]
+        model = apps.get_model(label)
+        content_type = ContentType.objects.get_for_model(model)
+        any_id = models.Q()
+        for column in fields:
+            any_id |= models.Q(**{f'{column}__isnull': False})
+        rows = model.objects.filter(any_id).order_by('pk').values('pk', *fields).iterator(chunk_size=chunk_size)
+        batch: List[Tuple[RefKey, int]] = []
+        for row in rows:
+            batch.extend((key, row['pk']) for key in _references_for(row, fields))
+            if len(batch) >= chunk_size:
+                _write_references(content_type, batch)
+                written += len(batch)
+                batch = []
+        _write_references(content_type, batch)
+        written += len(batch)
+    return written
+
+
+@instrumented()
+def lookup_gateway_reference(gateway: str, kind: str, external_id: str) -> List[Tuple[Type[models.Model], int]]:
+    """Every (model class, pk) holding this identifier — one indexed query."""
+    rows = GatewayReference.objects.filter(
+        gateway=gateway,
+        kind=kind,
+        external_id=external_id,
+    ).values_list('content_type_id', 'object_id')
+    return [(ContentType.objects.get_for_id(ct_id).model_class(), object_id) for ct_id, object_id in rows]
+
+
+@instrumented()
+def resolve_gateway_subject(
+    gateway: str,
+    kind: str,
+    external_id: str,
+    model: Union[str, Type[models.Model]],
+) -> Optional[models.Model]:
+    """The ``model`` row holding this identifier, or None (single query joining GatewayReference)."""
+    if isinstance(model, str):
+        model = apps.get_model(model)
+    object_ids = GatewayReference.objects.filter(
+        gateway=gateway,
+        kind=kind,
+        external_id=external_id,
+        content_type=ContentType.objects.get_for_model(model),
+    ).values('object_id')
+    return model.objects.filter(pk__in=object_ids).first()
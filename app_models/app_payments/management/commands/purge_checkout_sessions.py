@@ -0,0 +1,36 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from app_models.app_payments.checkout_sessions import (
+    CHECKOUT_SESSION_BATCH_SIZE,
+    CHECKOUT_SESSION_RETENTION,
+    expire_checkout_sessions,
+    purge_checkout_sessions,
+)
+
+
+class Command(BaseCommand):
+    help = 'Expire pending PaymentCheckoutSession rows past expires_at and delete old terminal rows.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--retention-days',
+            type=int,
+            default=CHECKOUT_SESSION_RETENTION.days,
+            help='Keep terminal sessions for this many days after expires_at',
+        )
+        parser.add_argument('--batch-size', type=int, default=CHECKOUT_SESSION_BATCH_SIZE)
+        parser.add_argument('--expire-only', action='store_true', help='Only flip pending rows to expired')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        expired = expire_checkout_sessions(batch_size=batch_size)
+        self.stdout.write(f'Expired {expired} checkout sessions')
+        if options['expire_only']:
+            return
+        deleted = purge_checkout_sessions(
+            retention=timedelta(days=options['retention_days']),
+            batch_size=batch_size,
+        )
+        self.stdout.write(f'Deleted {deleted} checkout sessions')
@@ -0,0 +1,26 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from app_models.app_payments.revenue_rollup import rebuild_revenue_rollup, run_revenue_rollup
+
+
+class Command(BaseCommand):
+    help = 'Incrementally roll PaymentTransaction rows into RevenueDailyRollup (or rebuild a day range).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rebuild-from', help='Rebuild rollups from this UTC day (YYYY-MM-DD) instead of an incremental run')
+        parser.add_argument('--rebuild-to', help='Last UTC day to rebuild (YYYY-MM-DD); defaults to today')
+
+    def handle(self, *args, **options):
+        if options['rebuild_from']:
+            try:
+                start = date.fromisoformat(options['rebuild_from'])
+                end = date.fromisoformat(options['rebuild_to']) if options['rebuild_to'] else date.today()
+            except ValueError as exc:
+                raise CommandError(str(exc))
+            touched = rebuild_revenue_rollup(start, end)
+            self.stdout.write(f'Rebuilt {touched} rollup rows for {start}..{end}')
+            return
+        touched = run_revenue_rollup()
+        self.stdout.write(f'Updated {touched} rollup rows')
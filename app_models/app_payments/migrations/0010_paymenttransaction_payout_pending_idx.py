@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_payments', '0009_userfiscalprofile'),
+        ('app_subscription', '0020_pop_has_adaptive_video_entitlement'),
+        ('community_event', '0006_alter_communityevent_agenda'),
+        ('community_store', '0011_storepurchase_require_buyer_user'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='paymenttransaction',
+            index=models.Index(condition=models.Q(('status', 'succeeded'), ('transferred_to_owner', False)), fields=['completed_at'], name='paytxn_payout_pending_idx'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:02
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_payments', '0010_paymenttransaction_payout_pending_idx'),
+        ('app_subscription', '0020_pop_has_adaptive_video_entitlement'),
+        ('community', '0030_community_bunny_collection_id'),
+        ('community_event', '0006_alter_communityevent_agenda'),
+        ('community_store', '0011_storepurchase_require_buyer_user'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='paymenttransaction',
+            name='community',
+            field=models.ForeignKey(blank=True, help_text='Community the revenue belongs to (denormalized from the subject on insert; null for app subscriptions)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='payment_transactions', to='community.community'),
+        ),
+        migrations.AddField(
+            model_name='paymenttransaction',
+            name='owner_user',
+            field=models.ForeignKey(blank=True, help_text='Community owner entitled to owner_amount (denormalized on insert; null for app subscriptions)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='owner_payment_transactions', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='paymenttransaction',
+            index=models.Index(fields=['community', 'status', 'created_at'], name='paytxn_comm_status_creat_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='paymenttransaction',
+            index=models.Index(fields=['owner_user', 'status', 'created_at'], name='paytxn_owner_status_creat_idx'),
+        ),
+    ]
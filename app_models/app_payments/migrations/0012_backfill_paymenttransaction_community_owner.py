@@ -0,0 +1,51 @@
+# Backfill PaymentTransaction.community / owner_user from the subject FKs
+
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+CHUNK_SIZE = 5000
+
+
+def backfill_community_owner(apps, schema_editor):
+    PaymentTransaction = apps.get_model('app_payments', 'PaymentTransaction')
+    CommunityMemberSubscription = apps.get_model('app_subscription', 'CommunityMemberSubscription')
+    StorePurchase = apps.get_model('community_store', 'StorePurchase')
+    EventRegistration = apps.get_model('community_event', 'EventRegistration')
+    CommunityMember = apps.get_model('community', 'CommunityMember')
+
+    sources = [
+        (
+            'community_member_subscription',
+            CommunityMemberSubscription.objects.filter(pk=OuterRef('community_member_subscription_id')).values('community_id')[:1],
+        ),
+        (
+            'store_purchase',
+            StorePurchase.objects.filter(pk=OuterRef('store_purchase_id')).values('product__store__community_id')[:1],
+        ),
+        (
+            'event_registration',
+            EventRegistration.objects.filter(pk=OuterRef('event_registration_id')).values('event__community_id')[:1],
+        ),
+    ]
+    owner = CommunityMember.objects.filter(community_id=OuterRef('community_id'), role='owner').values('user_id')[:1]
+
+    ids = PaymentTransaction.objects.order_by('pk').values_list('pk', flat=True)
+    first, last = ids.first(), ids.last()
+    if first is None:
+        return
+    for start in range(first, last + 1, CHUNK_SIZE):
+        window = PaymentTransaction.objects.filter(pk__gte=start, pk__lt=start + CHUNK_SIZE)
+        for fk_name, community in sources:
+            window.filter(community__isnull=True, **{f'{fk_name}__isnull': False}).update(community_id=Subquery(community))
+        window.filter(community__isnull=False, owner_user__isnull=True).update(owner_user_id=Subquery(owner))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_payments', '0011_paymenttransaction_community_owner_user'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_community_owner, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_payments', '0012_backfill_paymenttransaction_community_owner'),
+        ('community', '0030_community_bunny_collection_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RevenueRollupWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(help_text='PaymentTransaction timestamp column this mark tracks', max_length=32, unique=True)),
+                ('high_watermark', models.DateTimeField(help_text='Rows with source timestamp <= this instant are already rolled up')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Revenue rollup watermark',
+                'verbose_name_plural': 'Revenue rollup watermarks',
+                'db_table': 'RevenueRollupWatermark',
+            },
+        ),
+        migrations.AddField(
+            model_name='paymenttransaction',
+            name='refunded_at',
+            field=models.DateTimeField(blank=True, help_text='When status moved to refunded (set by the Payment service; drives revenue rollup refund deltas)', null=True),
+        ),
+        migrations.CreateModel(
+            name='RevenueDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(help_text='UTC calendar day (completed_at for charges, refunded_at for refunds)')),
+                ('currency', models.CharField(help_text='ISO 4217 currency code', max_length=3)),
+                ('payment_gateway', models.CharField(choices=[('stripe', 'Stripe'), ('paystack', 'Paystack')], help_text='Processor (legacy rows without a gateway are counted as stripe)', max_length=20)),
+                ('charge_count', models.IntegerField(default=0, help_text='Succeeded charges completed on this day')),
+                ('refund_count', models.IntegerField(default=0, help_text='Refunds recorded on this day')),
+                ('gross_amount', models.DecimalField(decimal_places=2, default=0, help_text='Sum of total_amount, net of refunds', max_digits=14)),
+                ('platform_fee', models.DecimalField(decimal_places=2, default=0, help_text='Sum of platform_fee, net of refunds', max_digits=14)),
+                ('owner_amount', models.DecimalField(decimal_places=2, default=0, help_text='Sum of owner_amount, net of refunds', max_digits=14)),
+                ('refunded_amount', models.DecimalField(decimal_places=2, default=0, help_text='Sum of total_amount refunded on this day', max_digits=14)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('community', models.ForeignKey(blank=True, help_text='Null for platform revenue without a community (app subscriptions)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='revenue_daily_rollups', to='community.community')),
+            ],
+            options={
+                'verbose_name': 'Revenue daily rollup',
+                'verbose_name_plural': 'Revenue daily rollups',
+                'db_table': 'RevenueDailyRollup',
+                'ordering': ['day'],
+                'indexes': [models.Index(fields=['community', 'day'], name='revenuerollup_comm_day_idx'), models.Index(fields=['day', 'payment_gateway'], name='revenuerollup_day_gateway_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('community__isnull', False)), fields=('community', 'day', 'currency', 'payment_gateway'), name='revenuerollup_community_day_uq'), models.UniqueConstraint(condition=models.Q(('community__isnull', True)), fields=('day', 'currency', 'payment_gateway'), name='revenuerollup_platform_day_uq')],
+            },
+        ),
+    ]
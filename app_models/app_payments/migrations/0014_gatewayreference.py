@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_payments', '0013_revenuedailyrollup'),
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GatewayReference',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('gateway', models.CharField(choices=[('stripe', 'Stripe'), ('paystack', 'Paystack')], max_length=20)),
+                ('kind', models.CharField(choices=[('payment_intent', 'Payment intent'), ('checkout_session', 'Checkout session'), ('charge', 'Charge'), ('subscription', 'Subscription'), ('transaction_reference', 'Transaction reference')], max_length=32)),
+                ('external_id', models.CharField(help_text='Gateway identifier, e.g. pi_..., cs_..., sub_..., SUB_..., reference', max_length=255)),
+                ('object_id', models.BigIntegerField(help_text='Primary key of the owning row')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contenttypes.contenttype')),
+            ],
+            options={
+                'verbose_name': 'Gateway reference',
+                'verbose_name_plural': 'Gateway references',
+                'db_table': 'GatewayReference',
+                'indexes': [models.Index(fields=['content_type', 'object_id'], name='gatewayref_object_idx')],
+                'constraints': [models.UniqueConstraint(fields=('gateway', 'kind', 'external_id', 'content_type'), name='gatewayref_external_uq')],
+            },
+        ),
+    ]
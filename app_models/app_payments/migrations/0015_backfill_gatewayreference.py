@@ -0,0 +1,80 @@
+# Backfill GatewayReference from the gateway id columns of payment subjects
+
+from django.db import migrations
+from django.db.models import Q
+
+CHUNK_SIZE = 2000
+
+# Mirrors app_payments.gateway_references.GATEWAY_REFERENCE_FIELDS at the time of this migration.
+SOURCES = [
+    ('app_payments', 'PaymentTransaction', [
+        ('stripe_payment_intent_id', 'stripe', 'payment_intent'),
+        ('stripe_charge_id', 'stripe', 'charge'),
+        ('paystack_transaction_reference', 'paystack', 'transaction_reference'),
+    ]),
+    ('community_store', 'StorePurchase', [
+        ('stripe_payment_intent_id', 'stripe', 'payment_intent'),
+        ('stripe_checkout_session_id', 'stripe', 'checkout_session'),
+        ('paystack_subscription_code', 'paystack', 'subscription'),
+        ('paystack_transaction_reference', 'paystack', 'transaction_reference'),
+    ]),
+    ('community_event', 'EventRegistration', [
+        ('stripe_payment_intent_id', 'stripe', 'payment_intent'),
+        ('stripe_checkout_session_id', 'stripe', 'checkout_session'),
+        ('paystack_transaction_reference', 'paystack', 'transaction_reference'),
+    ]),
+    ('app_subscription', 'AppSubscription', [
+        ('stripe_subscription_id', 'stripe', 'subscription'),
+        ('stripe_payment_intent_id', 'stripe', 'payment_intent'),
+        ('paystack_subscription_code', 'paystack', 'subscription'),
+        ('paystack_transaction_reference', 'paystack', 'transaction_reference'),
+    ]),
+    ('app_subscription', 'CommunityMemberSubscription', [
+        ('stripe_subscription_id', 'stripe', 'subscription'),
+        ('stripe_payment_intent_id', 'stripe', 'payment_intent'),
+        ('paystack_subscription_code', 'paystack', 'subscription'),
+        ('paystack_transaction_reference', 'paystack', 'transaction_reference'),
+    ]),
+]
+
+
+def backfill_gateway_references(apps, schema_editor):
+    GatewayReference = apps.get_model('app_payments', 'GatewayReference')
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+
+    for app_label, model_name, columns in SOURCES:
+        model = apps.get_model(app_label, model_name)
+        content_type, _ = ContentType.objects.get_or_create(app_label=app_label, model=model_name.lower())
+        any_id = Q()
+        for column, _gateway, _kind in columns:
+            any_id |= Q(**{f'{column}__isnull': False})
+        rows = model.objects.filter(any_id).order_by('pk').values('pk', *[c for c, _g, _k in columns])
+        batch = []
+        for row in rows.iterator(chunk_size=CHUNK_SIZE):
+            for column, gateway, kind in columns:
+                if row[column]:
+                    batch.append(GatewayReference(
+                        gateway=gateway,
+                        kind=kind,
+                        external_id=row[column],
+                        content_type_id=content_type.pk,
+                        object_id=row['pk'],
+                    ))
+            if len(batch) >= CHUNK_SIZE:
+                GatewayReference.objects.bulk_create(batch, ignore_conflicts=True)
+                batch = []
+        GatewayReference.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_payments', '0014_gatewayreference'),
+        ('app_subscription', '0020_pop_has_adaptive_video_entitlement'),
+        ('community_event', '0006_alter_communityevent_agenda'),
+        ('community_store', '0011_storepurchase_require_buyer_user'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_gateway_references, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_payments', '0015_backfill_gatewayreference'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='paymenttransaction',
+            name='refunded_at',
+            field=models.DateTimeField(blank=True, help_text='When status moved to refunded (stamped by save(); drives revenue rollup refund deltas)', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='paymenttransaction',
+            index=models.Index(condition=models.Q(('refunded_at__isnull', True), ('status', 'refunded')), fields=['id'], name='paytxn_refund_unstamped_idx'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Backfill PaymentTransaction.refunded_at for rows refunded before the column existed and seed
+# the RevenueRollupWatermark rows so revenue rollup runs only ever lock existing rows
+
+from datetime import datetime, timezone
+
+from django.db import migrations
+from django.db.models import F
+from django.db.models.functions import Coalesce
+
+CHUNK_SIZE = 2000
+
+# Mirrors app_payments.revenue_rollup at the time of this migration.
+ROLLUP_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+WATERMARK_SOURCES = ('completed_at', 'refunded_at')
+
+
+def backfill_refunded_at(apps, schema_editor):
+    PaymentTransaction = apps.get_model('app_payments', 'PaymentTransaction')
+    unstamped = PaymentTransaction.objects.filter(status='refunded', refunded_at__isnull=True)
+    while True:
+        ids = list(unstamped.order_by('pk').values_list('pk', flat=True)[:CHUNK_SIZE])
+        if not ids:
+            break
+        PaymentTransaction.objects.filter(pk__in=ids).update(refunded_at=Coalesce(F('completed_at'), F('created_at')))
+
+
+def seed_watermarks(apps, schema_editor):
+    RevenueRollupWatermark = apps.get_model('app_payments', 'RevenueRollupWatermark')
+    for source in WATERMARK_SOURCES:
+        RevenueRollupWatermark.objects.get_or_create(source=source, defaults={'high_watermark': ROLLUP_EPOCH})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_payments', '0016_paymenttransaction_refund_unstamped_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_refunded_at, migrations.RunPython.noop),
+        migrations.RunPython(seed_watermarks, migrations.RunPython.noop),
+    ]
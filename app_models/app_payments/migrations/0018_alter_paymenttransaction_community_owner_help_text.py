@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:51
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_payments', '0017_backfill_refunded_at_seed_rollup_watermarks'),
+        ('community', '0030_community_bunny_collection_id'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='paymenttransaction',
+            name='community',
+            field=models.ForeignKey(blank=True, help_text='Community the revenue belongs to (denormalized from the subject on save; null for app subscriptions)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='payment_transactions', to='community.community'),
+        ),
+        migrations.AlterField(
+            model_name='paymenttransaction',
+            name='owner_user',
+            field=models.ForeignKey(blank=True, help_text='Community owner entitled to owner_amount (denormalized on save; null for app subscriptions)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='owner_payment_transactions', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -1,8 +1,13 @@
 import django
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
 
 from app_models.account.models import User
+from app_models.app_payments.choices import PaymentGateway
+from app_models.shared.instrumentation import instrumented
 
 
 def _payment_checkout_session_subject_check_constraint():
@@ -39,11 +44,6 @@ def _payment_checkout_session_subject_check_constraint():
     return models.CheckConstraint(check=q, name=name)
 
 
-class PaymentGateway(models.TextChoices):
-    STRIPE = 'stripe', 'Stripe'
-    PAYSTACK = 'paystack', 'Paystack'
-
-
 class CreatorPayoutAccount(models.Model):
     """
     A creator (community owner) can attach multiple payout destinations over time
@@ -416,8 +416,30 @@ class PaymentTransaction(models.Model):
         help_text='Creator payout profile used when transferring owner_amount (audit trail)',
     )
 
+    community = models.ForeignKey(
+        'community.Community',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='payment_transactions',
+        help_text='Community the revenue belongs to (denormalized from the subject on save; null for app subscriptions)',
+    )
+    owner_user = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='owner_payment_transactions',
+        help_text='Community owner entitled to owner_amount (denormalized on save; null for app subscriptions)',
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     completed_at = models.DateTimeField(null=True, blank=True, help_text='When the payment was completed')
+    refunded_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text='When status moved to refunded (stamped by save(); drives revenue rollup refund deltas)',
+    )
 
     class Meta:
         db_table = 'PaymentTransaction'
@@ -432,8 +454,55 @@ class PaymentTransaction(models.Model):
             models.Index(fields=['stripe_payment_intent_id']),
             models.Index(fields=['payment_gateway']),
             models.Index(fields=['transferred_to_owner']),
+            models.Index(fields=['community', 'status', 'created_at'], name='paytxn_comm_status_creat_idx'),
+            models.Index(fields=['owner_user', 'status', 'created_at'], name='paytxn_owner_status_creat_idx'),
+            models.Index(
+                fields=['completed_at'],
+                name='paytxn_payout_pending_idx',
+                condition=Q(transferred_to_owner=False, status='succeeded'),
+            ),
+            models.Index(
+                fields=['id'],
+                name='paytxn_refund_unstamped_idx',
+                condition=Q(status='refunded', refunded_at__isnull=True),
+            ),
         ]
 
+    @instrumented()
+    def save(self, *args, **kwargs):
+        filled = []
+        if self.owner_user_id is None and (self.community_id is not None or self.has_revenue_subject()):
+            self.populate_revenue_owner()
+            filled += ['community', 'owner_user']
+        if self.status == 'refunded' and self.refunded_at is None:
+            self.refunded_at = timezone.now()
+            filled.append('refunded_at')
+        if filled and kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = {*kwargs['update_fields'], *filled}
+        super().save(*args, **kwargs)
+
+    def has_revenue_subject(self):
+        return bool(self.community_member_subscription_id or self.store_purchase_id or self.event_registration_id)
+
+    def populate_revenue_owner(self):
+        """
+        Fill missing community / owner_user from the subject FK. Runs via save() whenever owner_user
+        is still empty and a subject FK is set, so rows whose subject is attached after insert are
+        covered too. Callers that bulk_create or update() must set these fields themselves or run
+        revenue.populate_revenue_owner() after.
+        """
+        from app_models.app_payments.revenue import subject_community_id
+        from app_models.community.models import CommunityMember
+
+        if self.community_id is None:
+            self.community_id = subject_community_id(self)
+        if self.community_id is not None and self.owner_user_id is None:
+            self.owner_user_id = (
+                CommunityMember.objects.filter(community_id=self.community_id, role='owner')
+                .values_list('user_id', flat=True)
+                .first()
+            )
+
     def __str__(self):
         if self.app_subscription:
             return f"App Subscription - ${self.total_amount} - {self.status}"
@@ -444,3 +513,204 @@ class PaymentTransaction(models.Model):
         if self.event_registration:
             return f"Event registration {self.event_registration_id} - ${self.total_amount} - {self.status}"
         return f"Transaction - ${self.total_amount} - {self.status}"
+
+
+def _revenue_rollup_unique_constraints():
+    dims = ['day', 'currency', 'payment_gateway']
+    return [
+        models.UniqueConstraint(
+            fields=['community'] + dims,
+            condition=Q(community__isnull=False),
+            name='revenuerollup_community_day_uq',
+        ),
+        models.UniqueConstraint(
+            fields=dims,
+            condition=Q(community__isnull=True),
+            name='revenuerollup_platform_day_uq',
+        ),
+    ]
+
+
+class RevenueDailyRollup(models.Model):
+    """
+    Net revenue per UTC day, community, currency and gateway, maintained incrementally from
+    PaymentTransaction by app_payments.revenue_rollup. community is null for platform revenue
+    (app subscriptions). Refunds are applied as negative deltas on the refund day, so amounts
+    are net of refunds; refunded_amount / refund_count keep the refund side visible.
+    """
+
+    day = models.DateField(help_text='UTC calendar day (completed_at for charges, refunded_at for refunds)')
+    community = models.ForeignKey(
+        'community.Community',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='revenue_daily_rollups',
+        help_text='Null for platform revenue without a community (app subscriptions)',
+    )
+    currency = models.CharField(max_length=3, help_text='ISO 4217 currency code')
+    payment_gateway = models.CharField(
+        max_length=20,
+        choices=PaymentGateway.choices,
+        help_text='Processor (legacy rows without a gateway are counted as stripe)',
+    )
+    charge_count = models.IntegerField(default=0, help_text='Succeeded charges completed on this day')
+    refund_count = models.IntegerField(default=0, help_text='Refunds recorded on this day')
+    gross_amount = models.DecimalField(max_digits=14, decimal_places=2, default=0, help_text='Sum of total_amount, net of refunds')
+    platform_fee = models.DecimalField(max_digits=14, decimal_places=2, default=0, help_text='Sum of platform_fee, net of refunds')
+    owner_amount = models.DecimalField(max_digits=14, decimal_places=2, default=0, help_text='Sum of owner_amount, net of refunds')
+    refunded_amount = models.DecimalField(max_digits=14, decimal_places=2, default=0, help_text='Sum of total_amount refunded on this day')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'RevenueDailyRollup'
+        verbose_name = 'Revenue daily rollup'
+        verbose_name_plural = 'Revenue daily rollups'
+        ordering = ['day']
+        constraints = _revenue_rollup_unique_constraints()
+        indexes = [
+            models.Index(fields=['community', 'day'], name='revenuerollup_comm_day_idx'),
+            models.Index(fields=['day', 'payment_gateway'], name='revenuerollup_day_gateway_idx'),
+        ]
+
+    def __str__(self):
+        scope = f'community={self.community_id}' if self.community_id else 'platform'
+        return f'{self.day} {scope} {self.payment_gateway} {self.currency} {self.gross_amount}'
+
+
+class RevenueRollupWatermark(models.Model):
+    """High-water mark per source timestamp (completed_at / refunded_at) for the incremental revenue rollup."""
+
+    source = models.CharField(max_length=32, unique=True, help_text='PaymentTransaction timestamp column this mark tracks')
+    high_watermark = models.DateTimeField(help_text='Rows with source timestamp <= this instant are already rolled up')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'RevenueRollupWatermark'
+        verbose_name = 'Revenue rollup watermark'
+        verbose_name_plural = 'Revenue rollup watermarks'
+
+    def __str__(self):
+        return f'{self.source} <= {self.high_watermark}'
+
+
+class GatewayReferenceKind(models.TextChoices):
+    PAYMENT_INTENT = 'payment_intent', 'Payment intent'
+    CHECKOUT_SESSION = 'checkout_session', 'Checkout session'
+    CHARGE = 'charge', 'Charge'
+    SUBSCRIPTION = 'subscription', 'Subscription'
+    TRANSACTION_REFERENCE = 'transaction_reference', 'Transaction reference'
+
+
+class GatewayReference(models.Model):
+    """
+    Lookup row mapping one Stripe / Paystack identifier to the local row that owns it
+    (PaymentTransaction, StorePurchase, EventRegistration, AppSubscription or
+    CommunityMemberSubscription). Maintained on save/delete of those models by
+    app_payments.gateway_references so webhooks resolve their subject with one indexed query.
+    The same external id may point at several models (e.g. a payment intent on both the
+    StorePurchase and its PaymentTransaction).
+    """
+
+    gateway = models.CharField(max_length=20, choices=PaymentGateway.choices)
+    kind = models.CharField(max_length=32, choices=GatewayReferenceKind.choices)
+    external_id = models.CharField(max_length=255, help_text='Gateway identifier, e.g. pi_..., cs_..., sub_..., SUB_..., reference')
+    content_type = models.ForeignKey(
+        'contenttypes.ContentType',
+        on_delete=models.CASCADE,
+        related_name='+',
+    )
+    object_id = models.BigIntegerField(help_text='Primary key of the owning row')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'GatewayReference'
+        verbose_name = 'Gateway reference'
+        verbose_name_plural = 'Gateway references'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['gateway', 'kind', 'external_id', 'content_type'],
+                name='gatewayref_external_uq',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['content_type', 'object_id'], name='gatewayref_object_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.gateway}:{self.kind}:{self.external_id} -> {self.content_type_id}#{self.object_id}'
+
+
+_GATEWAY_REFERENCE_SENDERS = (
+    'app_payments.PaymentTransaction',
+    'community_store.StorePurchase',
+    'community_event.EventRegistration',
+    'app_subscription.AppSubscription',
+    'app_subscription.CommunityMemberSubscription',
+)
+
+
+@instrumented()
+def sync_gateway_reference_rows(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Keep GatewayReference in step with the gateway id columns of a payment subject."""
+    if raw:
+        return
+    from app_models.app_payments.gateway_references import sync_gateway_references
+
+    sync_gateway_references(instance, update_fields=update_fields)
+
+
+@instrumented()
+def delete_gateway_reference_rows(sender, instance, **kwargs):
+    from app_models.app_payments.gateway_references import delete_gateway_references
+
+    delete_gateway_references(instance)
+
+
+for _sender in _GATEWAY_REFERENCE_SENDERS:
+    post_save.connect(
+        sync_gateway_reference_rows,
+        sender=_sender,
+        dispatch_uid=f'app_payments.gateway_reference_saved:{_sender}',
+    )
+    post_delete.connect(
+        delete_gateway_reference_rows,
+        sender=_sender,
+        dispatch_uid=f'app_payments.gateway_reference_deleted:{_sender}',
+    )
+
+
+@receiver(pre_save, sender=CreatorPayoutAccount)
+@instrumented()
+def remember_payout_account_key(sender, instance, raw=False, **kwargs):
+    """Keep the stored (user, gateway) of an updated account so a gateway change invalidates both."""
+    if raw or instance._state.adding or instance.pk is None:
+        instance._payout_account_key_before = None
+        return
+    instance._payout_account_key_before = (
+        CreatorPayoutAccount.objects.filter(pk=instance.pk).values_list('user_id', 'payment_gateway').first()
+    )
+
+
+@receiver(post_save, sender=CreatorPayoutAccount)
+@receiver(post_delete, sender=CreatorPayoutAccount)
+@instrumented()
+def invalidate_payout_account_cache(sender, instance, using, **kwargs):
+    """
+    Drop the cached primary account for this owner/gateway, and for the previous one if the
+    account moved (a new primary may have been chosen). The cache is per process: this clears
+    it in the saving process once the write commits; other processes see the change within
+    ``payout_accounts.PAYOUT_ACCOUNT_CACHE_TTL_SECONDS``.
+    """
+    from app_models.app_payments.payout_accounts import invalidate_payout_account
+
+    keys = {(instance.user_id, instance.payment_gateway)}
+    before = getattr(instance, '_payout_account_key_before', None)
+    if before is not None:
+        keys.add(before)
+
+    def invalidate():
+        for user_id, payment_gateway in keys:
+            invalidate_payout_account(user_id, payment_gateway)
+
+    transaction.on_commit(invalidate, using=using)
@@ -0,0 +1,68 @@
+"""
+Bulk resolution of a creator's active primary ``CreatorPayoutAccount`` per gateway.
+
+``resolve_primary_payout_accounts(pairs)`` answers many (owner user id, gateway) pairs with
+one query per ``PAYOUT_ACCOUNT_QUERY_CHUNK_SIZE`` uncached owners. Results — including
+"no account" — are kept in an in-process TTL cache; saving or deleting a
+``CreatorPayoutAccount`` invalidates that owner/gateway entry (and the previous one when the
+gateway or owner changed) in the writing process after commit. Other service processes see
+account changes within ``PAYOUT_ACCOUNT_CACHE_TTL_SECONDS``.
+
+Returned instances are shared through the cache; treat them as read-only.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app_models.app_payments.models import CreatorPayoutAccount
+from app_models.shared.caching import TTLCache
+from app_models.shared.instrumentation import instrumented
+
+PAYOUT_ACCOUNT_CACHE_TTL_SECONDS = 60
+PAYOUT_ACCOUNT_QUERY_CHUNK_SIZE = 1000
+
+PayoutAccountKey = Tuple[int, str]
+
+_accounts = TTLCache(ttl=PAYOUT_ACCOUNT_CACHE_TTL_SECONDS)
+_NO_ACCOUNT = None
+
+
+def invalidate_payout_account(user_id: int, payment_gateway: str) -> None:
+    _accounts.invalidate((user_id, payment_gateway))
+
+
+def clear_payout_account_cache() -> None:
+    _accounts.clear()
+
+
+@instrumented()
+def resolve_primary_payout_accounts(pairs: Iterable[PayoutAccountKey]) -> Dict[PayoutAccountKey, Optional[CreatorPayoutAccount]]:
+    """Map each (user_id, gateway) pair to its active primary payout account, or None."""
+    wanted = set(pairs)
+    cached = _accounts.get_many(wanted)
+    found: Dict[PayoutAccountKey, Optional[CreatorPayoutAccount]] = dict(cached)
+    missing = wanted - cached.keys()
+    if not missing:
+        return found
+
+    owner_ids: List[int] = sorted({user_id for user_id, _gateway in missing})
+    gateways = {gateway for _user_id, gateway in missing}
+    for start in range(0, len(owner_ids), PAYOUT_ACCOUNT_QUERY_CHUNK_SIZE):
+        for account in CreatorPayoutAccount.objects.filter(
+            user_id__in=owner_ids[start:start + PAYOUT_ACCOUNT_QUERY_CHUNK_SIZE],
+            payment_gateway__in=gateways,
+            is_primary=True,
+            status=CreatorPayoutAccount.STATUS_ACTIVE,
+        ):
+            key = (account.user_id, account.payment_gateway)
+            if key in missing:
+                found[key] = account
+    resolved = {key: found.get(key, _NO_ACCOUNT) for key in missing}
+    _accounts.set_many(resolved)
+    found.update(resolved)
+    return found
+
+
+def resolve_primary_payout_account(user_id: int, payment_gateway: str) -> Optional[CreatorPayoutAccount]:
+    return resolve_primary_payout_accounts([(user_id, payment_gateway)])[(user_id, payment_gateway)]
@@ -0,0 +1,172 @@
+"""
+Owner payout batching over ``PaymentTransaction`` (the "weekly batch" described on the model).
+
+``iter_payout_batches`` streams succeeded, not-yet-transferred rows with a positive
+``owner_amount`` and groups them by (owner, gateway, currency). Rows are read through the
+partial index ``paytxn_payout_pending_idx`` (``transferred_to_owner=False AND
+status='succeeded'``), which stays small because settled rows drop out of it. The owner is
+the denormalized ``PaymentTransaction.owner_user``. Pending rows still missing it (written
+with ``bulk_create`` / ``update()``) are first filled from their subject FK with
+``revenue.populate_revenue_owner``; rows that still have no owner (e.g. the community has no
+owner member) are skipped and counted in a warning. Each batch carries the owner's active
+primary ``CreatorPayoutAccount`` for its gateway, resolved in bulk for many owners at a time
+(``payout_accounts.resolve_primary_payout_accounts``), and a stable ``idempotency_key`` to
+pass to the Stripe transfer / Paystack transfer call.
+
+After the gateway transfer succeeds, ``mark_batch_transferred`` flags the rows with chunked
+conditional UPDATEs so a re-run (or a refund that landed in between) never double-marks.
+
+Rows with a null ``payment_gateway`` predate Paystack and are treated as Stripe.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from itertools import groupby
+from typing import Iterator, List, Optional
+
+from django.db import transaction
+from django.db.models import Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from app_models.app_payments.models import CreatorPayoutAccount, PaymentGateway, PaymentTransaction
+from app_models.app_payments.payout_accounts import resolve_primary_payout_accounts
+from app_models.app_payments.revenue import populate_revenue_owner
+from app_models.shared.instrumentation import instrumented
+
+PAYOUT_STREAM_CHUNK_SIZE = 2000
+PAYOUT_ACCOUNT_RESOLVE_CHUNK_SIZE = 500
+PAYOUT_UPDATE_CHUNK_SIZE = 1000
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PayoutBatch:
+    owner_user_id: int
+    payment_gateway: str
+    currency: str
+    transaction_ids: List[int] = field(default_factory=list)
+    total_owner_amount: Decimal = Decimal('0')
+    payout_account: Optional[CreatorPayoutAccount] = None
+
+    @property
+    def idempotency_key(self) -> str:
+        """Same rows -> same key, so a retried transfer is deduplicated by the gateway."""
+        ids = ','.join(str(pk) for pk in sorted(self.transaction_ids))
+        raw = f'{self.owner_user_id}:{self.payment_gateway}:{self.currency}:{ids}'
+        return 'payout-' + hashlib.sha256(raw.encode('ascii')).hexdigest()
+
+
+def pending_payout_transactions():
+    """Succeeded, untransferred owner-revenue rows (served by ``paytxn_payout_pending_idx``)."""
+    return PaymentTransaction.objects.filter(
+        transferred_to_owner=False,
+        status='succeeded',
+        owner_amount__gt=0,
+    ).exclude(transaction_type='app_subscription')
+
+
+def _with_payout_gateway(qs):
+    return qs.annotate(payout_gateway=Coalesce('payment_gateway', Value(PaymentGateway.STRIPE)))
+
+
+def _resolve_payout_accounts(batches: List[PayoutBatch]) -> None:
+    accounts = resolve_primary_payout_accounts((b.owner_user_id, b.payment_gateway) for b in batches)
+    for batch in batches:
+        batch.payout_account = accounts[(batch.owner_user_id, batch.payment_gateway)]
+
+
+def iter_payout_batches(
+    *,
+    completed_before: Optional[datetime] = None,
+    payment_gateway: Optional[str] = None,
+    currency: Optional[str] = None,
+    chunk_size: int = PAYOUT_STREAM_CHUNK_SIZE,
+) -> Iterator[PayoutBatch]:
+    """
+    Yield one ``PayoutBatch`` per (owner, gateway, currency) with pending owner revenue.
+
+    ``completed_before`` limits the batch to payments completed before the cutoff (e.g. the
+    start of the current week). Batches whose owner has no active primary payout account
+    for the gateway are still yielded with ``payout_account=None`` so callers can report them.
+    Pending rows without ``owner_user`` are filled from their subject before streaming.
+    """
+    qs = pending_payout_transactions()
+    if completed_before is not None:
+        qs = qs.filter(completed_at__lt=completed_before)
+    if currency:
+        qs = qs.filter(currency=currency)
+
+    ownerless = qs.filter(owner_user__isnull=True)
+    populate_revenue_owner(ownerless)
+    skipped = ownerless.count()
+    if skipped:
+        logger.warning('Skipping %d pending payout transactions without an owner_user', skipped)
+
+    qs = _with_payout_gateway(qs).filter(owner_user__isnull=False)
+    if payment_gateway:
+        qs = qs.filter(payout_gateway=payment_gateway)
+
+    rows = (
+        qs.order_by('owner_user_id', 'payout_gateway', 'currency', 'id')
+        .values_list('id', 'owner_user_id', 'payout_gateway', 'currency', 'owner_amount')
+        .iterator(chunk_size=chunk_size)
+    )
+
+    pending: List[PayoutBatch] = []
+    for (owner_id, gateway, cur), group in groupby(rows, key=lambda r: (r[1], r[2], r[3])):
+        batch = PayoutBatch(owner_user_id=owner_id, payment_gateway=gateway, currency=cur)
+        for pk, _owner, _gateway, _cur, owner_amount in group:
+            batch.transaction_ids.append(pk)
+            batch.total_owner_amount += owner_amount
+        pending.append(batch)
+        if len(pending) >= PAYOUT_ACCOUNT_RESOLVE_CHUNK_SIZE:
+            _resolve_payout_accounts(pending)
+            yield from pending
+            pending = []
+    if pending:
+        _resolve_payout_accounts(pending)
+        yield from pending
+
+
+@instrumented()
+def mark_batch_transferred(
+    batch: PayoutBatch,
+    transfer_reference: str,
+    *,
+    transferred_at: Optional[datetime] = None,
+    chunk_size: int = PAYOUT_UPDATE_CHUNK_SIZE,
+) -> int:
+    """
+    Flag the batch rows as paid out and record the gateway transfer reference.
+
+    Only rows that are still succeeded and untransferred are touched; returns the number of
+    rows updated (less than ``len(batch.transaction_ids)`` means some rows changed meanwhile).
+    """
+    values = {
+        'transferred_to_owner': True,
+        'transferred_at': transferred_at or timezone.now(),
+    }
+    if batch.payment_gateway == PaymentGateway.PAYSTACK:
+        values['paystack_transfer_reference'] = transfer_reference
+    else:
+        values['stripe_transfer_id'] = transfer_reference
+    if batch.payout_account is not None:
+        values['creator_payout_account_id'] = batch.payout_account.pk
+
+    ids = sorted(batch.transaction_ids)
+    updated = 0
+    with transaction.atomic():
+        for start in range(0, len(ids), chunk_size):
+            updated += PaymentTransaction.objects.filter(
+                pk__in=ids[start:start + chunk_size],
+                transferred_to_owner=False,
+                status='succeeded',
+            ).update(**values)
+    return updated
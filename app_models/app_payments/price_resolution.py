@@ -0,0 +1,161 @@
+"""
+Resolve list prices for mixed catalog subjects in the buyer's currency.
+
+Subjects are ``AppSubscriptionTier``, ``CommunityGroup``, ``StoreProduct`` and
+``CommunityEvent`` instances (any mix). Each subject type costs at most one query against
+its price table, plus the buyer routing lookup, so a catalog page resolves in a constant
+number of queries regardless of how many items it lists. ``AppSubscriptionTierPrice`` is
+small and read on every pricing page, so it is served from an in-process cache that is
+invalidated when a tier price is saved or deleted.
+
+Currency choice: Paystack markets (``CURRENCY_BY_COUNTRY``) price in local currency;
+everyone else — including buyers with no routing address — uses the USD catalog. A subject
+without a row in the buyer currency falls back to its USD row, then to the legacy
+``amount`` column where the model still has one. ``None`` means "no price" (free tier).
+
+Price models are looked up through the app registry so this module imports cleanly in
+services that do not install every subject app.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.apps import apps
+from django.db.models.signals import post_delete, post_save
+
+from app_models.app_payments.buyer_routing import resolve_buyer_country
+from app_models.shared.caching import TTLCache
+from app_models.shared.instrumentation import instrumented
+
+DEFAULT_CATALOG_CURRENCY = 'USD'
+
+# Buyer country (ISO-2) -> catalog currency for Paystack markets. Unlisted countries use USD.
+CURRENCY_BY_COUNTRY = {
+    'NG': 'NGN',
+    'GH': 'GHS',
+    'ZA': 'ZAR',
+    'KE': 'KES',
+}
+
+TIER_PRICE_CACHE_TTL_SECONDS = 300
+
+_TIER_LABEL = 'app_subscription.appsubscriptiontier'
+
+# Subject model (label_lower) -> (price model label, FK attname on price model, legacy amount attr).
+_PRICE_SOURCES = {
+    _TIER_LABEL: ('app_subscription.AppSubscriptionTierPrice', 'tier_id', None),
+    'community.communitygroup': ('community.CommunityGroupPrice', 'community_group_id', None),
+    'community_store.storeproduct': ('community_store.StoreProductPrice', 'store_product_id', 'amount'),
+    'community_event.communityevent': ('community_event.CommunityEventPrice', 'community_event_id', 'amount'),
+}
+
+_tier_price_cache = TTLCache(ttl=TIER_PRICE_CACHE_TTL_SECONDS, maxsize=1)
+
+
+@dataclass(frozen=True)
+class ResolvedPrice:
+    currency: str
+    amount: Decimal
+
+
+def currency_for_country(country_code: Optional[str]) -> str:
+    """Catalog currency for a normalized ISO-2 buyer country (None -> USD)."""
+    if not country_code:
+        return DEFAULT_CATALOG_CURRENCY
+    return CURRENCY_BY_COUNTRY.get(country_code, DEFAULT_CATALOG_CURRENCY)
+
+
+def resolve_buyer_currency(user) -> str:
+    return currency_for_country(resolve_buyer_country(user))
+
+
+def _tier_price_table() -> Dict[int, Dict[str, Decimal]]:
+    table = _tier_price_cache.get('all')
+    if table is None:
+        price_model = apps.get_model(_PRICE_SOURCES[_TIER_LABEL][0])
+        table = {}
+        for tier_id, currency, amount in price_model.objects.values_list('tier_id', 'currency', 'amount'):
+            table.setdefault(tier_id, {})[currency.upper()] = amount
+        _tier_price_cache.set('all', table)
+    return table
+
+
+def invalidate_tier_price_cache(*args, **kwargs) -> None:
+    """Signal receiver (and manual hook) that drops the cached AppSubscriptionTierPrice table."""
+    _tier_price_cache.clear()
+
+
+def _load_price_rows(label: str, ids: Iterable[int], currencies: Iterable[str]) -> Dict[int, Dict[str, Decimal]]:
+    ids = set(ids)
+    if label == _TIER_LABEL:
+        table = _tier_price_table()
+        return {pk: table[pk] for pk in ids if pk in table}
+
+    price_label, fk_attname, _legacy = _PRICE_SOURCES[label]
+    price_model = apps.get_model(price_label)
+    rows: Dict[int, Dict[str, Decimal]] = {}
+    qs = price_model.objects.filter(**{f'{fk_attname}__in': ids, 'currency__in': list(currencies)})
+    for subject_id, currency, amount in qs.values_list(fk_attname, 'currency', 'amount'):
+        rows.setdefault(subject_id, {})[currency.upper()] = amount
+    return rows
+
+
+@instrumented()
+def resolve_prices(buyer, subjects, *, currency: Optional[str] = None) -> List[Optional[ResolvedPrice]]:
+    """
+    Price for each subject, aligned with ``subjects``; ``None`` where the subject has no price.
+
+    ``currency`` overrides the routing-derived buyer currency (e.g. when checkout already
+    fixed the currency). Raises ``ValueError`` for unsupported subject types.
+    """
+    subjects = list(subjects)
+    if not subjects:
+        return []
+    wanted = (currency or resolve_buyer_currency(buyer)).upper()
+    currencies = {wanted, DEFAULT_CATALOG_CURRENCY}
+
+    ids_by_label: Dict[str, set] = {}
+    for subject in subjects:
+        label = subject._meta.label_lower
+        if label not in _PRICE_SOURCES:
+            raise ValueError(f'Unsupported price subject: {subject._meta.label}')
+        ids_by_label.setdefault(label, set()).add(subject.pk)
+
+    rows: Dict[Tuple[str, int], Dict[str, Decimal]] = {}
+    for label, ids in ids_by_label.items():
+        for subject_id, amounts in _load_price_rows(label, ids, currencies).items():
+            rows[(label, subject_id)] = amounts
+
+    out: List[Optional[ResolvedPrice]] = []
+    for subject in subjects:
+        label = subject._meta.label_lower
+        amounts = rows.get((label, subject.pk), {})
+        legacy_attr = _PRICE_SOURCES[label][2]
+        if wanted in amounts:
+            out.append(ResolvedPrice(wanted, amounts[wanted]))
+        elif DEFAULT_CATALOG_CURRENCY in amounts:
+            out.append(ResolvedPrice(DEFAULT_CATALOG_CURRENCY, amounts[DEFAULT_CATALOG_CURRENCY]))
+        elif legacy_attr and getattr(subject, legacy_attr, None) is not None:
+            out.append(ResolvedPrice(DEFAULT_CATALOG_CURRENCY, getattr(subject, legacy_attr)))
+        else:
+            out.append(None)
+    return out
+
+
+def resolve_price(buyer, subject, *, currency: Optional[str] = None) -> Optional[ResolvedPrice]:
+    return resolve_prices(buyer, [subject], currency=currency)[0]
+
+
+post_save.connect(
+    invalidate_tier_price_cache,
+    sender=_PRICE_SOURCES[_TIER_LABEL][0],
+    dispatch_uid='app_payments.price_resolution.tier_price_saved',
+)
+post_delete.connect(
+    invalidate_tier_price_cache,
+    sender=_PRICE_SOURCES[_TIER_LABEL][0],
+    dispatch_uid='app_payments.price_resolution.tier_price_deleted',
+)
@@ -0,0 +1,133 @@
+"""
+Single-table revenue queries over ``PaymentTransaction``.
+
+``community`` and ``owner_user`` are denormalized onto each transaction on insert (see
+``PaymentTransaction.save``) so dashboards no longer join through the four nullable subject
+FKs. Aggregates here filter on (community | owner_user, status, created_at), which the
+``paytxn_comm_status_creat_idx`` / ``paytxn_owner_status_creat_idx`` indexes cover.
+
+Days are UTC calendar days of ``created_at``.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone as dt_timezone
+from typing import List, Optional
+
+from django.db.models import Count, OuterRef, Subquery, Sum
+from django.db.models.functions import TruncDate
+
+from app_models.app_payments.models import PaymentTransaction
+from app_models.shared.instrumentation import instrumented
+
+REVENUE_STATUS = 'succeeded'
+BACKFILL_CHUNK_SIZE = 5000
+
+
+@instrumented()
+def subject_community_id(txn) -> Optional[int]:
+    """Community id behind a transaction's subject FK (one query), or None for app subscriptions."""
+    from django.apps import apps
+
+    if txn.community_member_subscription_id:
+        model = apps.get_model('app_subscription', 'CommunityMemberSubscription')
+        qs = model.objects.filter(pk=txn.community_member_subscription_id).values_list('community_id', flat=True)
+    elif txn.store_purchase_id:
+        model = apps.get_model('community_store', 'StorePurchase')
+        qs = model.objects.filter(pk=txn.store_purchase_id).values_list('product__store__community_id', flat=True)
+    elif txn.event_registration_id:
+        model = apps.get_model('community_event', 'EventRegistration')
+        qs = model.objects.filter(pk=txn.event_registration_id).values_list('event__community_id', flat=True)
+    else:
+        return None
+    return qs.first()
+
+
+@instrumented()
+def populate_revenue_owner(queryset=None, *, chunk_size: int = BACKFILL_CHUNK_SIZE) -> int:
+    """
+    Fill missing ``community`` / ``owner_user`` with set-based UPDATEs in primary-key batches.
+
+    For rows written without ``save()`` (bulk_create, raw SQL) and for repair jobs.
+    Returns the number of rows that received a community.
+    """
+    from django.apps import apps
+
+    cms_model = apps.get_model('app_subscription', 'CommunityMemberSubscription')
+    purchase_model = apps.get_model('community_store', 'StorePurchase')
+    registration_model = apps.get_model('community_event', 'EventRegistration')
+    member_model = apps.get_model('community', 'CommunityMember')
+
+    qs = PaymentTransaction.objects.all() if queryset is None else queryset
+    sources = [
+        ('community_member_subscription', cms_model.objects.filter(pk=OuterRef('community_member_subscription_id')).values('community_id')[:1]),
+        ('store_purchase', purchase_model.objects.filter(pk=OuterRef('store_purchase_id')).values('product__store__community_id')[:1]),
+        ('event_registration', registration_model.objects.filter(pk=OuterRef('event_registration_id')).values('event__community_id')[:1]),
+    ]
+    owner = member_model.objects.filter(community_id=OuterRef('community_id'), role='owner').values('user_id')[:1]
+
+    filled = 0
+    last_pk = 0
+    while True:
+        pks = list(qs.filter(pk__gt=last_pk).order_by('pk').values_list('pk', flat=True)[:chunk_size])
+        if not pks:
+            break
+        last_pk = pks[-1]
+        window = PaymentTransaction.objects.filter(pk__in=pks)
+        for fk_name, community in sources:
+            filled += window.filter(community__isnull=True, **{f'{fk_name}__isnull': False}).update(
+                community_id=Subquery(community),
+            )
+        window.filter(community__isnull=False, owner_user__isnull=True).update(owner_user_id=Subquery(owner))
+    return filled
+
+
+def _revenue_by_day(qs, start: datetime, end: datetime) -> List[dict]:
+    return list(
+        qs.filter(status=REVENUE_STATUS, created_at__gte=start, created_at__lt=end)
+        .annotate(day=TruncDate('created_at', tzinfo=dt_timezone.utc))
+        .values('day', 'currency')
+        .annotate(
+            transaction_count=Count('id'),
+            total_amount=Sum('total_amount'),
+            platform_fee=Sum('platform_fee'),
+            owner_amount=Sum('owner_amount'),
+        )
+        .order_by('day', 'currency')
+    )
+
+
+def _revenue_by_currency(qs, start: datetime, end: datetime) -> List[dict]:
+    return list(
+        qs.filter(status=REVENUE_STATUS, created_at__gte=start, created_at__lt=end)
+        .values('currency')
+        .annotate(
+            transaction_count=Count('id'),
+            total_amount=Sum('total_amount'),
+            platform_fee=Sum('platform_fee'),
+            owner_amount=Sum('owner_amount'),
+        )
+        .order_by('currency')
+    )
+
+
+@instrumented()
+def community_revenue_by_day(community_id: int, *, start: datetime, end: datetime) -> List[dict]:
+    """Rows of ``{day, currency, transaction_count, total_amount, platform_fee, owner_amount}`` for [start, end)."""
+    return _revenue_by_day(PaymentTransaction.objects.filter(community_id=community_id), start, end)
+
+
+@instrumented()
+def community_revenue_by_currency(community_id: int, *, start: datetime, end: datetime) -> List[dict]:
+    return _revenue_by_currency(PaymentTransaction.objects.filter(community_id=community_id), start, end)
+
+
+@instrumented()
+def owner_revenue_by_day(owner_user_id: int, *, start: datetime, end: datetime) -> List[dict]:
+    """Same shape as ``community_revenue_by_day`` across every community the user owns."""
+    return _revenue_by_day(PaymentTransaction.objects.filter(owner_user_id=owner_user_id), start, end)
+
+
+@instrumented()
+def owner_revenue_by_currency(owner_user_id: int, *, start: datetime, end: datetime) -> List[dict]:
+    return _revenue_by_currency(PaymentTransaction.objects.filter(owner_user_id=owner_user_id), start, end)
@@ -0,0 +1,226 @@
+"""
+Incremental maintenance of ``RevenueDailyRollup`` from ``PaymentTransaction``.
+
+``run_revenue_rollup`` is meant to run every few minutes (cron / worker beat). Each run reads
+only transactions whose ``completed_at`` (charges) or ``refunded_at`` (refunds) falls between
+the stored ``RevenueRollupWatermark`` and ``now - lag`` and applies them as deltas:
+
+* charge: +total_amount / platform_fee / owner_amount on the UTC day of ``completed_at``
+  (counted for rows now ``succeeded`` or ``refunded`` — a refunded row was still charged);
+* refund: the same amounts subtracted on the UTC day of ``refunded_at``.
+
+``refunded_at`` is the only refund timestamp either path reads. ``PaymentTransaction.save()``
+stamps it when a row is saved as ``refunded``; migration 0017 set it to ``completed_at`` on rows
+refunded before the column existed. Rows moved to ``refunded`` with ``QuerySet.update`` are
+stamped with the current time by the next run or rebuild (found through
+``paytxn_refund_unstamped_idx``) and counted once that time is behind the lag.
+
+The lag leaves room for transactions committed slightly after their timestamp. Rows written
+with a timestamp older than the watermark (e.g. backdated imports) are not picked up; repair
+those days with ``rebuild_revenue_rollup``. Runs are serialized by locking the watermark rows,
+which migration 0017 seeds at ``ROLLUP_EPOCH`` so the first run rolls up all history.
+
+Charts read ``community_revenue_series`` / ``platform_revenue_series`` — a few hundred rollup
+rows regardless of transaction volume.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Count, F, Sum, Value
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from app_models.app_payments.models import (
+    PaymentGateway,
+    PaymentTransaction,
+    RevenueDailyRollup,
+    RevenueRollupWatermark,
+)
+from app_models.shared.instrumentation import instrumented
+
+ROLLUP_SAFETY_LAG = timedelta(minutes=5)
+ROLLUP_EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+SOURCE_COMPLETED = 'completed_at'
+SOURCE_REFUNDED = 'refunded_at'
+
+_CHARGED_STATUSES = ('succeeded', 'refunded')
+_AMOUNT_FIELDS = ('gross_amount', 'platform_fee', 'owner_amount', 'refunded_amount')
+
+RollupKey = Tuple[date, Optional[int], str, str]
+
+
+def _grouped(qs, timestamp: str):
+    return (
+        qs.annotate(
+            rollup_day=TruncDate(timestamp, tzinfo=dt_timezone.utc),
+            rollup_gateway=Coalesce('payment_gateway', Value(PaymentGateway.STRIPE)),
+        )
+        .values('rollup_day', 'community_id', 'currency', 'rollup_gateway')
+        .annotate(
+            row_count=Count('id'),
+            total=Sum('total_amount'),
+            fee=Sum('platform_fee'),
+            owner=Sum('owner_amount'),
+        )
+        .order_by()
+    )
+
+
+def _collect_deltas(charges, refunds) -> Dict[RollupKey, Dict[str, Decimal]]:
+    deltas: Dict[RollupKey, Dict[str, Decimal]] = {}
+
+    def bucket(row) -> Dict[str, Decimal]:
+        key = (row['rollup_day'], row['community_id'], row['currency'], row['rollup_gateway'])
+        if key not in deltas:
+            deltas[key] = {'charge_count': 0, 'refund_count': 0, **{f: Decimal('0') for f in _AMOUNT_FIELDS}}
+        return deltas[key]
+
+    for row in _grouped(charges, SOURCE_COMPLETED):
+        d = bucket(row)
+        d['charge_count'] += row['row_count']
+        d['gross_amount'] += row['total'] or 0
+        d['platform_fee'] += row['fee'] or 0
+        d['owner_amount'] += row['owner'] or 0
+    for row in _grouped(refunds, SOURCE_REFUNDED):
+        d = bucket(row)
+        d['refund_count'] += row['row_count']
+        d['gross_amount'] -= row['total'] or 0
+        d['platform_fee'] -= row['fee'] or 0
+        d['owner_amount'] -= row['owner'] or 0
+        d['refunded_amount'] += row['total'] or 0
+    return deltas
+
+
+def _apply_deltas(deltas: Dict[RollupKey, Dict[str, Decimal]]) -> None:
+    for (day, community_id, currency, gateway), d in deltas.items():
+        updated = RevenueDailyRollup.objects.filter(
+            day=day,
+            community_id=community_id,
+            currency=currency,
+            payment_gateway=gateway,
+        ).update(
+            updated_at=timezone.now(),
+            **{name: F(name) + value for name, value in d.items()},
+        )
+        if not updated:
+            RevenueDailyRollup.objects.create(
+                day=day,
+                community_id=community_id,
+                currency=currency,
+                payment_gateway=gateway,
+                **d,
+            )
+
+
+def _locked_watermarks() -> Dict[str, RevenueRollupWatermark]:
+    """
+    Lock both watermark rows. They are seeded by migration 0017; databases built without
+    migrations get them here, and a concurrent first insert falls back to locking the winner's row.
+    """
+    locked = RevenueRollupWatermark.objects.select_for_update()
+    return {
+        source: locked.get_or_create(source=source, defaults={'high_watermark': ROLLUP_EPOCH})[0]
+        for source in (SOURCE_COMPLETED, SOURCE_REFUNDED)
+    }
+
+
+def _stamp_unrecorded_refunds() -> int:
+    """Give refunded rows saved without ``refunded_at`` (``QuerySet.update``) the time they were found."""
+    return PaymentTransaction.objects.filter(status='refunded', refunded_at__isnull=True).update(refunded_at=timezone.now())
+
+
+@instrumented()
+def run_revenue_rollup(*, now: Optional[datetime] = None, lag: timedelta = ROLLUP_SAFETY_LAG) -> int:
+    """Roll transactions completed/refunded since the last run into daily rows; returns rows touched."""
+    upper = (now or timezone.now()) - lag
+    with transaction.atomic():
+        marks = _locked_watermarks()
+        _stamp_unrecorded_refunds()
+
+        charges = PaymentTransaction.objects.filter(
+            status__in=_CHARGED_STATUSES,
+            completed_at__gt=marks[SOURCE_COMPLETED].high_watermark,
+            completed_at__lte=upper,
+        )
+        refunds = PaymentTransaction.objects.filter(
+            status='refunded',
+            refunded_at__gt=marks[SOURCE_REFUNDED].high_watermark,
+            refunded_at__lte=upper,
+        )
+        deltas = _collect_deltas(charges, refunds)
+        _apply_deltas(deltas)
+
+        for mark in marks.values():
+            if mark.high_watermark < upper:
+                mark.high_watermark = upper
+                mark.save(update_fields=['high_watermark', 'updated_at'])
+    return len(deltas)
+
+
+@instrumented()
+def rebuild_revenue_rollup(start_day: date, end_day: date) -> int:
+    """
+    Recompute [start_day, end_day] from raw transactions (repair / backfill), up to the current
+    watermarks so the next incremental run does not count anything twice.
+    """
+    lo = datetime.combine(start_day, datetime.min.time(), tzinfo=dt_timezone.utc)
+    hi = datetime.combine(end_day + timedelta(days=1), datetime.min.time(), tzinfo=dt_timezone.utc)
+    with transaction.atomic():
+        marks = _locked_watermarks()
+        _stamp_unrecorded_refunds()
+        completed_through = marks[SOURCE_COMPLETED].high_watermark
+        refunded_through = marks[SOURCE_REFUNDED].high_watermark
+
+        RevenueDailyRollup.objects.filter(day__gte=start_day, day__lte=end_day).delete()
+        charges = PaymentTransaction.objects.filter(
+            status__in=_CHARGED_STATUSES,
+            completed_at__gte=lo,
+            completed_at__lt=hi,
+            completed_at__lte=completed_through,
+        )
+        refunds = PaymentTransaction.objects.filter(
+            status='refunded',
+            refunded_at__gte=lo,
+            refunded_at__lt=hi,
+            refunded_at__lte=refunded_through,
+        )
+        deltas = _collect_deltas(charges, refunds)
+        _apply_deltas(deltas)
+    return len(deltas)
+
+
+def _series(qs, start_day: date, end_day: date, group_by: Iterable[str]) -> List[dict]:
+    return list(
+        qs.filter(day__gte=start_day, day__lte=end_day)
+        .values('day', *group_by)
+        .annotate(
+            charge_count=Sum('charge_count'),
+            refund_count=Sum('refund_count'),
+            gross_amount=Sum('gross_amount'),
+            platform_fee=Sum('platform_fee'),
+            owner_amount=Sum('owner_amount'),
+            refunded_amount=Sum('refunded_amount'),
+        )
+        .order_by('day', *group_by)
+    )
+
+
+@instrumented()
+def community_revenue_series(community_ids, start_day: date, end_day: date) -> List[dict]:
+    """Per-day, per-currency net revenue for one community id or a list (an owner's communities)."""
+    if isinstance(community_ids, int):
+        community_ids = [community_ids]
+    qs = RevenueDailyRollup.objects.filter(community_id__in=list(community_ids))
+    return _series(qs, start_day, end_day, ['currency'])
+
+
+@instrumented()
+def platform_revenue_series(start_day: date, end_day: date) -> List[dict]:
+    """Per-day totals by gateway and currency across all communities and platform revenue."""
+    return _series(RevenueDailyRollup.objects.all(), start_day, end_day, ['payment_gateway', 'currency'])
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_subscription', '0020_pop_has_adaptive_video_entitlement'),
+        ('community', '0030_community_bunny_collection_id'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='communitymembersubscription',
+            name='CommunityMe_status_2b3260_idx',
+        ),
+        migrations.AddIndex(
+            model_name='communitymembersubscription',
+            index=models.Index(fields=['status', 'expires_at', 'community_group'], name='cms_status_exp_group_idx'),
+        ),
+    ]
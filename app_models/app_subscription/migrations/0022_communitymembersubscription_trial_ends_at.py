@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_subscription', '0021_cms_status_exp_group_idx'),
+        ('community', '0030_community_bunny_collection_id'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='communitymembersubscription',
+            name='trial_ends_at',
+            field=models.DateTimeField(blank=True, help_text='activated_at + community_group.trial_days for trial subscriptions (set on save); null otherwise.', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='communitymembersubscription',
+            index=models.Index(fields=['is_trial', 'trial_ends_at'], name='cms_trial_ends_idx'),
+        ),
+    ]
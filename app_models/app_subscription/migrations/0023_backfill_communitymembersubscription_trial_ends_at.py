@@ -0,0 +1,39 @@
+# Backfill CommunityMemberSubscription.trial_ends_at = activated_at + community_group.trial_days
+
+from datetime import timedelta
+
+from django.db import migrations
+
+CHUNK_SIZE = 2000
+
+
+def backfill_trial_ends_at(apps, schema_editor):
+    CommunityMemberSubscription = apps.get_model('app_subscription', 'CommunityMemberSubscription')
+
+    rows = (
+        CommunityMemberSubscription.objects.filter(
+            is_trial=True,
+            activated_at__isnull=False,
+            community_group__trial_days__gt=0,
+        )
+        .order_by('pk')
+        .values_list('pk', 'activated_at', 'community_group__trial_days')
+    )
+    batch = []
+    for pk, activated_at, trial_days in rows.iterator(chunk_size=CHUNK_SIZE):
+        batch.append(CommunityMemberSubscription(pk=pk, trial_ends_at=activated_at + timedelta(days=trial_days)))
+        if len(batch) >= CHUNK_SIZE:
+            CommunityMemberSubscription.objects.bulk_update(batch, ['trial_ends_at'])
+            batch = []
+    CommunityMemberSubscription.objects.bulk_update(batch, ['trial_ends_at'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_subscription', '0022_communitymembersubscription_trial_ends_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_trial_ends_at, migrations.RunPython.noop),
+    ]
@@ -1,13 +1,15 @@
+from datetime import timedelta
 from decimal import Decimal
 
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 from django.utils import timezone
 from app_models.account.models import User
-from app_models.app_payments.models import PaymentGateway
+from app_models.app_payments.choices import PaymentGateway
 from app_models.community.models import Community, CommunityGroup
 
 from app_models.app_subscription.entitlements import validate_tier_entitlements
+from app_models.shared.instrumentation import instrumented
 
 
 class AppSubscriptionTier(models.Model):
@@ -50,6 +52,7 @@ class AppSubscriptionTier(models.Model):
         super().clean()
         validate_tier_entitlements(self.entitlements)
 
+    @instrumented()
     def save(self, *args, **kwargs):
         validate_tier_entitlements(self.entitlements or {})
         super().save(*args, **kwargs)
@@ -277,6 +280,11 @@ class CommunityMemberSubscription(models.Model):
     activated_at = models.DateTimeField(null=True, blank=True, help_text='When the subscription was activated (payment confirmed)')
     expires_at = models.DateTimeField(null=True, blank=True, help_text='When the subscription expires (for recurring plans)')
     cancelled_at = models.DateTimeField(null=True, blank=True, help_text='When the subscription was cancelled')
+    trial_ends_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text='activated_at + community_group.trial_days for trial subscriptions (set on save); null otherwise.',
+    )
 
     stripe_subscription_id = models.CharField(max_length=255, null=True, blank=True, help_text='Stripe subscription ID (for recurring subscriptions)')
     stripe_customer_id = models.CharField(max_length=255, null=True, blank=True, help_text='Stripe customer ID')
@@ -310,12 +318,30 @@ class CommunityMemberSubscription(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['user', 'community', 'status']),
-            models.Index(fields=['status', 'expires_at']),
+            models.Index(fields=['status', 'expires_at', 'community_group'], name='cms_status_exp_group_idx'),
+            models.Index(fields=['is_trial', 'trial_ends_at'], name='cms_trial_ends_idx'),
         ]
 
     def __str__(self):
         return f"{self.user.email} - {self.community.name} - {self.community_group.name}"
 
+    def compute_trial_ends_at(self):
+        if not self.is_trial or not self.activated_at:
+            return None
+        trial_days = self.community_group.trial_days
+        if not trial_days:
+            return None
+        return self.activated_at + timedelta(days=trial_days)
+
+    @instrumented()
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or {'is_trial', 'activated_at', 'community_group', 'community_group_id'} & set(update_fields):
+            self.trial_ends_at = self.compute_trial_ends_at()
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'trial_ends_at'}
+        super().save(*args, **kwargs)
+
     def is_active(self):
         if self.status != 'active':
             return False
@@ -0,0 +1,123 @@
+"""
+Renewal queue for recurring ``CommunityMemberSubscription`` rows.
+
+A subscription is due when it is active, its group bills monthly or yearly, and
+``expires_at`` falls before the horizon (``now + within``). Lifetime and custom-window tiers
+never renew. Due rows are read in ``(expires_at, id)`` keyset order through
+``cms_status_exp_group_idx`` (status, expires_at, community_group), so each batch costs the
+same no matter how many subscriptions exist or how far the worker has progressed. Rows come
+with ``community_group`` / ``user`` joined and the group's ``prices`` prefetched (one extra
+query per batch).
+
+The Payment service renewal worker either iterates ``iter_due_renewal_batches`` or, to
+resume across runs, stores the cursor returned by ``due_renewal_batch``.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional, Tuple
+
+from django.db.models import Q
+from django.utils import timezone
+
+from app_models.app_subscription.models import CommunityMemberSubscription
+from app_models.community.models import CommunityGroup
+from app_models.shared.instrumentation import instrumented
+
+RENEWABLE_BILLING_PERIODS = (CommunityGroup.BillingPeriod.MONTHLY, CommunityGroup.BillingPeriod.YEARLY)
+RENEWAL_WINDOW = timedelta(hours=24)
+RENEWAL_BATCH_SIZE = 500
+
+RenewalCursor = Tuple[datetime, int]
+
+
+def due_renewals(horizon: datetime):
+    """Active recurring subscriptions expiring at or before ``horizon``, in keyset order."""
+    return (
+        CommunityMemberSubscription.objects.filter(
+            status='active',
+            expires_at__isnull=False,
+            expires_at__lte=horizon,
+            community_group__billing_period__in=RENEWABLE_BILLING_PERIODS,
+        )
+        .select_related('community_group', 'user')
+        .prefetch_related('community_group__prices')
+        .order_by('expires_at', 'id')
+    )
+
+
+@instrumented()
+def due_renewal_batch(
+    horizon: datetime,
+    *,
+    after: Optional[RenewalCursor] = None,
+    batch_size: int = RENEWAL_BATCH_SIZE,
+) -> Tuple[List[CommunityMemberSubscription], Optional[RenewalCursor]]:
+    """
+    One page of due subscriptions after ``after`` (an ``(expires_at, id)`` cursor). Returns the
+    rows and the cursor for the next page, or ``None`` when this was the last page.
+    """
+    qs = due_renewals(horizon)
+    if after is not None:
+        expires_at, pk = after
+        qs = qs.filter(Q(expires_at__gt=expires_at) | Q(expires_at=expires_at, id__gt=pk))
+    rows = list(qs[:batch_size])
+    if len(rows) < batch_size:
+        return rows, None
+    last = rows[-1]
+    return rows, (last.expires_at, last.pk)
+
+
+def iter_due_renewal_batches(
+    *,
+    within: timedelta = RENEWAL_WINDOW,
+    now: Optional[datetime] = None,
+    batch_size: int = RENEWAL_BATCH_SIZE,
+) -> Iterator[List[CommunityMemberSubscription]]:
+    """Yield batches of subscriptions due within ``within`` of ``now`` (past-due rows included)."""
+    horizon = (now or timezone.now()) + within
+    cursor: Optional[RenewalCursor] = None
+    while True:
+        rows, cursor = due_renewal_batch(horizon, after=cursor, batch_size=batch_size)
+        if rows:
+            yield rows
+        if cursor is None:
+            return
+
+
+def trials_ending(start: datetime, end: datetime):
+    """Active trial subscriptions whose ``trial_ends_at`` is in [start, end), served by ``cms_trial_ends_idx``."""
+    return (
+        CommunityMemberSubscription.objects.filter(
+            is_trial=True,
+            trial_ends_at__gte=start,
+            trial_ends_at__lt=end,
+            status='active',
+        )
+        .select_related('community_group', 'user')
+        .prefetch_related('community_group__prices')
+        .order_by('trial_ends_at', 'id')
+    )
+
+
+def iter_trials_ending_batches(
+    *,
+    within: timedelta = RENEWAL_WINDOW,
+    now: Optional[datetime] = None,
+    batch_size: int = RENEWAL_BATCH_SIZE,
+) -> Iterator[List[CommunityMemberSubscription]]:
+    """Yield batches of trials ending between ``now`` and ``now + within`` (trial-to-paid conversion)."""
+    start = now or timezone.now()
+    qs = trials_ending(start, start + within)
+    cursor: Optional[Tuple[datetime, int]] = None
+    while True:
+        page = qs
+        if cursor is not None:
+            page = qs.filter(Q(trial_ends_at__gt=cursor[0]) | Q(trial_ends_at=cursor[0], id__gt=cursor[1]))
+        rows = list(page[:batch_size])
+        if rows:
+            yield rows
+        if len(rows) < batch_size:
+            return
+        cursor = (rows[-1].trial_ends_at, rows[-1].pk)
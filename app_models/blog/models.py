@@ -2,6 +2,7 @@ from django.db import models
 from django.utils.text import slugify
 from django.utils import timezone
 from app_models.account.models import User
+from app_models.shared.instrumentation import instrumented
 
 
 class BlogPost(models.Model):
@@ -18,6 +19,7 @@ class BlogPost(models.Model):
     def __str__(self):
         return self.title
     
+    @instrumented()
     def save(self, *args, **kwargs):
         # Treat empty strings as None for slug
         if self.slug == '':
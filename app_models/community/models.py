@@ -6,6 +6,8 @@ from django.utils.text import slugify
 from app_models.account.models import User
 from app_models.shared.models import Tag
 from app_models.shared.validators import slug_username_validator
+from app_models.shared.instrumentation import instrumented
+from app_models.shared.likes import ViewerLikedQuerySet
 
 
 def _current_year():
@@ -43,9 +45,12 @@ class Community(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     members = models.ManyToManyField(User, through='CommunityMember', through_fields=('community', 'user'), related_name='communities')
 
+    objects = ViewerLikedQuerySet.as_manager()
+
     def __str__(self):
         return self.name
 
+    @instrumented()
     def save(self, *args, **kwargs):
         # Generate alias from name if not provided
         if not self.alias:
@@ -163,6 +168,7 @@ class CommunityMember(models.Model):
                     f"A community can only have one owner. {existing_owner.user.email} is already the owner."
                 )
     
+    @instrumented()
     def save(self, *args, **kwargs):
         """Override save to call clean validation"""
         self.clean()
@@ -291,6 +297,7 @@ class CommunityGroup(models.Model):
         elif self.custom_period_start_at or self.custom_period_end_at:
             raise ValidationError('custom_period_start_at/custom_period_end_at are only allowed when billing_period is custom.')
 
+    @instrumented()
     def save(self, *args, **kwargs):
         self.clean()
         super().save(*args, **kwargs)
@@ -525,6 +532,7 @@ class CommunitySocialLink(models.Model):
 
 
 @receiver(post_delete, sender=CommunityGroupAccess)
+@instrumented()
 def delete_join_requests_when_group_access_deleted(sender, instance, **kwargs):
     """Remove join-request rows for this user+tier when CommunityGroupAccess is deleted (any path)."""
     CommunityGroupJoinRequest.objects.filter(
@@ -599,6 +607,7 @@ class FeaturedCommunity(models.Model):
 
 # Signal to create default "hobby plan" when a community is created
 @receiver(post_save, sender=Community)
+@instrumented()
 def create_default_community_group(sender, instance, created, **kwargs):
     """Create a default free 'hobby plan' tier when a community is created"""
     if created:
@@ -612,6 +621,7 @@ def create_default_community_group(sender, instance, created, **kwargs):
 
 
 @receiver(post_save, sender=Community)
+@instrumented()
 def create_default_community_settings(sender, instance, created, **kwargs):
     """Create an empty CommunitySettings row when a community is created."""
     if created:
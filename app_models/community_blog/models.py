@@ -3,6 +3,7 @@ from django.utils.text import slugify
 from django.utils import timezone
 from app_models.account.models import User
 from app_models.community.models import Community
+from app_models.shared.instrumentation import instrumented
 
 
 class CommunityBlogPost(models.Model):
@@ -58,6 +59,7 @@ class CommunityBlogPost(models.Model):
     def __str__(self):
         return f"{self.title} - {self.community.name}"
 
+    @instrumented()
     def save(self, *args, **kwargs):
         if self.slug == '':
             self.slug = None
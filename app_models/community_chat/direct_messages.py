@@ -0,0 +1,83 @@
+"""
+Direct-message conversations looked up by ``Conversation.dm_key``.
+
+A two-person conversation started through ``get_or_create_dm`` stores the canonical key
+``"<community_id>:<low user id>:<high user id>"``. It is unique, so finding the DM between two
+members is one lookup on the unique index instead of intersecting
+``ConversationParticipant`` rows. Two concurrent "start chat" requests cannot create two DMs:
+the loser's insert hits the unique constraint, is rolled back to a savepoint, and it returns
+the winner's conversation.
+
+The key stops applying when the conversation stops being a two-person DM. Adding a third
+participant (saving a ``ConversationParticipant`` or ``Conversation.participants.add()``) or
+removing one clears it (``community_chat.models`` receivers), and the next
+``get_or_create_dm`` for that pair starts a fresh conversation. Group conversations never
+have a key. Participant rows written with ``bulk_create``, ``QuerySet.update`` or raw SQL
+bypass the receivers, so ``get_or_create_dm`` also checks that a keyed conversation still
+has exactly its two members before returning it; otherwise it clears the key and starts a
+fresh DM.
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+from django.db import IntegrityError, transaction
+
+from app_models.community_chat.models import Conversation, ConversationParticipant
+from app_models.shared.instrumentation import instrumented
+
+
+def dm_key(community_id: int, user_id: int, other_user_id: int) -> str:
+    if user_id == other_user_id:
+        raise ValueError('A direct-message conversation needs two different users')
+    low, high = sorted((int(user_id), int(other_user_id)))
+    return f'{int(community_id)}:{low}:{high}'
+
+
+def _user_ids(key: str) -> Tuple[int, int]:
+    _community_id, low, high = key.split(':')
+    return int(low), int(high)
+
+
+def _has_only_pair(conversation: Conversation, key: str) -> bool:
+    members = ConversationParticipant.objects.filter(conversation_id=conversation.pk).values_list('user_id', flat=True)
+    return set(members) == set(_user_ids(key))
+
+
+def find_dm(community_id: int, user_id: int, other_user_id: int) -> Optional[Conversation]:
+    return Conversation.objects.filter(dm_key=dm_key(community_id, user_id, other_user_id)).first()
+
+
+@instrumented()
+def get_or_create_dm(community_id: int, user_id: int, other_user_id: int) -> Tuple[Conversation, bool]:
+    """The direct-message conversation between two members of ``community_id``, and whether it was created."""
+    key = dm_key(community_id, user_id, other_user_id)
+    existing = Conversation.objects.filter(dm_key=key).first()
+    if existing is not None:
+        if _has_only_pair(existing, key):
+            return existing, False
+        Conversation.objects.filter(pk=existing.pk, dm_key=key).update(dm_key=None)
+    try:
+        with transaction.atomic():
+            conversation = Conversation.objects.create(community_id=community_id, dm_key=key)
+            ConversationParticipant.objects.bulk_create([
+                ConversationParticipant(conversation=conversation, user_id=uid) for uid in _user_ids(key)
+            ])
+    except IntegrityError:
+        return Conversation.objects.get(dm_key=key), False
+    return conversation, True
+
+
+def clear_dm_key(conversation_id: int, keep_user_id: Optional[int] = None) -> None:
+    """
+    Drop the key of ``conversation_id``. With ``keep_user_id`` (a participant just added), keep
+    it if that user is one of the pair, e.g. when a keyed conversation's two participant rows
+    are saved one at a time.
+    """
+    conversation = Conversation.objects.filter(pk=conversation_id, dm_key__isnull=False).only('dm_key').first()
+    if conversation is None:
+        return
+    if keep_user_id is not None and keep_user_id in _user_ids(conversation.dm_key):
+        return
+    Conversation.objects.filter(pk=conversation_id).update(dm_key=None)
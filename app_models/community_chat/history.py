@@ -0,0 +1,90 @@
+"""
+Message history paging and the denormalized ``Conversation.last_message``.
+
+``message_history(conversation_id, before=cursor)`` returns the ``MESSAGE_HISTORY_PAGE_SIZE``
+messages just before the cursor (the newest ones when there is no cursor), oldest first for
+display. Its ``next_cursor`` points further back. Each page continues strictly before the
+previous page's oldest ``(created_at, id)`` and is one backward range scan on
+``message_conv_created_idx`` (conversation, created_at, id), so a page costs the same at any
+depth of a long conversation.
+
+``Conversation.last_message`` and ``last_message_at`` are kept by the ``Message`` receivers.
+On insert, a conditional ``UPDATE`` advances them only if the new message is newer, so
+concurrent sends settle on the newest message. When the last message is deleted,
+``SET_NULL`` clears the pointer and the receiver re-points it at the newest remaining message.
+Messages written with ``bulk_create`` bypass this; set the fields with ``refresh_last_message``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+from django.db.models import OuterRef, Q, Subquery
+
+from app_models.community_chat.models import Conversation, Message
+from app_models.shared.cursors import decode_cursor, encode_cursor
+from app_models.shared.instrumentation import instrumented
+
+MESSAGE_HISTORY_PAGE_SIZE = 50
+MESSAGE_HISTORY_MAX_PAGE_SIZE = 200
+
+HISTORY_ORDERING = ('-created_at', '-id')
+
+
+@dataclass
+class MessageHistoryPage:
+    messages: List[Message]
+    next_cursor: Optional[str]
+
+
+def advance_last_message(message: Message) -> None:
+    """Point the conversation at ``message`` unless it already has a newer last message."""
+    newer = (
+        Q(last_message_at__isnull=True)
+        | Q(last_message_at__lt=message.created_at)
+        | Q(last_message_at=message.created_at) & (Q(last_message__isnull=True) | Q(last_message__lt=message.pk))
+    )
+    Conversation.objects.filter(newer, pk=message.conversation_id).update(
+        last_message=message,
+        last_message_at=message.created_at,
+    )
+
+
+def refresh_last_message(conversation_id: int, deleted: Optional[Message] = None) -> None:
+    """
+    Recompute ``last_message`` / ``last_message_at`` from the conversation's messages. After a
+    delete (``deleted``), only conversations whose pointer was cleared by it are touched.
+    """
+    newest = Message.objects.filter(conversation_id=OuterRef('pk')).order_by(*HISTORY_ORDERING)
+    conversations = Conversation.objects.filter(pk=conversation_id)
+    if deleted is not None:
+        conversations = conversations.filter(last_message__isnull=True)
+    conversations.update(
+        last_message=Subquery(newest.values('pk')[:1]),
+        last_message_at=Subquery(newest.values('created_at')[:1]),
+    )
+
+
+@instrumented()
+def message_history(
+    conversation_id: int,
+    *,
+    before: Optional[str] = None,
+    limit: int = MESSAGE_HISTORY_PAGE_SIZE,
+) -> MessageHistoryPage:
+    """
+    Up to ``limit`` messages of ``conversation_id`` older than the ``before`` cursor (newest
+    when ``None``), returned oldest first, with their senders.
+    """
+    limit = max(1, min(limit, MESSAGE_HISTORY_MAX_PAGE_SIZE))
+    qs = Message.objects.filter(conversation_id=conversation_id).select_related('sender')
+    if before is not None:
+        created_at, pk = decode_cursor(before, (datetime, int))
+        qs = qs.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk))
+    rows = list(qs.order_by(*HISTORY_ORDERING)[:limit + 1])
+    page = rows[:limit]
+    next_cursor = encode_cursor(page[-1].created_at, page[-1].pk) if len(rows) > limit else None
+    page.reverse()
+    return MessageHistoryPage(messages=page, next_cursor=next_cursor)
@@ -0,0 +1,148 @@
+"""
+Conversation inbox with unread counts from ``ConversationParticipant.last_read_at``.
+
+Reads are tracked per participant with one watermark: a message is unread for a user when
+someone else sent it after that user's ``last_read_at`` (or at any time, if they have never
+read the conversation). ``mark_read`` only moves the watermark forward, so it is a single-row
+``UPDATE`` however many messages it covers, and late or duplicate read receipts are harmless.
+``Message.is_read`` cannot express per-recipient state in group conversations and is not
+maintained here.
+
+``inbox(user)`` lists the user's conversations, most recently active first. Each
+``InboxEntry`` has its ``unread_count`` and ``last_message``, all from one query: each
+conversation gets a correlated count on ``message_conv_created_idx`` (conversation,
+created_at, id), and the denormalized ``Conversation.last_message`` is joined in
+(``community_chat.history``). Pages continue after ``next_cursor`` (``shared.cursors``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone as dt_timezone
+from typing import List, Optional, Union
+
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from app_models.community_chat.models import Conversation, ConversationParticipant, Message
+from app_models.shared.cursors import decode_cursor, encode_cursor
+from app_models.shared.instrumentation import instrumented
+
+INBOX_PAGE_SIZE = 20
+INBOX_MAX_PAGE_SIZE = 100
+
+# Watermark used for participants who have never read the conversation.
+NEVER_READ = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+@dataclass
+class InboxEntry:
+    conversation: Conversation
+    participant: ConversationParticipant
+    unread_count: int
+    last_message: Optional[Message]
+
+
+@dataclass
+class InboxPage:
+    entries: List[InboxEntry]
+    next_cursor: Optional[str]
+
+
+def _unread_messages(user_id: int):
+    """Messages of ``OuterRef('conversation_id')`` from others after ``OuterRef('read_mark')``."""
+    return Message.objects.filter(
+        conversation_id=OuterRef('conversation_id'),
+        created_at__gt=OuterRef('read_mark'),
+    ).exclude(sender_id=user_id)
+
+
+def _unread_count(user_id: int):
+    counted = (
+        _unread_messages(user_id)
+        .order_by()
+        .values('conversation_id')
+        .annotate(n=Count('pk'))
+        .values('n')
+    )
+    return Coalesce(Subquery(counted, output_field=IntegerField()), 0)
+
+
+def participations(user, community_id: Optional[int] = None):
+    """The user's ``ConversationParticipant`` rows annotated with ``read_mark`` and ``unread_count``."""
+    qs = ConversationParticipant.objects.filter(user_id=user.pk)
+    if community_id is not None:
+        qs = qs.filter(conversation__community_id=community_id)
+    return qs.annotate(
+        read_mark=Coalesce(F('last_read_at'), Value(NEVER_READ)),
+    ).annotate(unread_count=_unread_count(user.pk))
+
+
+@instrumented()
+def inbox(
+    user,
+    *,
+    community_id: Optional[int] = None,
+    after: Optional[str] = None,
+    limit: int = INBOX_PAGE_SIZE,
+) -> InboxPage:
+    """
+    One page of ``user``'s conversations (optionally in one community), newest activity
+    first: ``last_message_at``, or ``created_at`` for conversations without messages.
+    """
+    limit = max(1, min(limit, INBOX_MAX_PAGE_SIZE))
+    qs = (
+        participations(user, community_id)
+        .select_related('conversation__last_message')
+        .annotate(activity_at=Coalesce(F('conversation__last_message_at'), F('conversation__created_at')))
+    )
+    if after is not None:
+        activity_at, conversation_id = decode_cursor(after, (datetime, int))
+        qs = qs.filter(
+            Q(activity_at__lt=activity_at) | Q(activity_at=activity_at, conversation_id__lt=conversation_id)
+        )
+    rows = list(qs.order_by('-activity_at', '-conversation_id')[:limit + 1])
+
+    entries = [
+        InboxEntry(
+            conversation=participant.conversation,
+            participant=participant,
+            unread_count=participant.unread_count,
+            last_message=participant.conversation.last_message,
+        )
+        for participant in rows[:limit]
+    ]
+    next_cursor = None
+    if len(rows) > limit:
+        last = rows[limit - 1]
+        next_cursor = encode_cursor(last.activity_at, last.conversation_id)
+    return InboxPage(entries=entries, next_cursor=next_cursor)
+
+
+@instrumented()
+def total_unread(user, community_id: Optional[int] = None) -> int:
+    """Unread messages across all of ``user``'s conversations (the badge count)."""
+    return participations(user, community_id).aggregate(total=Sum('unread_count'))['total'] or 0
+
+
+@instrumented()
+def mark_read(
+    conversation: Union[Conversation, int],
+    user,
+    up_to: Union[Message, datetime, None] = None,
+) -> bool:
+    """
+    Move ``user``'s read watermark in ``conversation`` forward to ``up_to`` (a message, a
+    datetime, or now). Never moves it back. Returns True if the watermark changed.
+    """
+    conversation_id = conversation.pk if isinstance(conversation, Conversation) else conversation
+    if up_to is None:
+        up_to = timezone.now()
+    elif isinstance(up_to, Message):
+        up_to = up_to.created_at
+    return bool(
+        ConversationParticipant.objects.filter(conversation_id=conversation_id, user_id=user.pk)
+        .filter(Q(last_read_at__isnull=True) | Q(last_read_at__lt=up_to))
+        .update(last_read_at=up_to)
+    )
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community_chat', '0002_message_conversation_created_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='conversation',
+            name='last_message',
+            field=models.ForeignKey(blank=True, help_text='Newest message (maintained by signals; see community_chat.history)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='community_chat.message'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Backfill Conversation.last_message / last_message_at from existing messages
+
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+CHUNK_SIZE = 2000
+
+
+def backfill_last_message(apps, schema_editor):
+    Conversation = apps.get_model('community_chat', 'Conversation')
+    Message = apps.get_model('community_chat', 'Message')
+
+    newest = Message.objects.filter(conversation=OuterRef('pk')).order_by('-created_at', '-id')
+    last_pk = 0
+    while True:
+        pks = list(Conversation.objects.filter(pk__gt=last_pk).order_by('pk').values_list('pk', flat=True)[:CHUNK_SIZE])
+        if not pks:
+            return
+        Conversation.objects.filter(pk__in=pks).update(
+            last_message=Subquery(newest.values('pk')[:1]),
+            last_message_at=Subquery(newest.values('created_at')[:1]),
+        )
+        last_pk = pks[-1]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community_chat', '0003_conversation_last_message'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_last_message, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community_chat', '0004_backfill_conversation_last_message'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='conversation',
+            name='dm_key',
+            field=models.CharField(blank=True, help_text='"<community>:<user>:<user>" (lower id first) on direct-message conversations; see community_chat.direct_messages', max_length=64, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Backfill Conversation.dm_key on existing two-person conversations. When a pair has several
+# such conversations, the most recently active one gets the key.
+
+from django.db import migrations
+from django.db.models import Count, F
+from django.db.models.functions import Coalesce
+
+CHUNK_SIZE = 2000
+
+
+def backfill_dm_keys(apps, schema_editor):
+    Conversation = apps.get_model('community_chat', 'Conversation')
+    Participant = apps.get_model('community_chat', 'ConversationParticipant')
+
+    pairs = Conversation.objects.annotate(n=Count('conversation_participants')).filter(n=2)
+    last_pk = 0
+    while True:
+        chunk = list(
+            pairs.filter(pk__gt=last_pk)
+            .annotate(activity_at=Coalesce(F('last_message_at'), F('created_at')))
+            .order_by('pk')
+            .values('pk', 'community_id', 'activity_at')[:CHUNK_SIZE]
+        )
+        if not chunk:
+            return
+        last_pk = chunk[-1]['pk']
+        users = {}
+        for conversation_id, user_id in Participant.objects.filter(
+            conversation_id__in=[c['pk'] for c in chunk],
+        ).values_list('conversation_id', 'user_id'):
+            users.setdefault(conversation_id, []).append(user_id)
+
+        best = {}
+        for c in chunk:
+            low, high = sorted(users[c['pk']])
+            if low == high:
+                continue
+            key = f"{c['community_id']}:{low}:{high}"
+            rank = (c['activity_at'], c['pk'])
+            if key not in best or rank > best[key][0]:
+                best[key] = (rank, c['pk'])
+        for holder in Conversation.objects.filter(dm_key__in=list(best)).annotate(
+            activity_at=Coalesce(F('last_message_at'), F('created_at')),
+        ).values('pk', 'dm_key', 'activity_at'):
+            if (holder['activity_at'], holder['pk']) >= best[holder['dm_key']][0]:
+                del best[holder['dm_key']]
+            else:
+                Conversation.objects.filter(pk=holder['pk']).update(dm_key=None)
+        for key, (_rank, conversation_id) in best.items():
+            Conversation.objects.filter(pk=conversation_id).update(dm_key=key)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community_chat', '0005_conversation_dm_key'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_dm_keys, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,10 @@
 from django.db import models
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
 from app_models.account.models import User
 from app_models.community.models import Community
+from app_models.shared.counters import deleting_with
+from app_models.shared.instrumentation import instrumented
 
 
 class Conversation(models.Model):
@@ -10,6 +14,21 @@ class Conversation(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     last_message_at = models.DateTimeField(null=True, blank=True, help_text='Timestamp of the last message in this conversation')
+    last_message = models.ForeignKey(
+        'Message',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text='Newest message (maintained by signals; see community_chat.history)',
+    )
+    dm_key = models.CharField(
+        max_length=64,
+        null=True,
+        blank=True,
+        unique=True,
+        help_text='"<community>:<user>:<user>" (lower id first) on direct-message conversations; see community_chat.direct_messages',
+    )
     
     class Meta:
         db_table = 'Conversation'
@@ -61,6 +80,66 @@ class Message(models.Model):
         verbose_name = 'Message'
         verbose_name_plural = 'Messages'
         ordering = ['created_at']
+        indexes = [
+            # Unread counts after a last_read_at watermark and history pages (community_chat.inbox).
+            models.Index(fields=['conversation', 'created_at', 'id'], name='message_conv_created_idx'),
+        ]
     
     def __str__(self):
         return f"Message from {self.sender.email} in conversation {self.conversation.id}"
+
+
+# Denormalized Conversation.last_message / last_message_at (see community_chat.history)
+@receiver(post_save, sender=Message)
+@instrumented()
+def record_last_message(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        from app_models.community_chat.history import advance_last_message
+
+        advance_last_message(instance)
+
+
+@receiver(post_delete, sender=Message)
+@instrumented()
+def replace_last_message(sender, instance, origin=None, **kwargs):
+    if deleting_with(origin, (Community, Conversation)):
+        return
+    from app_models.community_chat.history import refresh_last_message
+
+    refresh_last_message(instance.conversation_id, deleted=instance)
+
+
+# Conversation.dm_key only describes two-person conversations (see community_chat.direct_messages)
+@receiver(post_save, sender=ConversationParticipant)
+@instrumented()
+def clear_dm_key_on_join(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        from app_models.community_chat.direct_messages import clear_dm_key
+
+        clear_dm_key(instance.conversation_id, keep_user_id=instance.user_id)
+
+
+@receiver(m2m_changed, sender=Conversation.participants.through)
+@instrumented()
+def clear_dm_key_on_participants_add(sender, instance, action, reverse, pk_set, **kwargs):
+    """``Conversation.participants.add()`` writes the through rows with ``bulk_create`` (no post_save)."""
+    if action != 'post_add' or not pk_set:
+        return
+    from app_models.community_chat.direct_messages import clear_dm_key
+
+    if reverse:
+        for conversation_id in pk_set:
+            clear_dm_key(conversation_id, keep_user_id=instance.pk)
+    else:
+        for user_id in pk_set:
+            clear_dm_key(instance.pk, keep_user_id=user_id)
+
+
+@receiver(post_delete, sender=ConversationParticipant)
+@instrumented()
+def clear_dm_key_on_leave(sender, instance, origin=None, **kwargs):
+    if deleting_with(origin, (Community, Conversation)):
+        return
+    from app_models.community_chat.direct_messages import clear_dm_key
+
+    clear_dm_key(instance.conversation_id)
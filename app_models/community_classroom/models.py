@@ -4,6 +4,7 @@ from django.utils import timezone
 from app_models.account.models import User
 from app_models.community.models import Community, CommunityGroup
 from app_models.shared.validators import slug_username_validator
+from app_models.shared.instrumentation import instrumented
 
 class Classroom(models.Model):
     """Classroom model for community - contains name, title, description, and banner"""
@@ -39,6 +40,7 @@ class Classroom(models.Model):
         unique_together = ['community', 'name']  # Each community can have unique classroom names
         ordering = ['-created_at']
 
+    @instrumented()
     def save(self, *args, **kwargs):
         update_fields = kwargs.get('update_fields')
         if self.is_published and self.published_at is None:
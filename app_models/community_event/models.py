@@ -5,7 +5,7 @@ from django.core.validators import MinValueValidator
 from django.db import models
 
 from app_models.account.models import User
-from app_models.app_payments.models import PaymentGateway
+from app_models.app_payments.choices import PaymentGateway
 from app_models.community.models import Community
 
 
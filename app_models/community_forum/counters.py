@@ -0,0 +1,23 @@
+"""Reconcile the denormalized Post counters (see ``app_models.shared.counters``)."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from django.db.models import QuerySet
+
+from app_models.community_forum.models import Post, PostLike
+from app_models.shared.counters import RECONCILE_BATCH_SIZE, reconcile_counters
+from app_models.shared.instrumentation import instrumented
+
+
+@instrumented()
+def reconcile_post_counters(queryset: Optional[QuerySet] = None, *, batch_size: int = RECONCILE_BATCH_SIZE) -> int:
+    """Recompute reply_count / like_count / last_reply_at for ``queryset`` (all posts by default)."""
+    return reconcile_counters(
+        Post.objects.all() if queryset is None else queryset,
+        parent_field='parent_post',
+        like_model=PostLike,
+        like_field='post',
+        batch_size=batch_size,
+    )
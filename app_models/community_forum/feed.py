@@ -0,0 +1,89 @@
+"""
+Keyset-paginated top-level forum feed.
+
+Posts are listed pinned first, then newest first, with ``id`` as the tiebreak, which matches
+``Post.Meta.ordering`` but is total. Each page continues strictly after the previous page's
+last ``(is_pinned, created_at, id)``, read through the partial index ``post_forum_feed_idx``
+(forum, -is_pinned, -created_at, -id WHERE parent_post IS NULL). A page therefore costs the
+same at any depth, and posts created while a client is paging neither shift nor repeat rows
+the way OFFSET pagination does.
+
+``forum_feed`` returns an opaque ``next_cursor`` string (``app_models.shared.cursors``) to hand
+back to the client; a malformed cursor raises ``ValidationError``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from django.db.models import Q
+
+from app_models.community_forum.models import Post
+from app_models.shared.cursors import decode_cursor, encode_cursor
+from app_models.shared.instrumentation import instrumented
+
+FORUM_FEED_PAGE_SIZE = 20
+FORUM_FEED_MAX_PAGE_SIZE = 100
+
+FEED_ORDERING = ('-is_pinned', '-created_at', '-id')
+
+FeedKey = Tuple[bool, datetime, int]
+
+
+@dataclass
+class ForumFeedPage:
+    posts: List[Post]
+    next_cursor: Optional[str]
+
+
+def feed_key(post: Post) -> FeedKey:
+    return (post.is_pinned, post.created_at, post.pk)
+
+
+def after_key(key: FeedKey) -> Q:
+    """Rows strictly after ``key`` in ``FEED_ORDERING``."""
+    is_pinned, created_at, pk = key
+    q = Q(is_pinned=is_pinned, created_at__lt=created_at) | Q(is_pinned=is_pinned, created_at=created_at, id__lt=pk)
+    if is_pinned:
+        q |= Q(is_pinned=False)
+    return q
+
+
+def top_level_posts(forum_id: int, viewer=None):
+    """
+    Top-level posts of ``forum_id`` in feed order, with author and attachments loaded and
+    ``viewer_liked`` annotated for ``viewer`` (``False`` when anonymous or not given).
+    """
+    return (
+        Post.objects.filter(forum_id=forum_id, parent_post__isnull=True)
+        .with_viewer_liked(viewer)
+        .select_related('user')
+        .prefetch_related('attachments')
+        .order_by(*FEED_ORDERING)
+    )
+
+
+@instrumented()
+def forum_feed(
+    forum_id: int,
+    *,
+    after: Optional[str] = None,
+    limit: int = FORUM_FEED_PAGE_SIZE,
+    viewer=None,
+) -> ForumFeedPage:
+    """
+    One page of top-level posts in ``forum_id``. ``after`` is the ``next_cursor`` of the previous
+    page (``None`` for the first page); ``limit`` is capped at ``FORUM_FEED_MAX_PAGE_SIZE``.
+    Each post has ``viewer_liked`` for ``viewer``.
+    """
+    limit = max(1, min(limit, FORUM_FEED_MAX_PAGE_SIZE))
+    qs = top_level_posts(forum_id, viewer)
+    if after is not None:
+        qs = qs.filter(after_key(decode_cursor(after, (bool, datetime, int))))
+    rows = list(qs[:limit + 1])
+    if len(rows) <= limit:
+        return ForumFeedPage(posts=rows, next_cursor=None)
+    posts = rows[:limit]
+    return ForumFeedPage(posts=posts, next_cursor=encode_cursor(*feed_key(posts[-1])))
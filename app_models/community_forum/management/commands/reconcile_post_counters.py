@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from app_models.community_forum.counters import reconcile_post_counters
+from app_models.community_forum.models import Post
+from app_models.shared.counters import RECONCILE_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = 'Recompute Post.reply_count, like_count and last_reply_at from replies and likes.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--forum', type=int, action='append', dest='forum_ids', help='Only this forum id (repeatable)')
+        parser.add_argument('--batch-size', type=int, default=RECONCILE_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        queryset = Post.objects.all()
+        if options['forum_ids']:
+            queryset = queryset.filter(forum_id__in=options['forum_ids'])
+        updated = reconcile_post_counters(queryset, batch_size=options['batch_size'])
+        self.stdout.write(f'Reconciled counters on {updated} posts')
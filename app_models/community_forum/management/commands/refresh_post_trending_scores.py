@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from app_models.community_forum.models import Post
+from app_models.community_forum.trending import refresh_post_trending_scores
+from app_models.shared.trending import TRENDING_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = 'Recompute Post.trending_score for recent top-level posts and clear it on older ones. Run periodically.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--forum', type=int, action='append', dest='forum_ids', help='Only this forum id (repeatable)')
+        parser.add_argument('--batch-size', type=int, default=TRENDING_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        queryset = Post.objects.all()
+        if options['forum_ids']:
+            queryset = queryset.filter(forum_id__in=options['forum_ids'])
+        scored = refresh_post_trending_scores(queryset, batch_size=options['batch_size'])
+        self.stdout.write(f'Refreshed trending scores on {scored} posts')
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:25
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community_forum', '0004_rename_payment_plans_m2m_to_community_groups'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('parent_post__isnull', True)), fields=['forum', '-is_pinned', '-created_at', '-id'], name='post_forum_feed_idx'),
+        ),
+    ]
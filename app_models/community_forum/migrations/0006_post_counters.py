@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community_forum', '0005_post_forum_feed_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='last_reply_at',
+            field=models.DateTimeField(blank=True, help_text='created_at of the newest direct reply', null=True),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='like_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of likes (maintained by signals; see shared.counters)'),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='reply_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of direct replies (maintained by signals; see shared.counters)'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community_forum', '0007_backfill_post_counters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='trending_score',
+            field=models.FloatField(default=0, help_text='Likes and replies with time decay (refreshed periodically; see shared.trending)'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('parent_post__isnull', True), ('trending_score__gt', 0)), fields=['forum', '-trending_score', '-id'], name='post_forum_trending_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community_forum', '0008_post_trending_score'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('parent_post__isnull', False)), fields=['parent_post', 'created_at', 'id'], name='post_thread_replies_idx'),
+        ),
+    ]
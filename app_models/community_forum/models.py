@@ -1,8 +1,11 @@
 from django.db import models
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from app_models.account.models import User
 from app_models.community.models import Community, CommunityGroup
+from app_models.shared import counters
+from app_models.shared.instrumentation import instrumented
+from app_models.shared.likes import ViewerLikedQuerySet
 
 class Forum(models.Model):
     """Forum model for community - each community can have multiple forums"""
@@ -32,14 +35,40 @@ class Post(models.Model):
     message = models.TextField(help_text='Post message content')
     allow_replies = models.BooleanField(default=True, help_text='If true, users can reply to this post. If false, replies are disabled.')
     is_pinned = models.BooleanField(default=False, help_text='If true, this post is pinned (shown before regular posts).')
+    reply_count = models.PositiveIntegerField(default=0, help_text='Number of direct replies (maintained by signals; see shared.counters)')
+    like_count = models.PositiveIntegerField(default=0, help_text='Number of likes (maintained by signals; see shared.counters)')
+    last_reply_at = models.DateTimeField(null=True, blank=True, help_text='created_at of the newest direct reply')
+    trending_score = models.FloatField(default=0, help_text='Likes and replies with time decay (refreshed periodically; see shared.trending)')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+    objects = ViewerLikedQuerySet.as_manager()
     
     class Meta:
         db_table = 'Post'
         verbose_name = 'Post'
         verbose_name_plural = 'Posts'
         ordering = ['-is_pinned', '-created_at']
+        indexes = [
+            # Top-level forum feed (community_forum.feed): pinned first, newest first, id tiebreak.
+            models.Index(
+                fields=['forum', '-is_pinned', '-created_at', '-id'],
+                condition=models.Q(parent_post__isnull=True),
+                name='post_forum_feed_idx',
+            ),
+            # Trending lists per forum (community_forum.trending).
+            models.Index(
+                fields=['forum', '-trending_score', '-id'],
+                condition=models.Q(parent_post__isnull=True, trending_score__gt=0),
+                name='post_forum_trending_idx',
+            ),
+            # Replies of one post, oldest first (shared.threads).
+            models.Index(
+                fields=['parent_post', 'created_at', 'id'],
+                condition=models.Q(parent_post__isnull=False),
+                name='post_thread_replies_idx',
+            ),
+        ]
     
     def __str__(self):
         return f"Post by {self.user.email} on {self.forum.name}"
@@ -83,6 +112,7 @@ class PostLike(models.Model):
 
 # Signal to automatically create a "town_hall" forum when a community is created
 @receiver(post_save, sender=Community)
+@instrumented()
 def create_town_hall_forum(sender, instance, created, **kwargs):
     """Automatically create a 'town_hall' forum when a community is created"""
     if created:
@@ -94,3 +124,38 @@ def create_town_hall_forum(sender, instance, created, **kwargs):
                 'restrict_posting_to_owners_moderators': False
             }
         )
+
+
+# Denormalized counters on Post (see app_models.shared.counters)
+@receiver(post_save, sender=Post)
+@instrumented()
+def count_post_reply(sender, instance, created, raw=False, **kwargs):
+    if created and not raw and instance.parent_post_id is not None:
+        counters.increment_reply_count(Post, instance.parent_post_id, instance.created_at)
+
+
+@receiver(post_delete, sender=Post)
+@instrumented()
+def uncount_post_reply(sender, instance, origin=None, **kwargs):
+    if instance.parent_post_id is None or counters.deleting_with(origin, (Community, Forum)):
+        return
+    if isinstance(origin, Post) and origin.pk == instance.parent_post_id:
+        return
+    counters.decrement_reply_count(Post, instance.parent_post_id, 'parent_post')
+
+
+@receiver(post_save, sender=PostLike)
+@instrumented()
+def count_post_like(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        counters.increment_like_count(Post, instance.post_id)
+
+
+@receiver(post_delete, sender=PostLike)
+@instrumented()
+def uncount_post_like(sender, instance, origin=None, **kwargs):
+    if counters.deleting_with(origin, (Community, Forum)):
+        return
+    if isinstance(origin, Post) and origin.pk == instance.post_id:
+        return
+    counters.decrement_like_count(Post, instance.post_id)
@@ -0,0 +1,41 @@
+"""Trending forum posts (see ``app_models.shared.trending``)."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Optional
+
+from django.db.models import QuerySet
+
+from app_models.community_forum.models import Post
+from app_models.shared.instrumentation import instrumented
+from app_models.shared.trending import (
+    TRENDING_BATCH_SIZE,
+    TRENDING_ORDERING,
+    TRENDING_PAGE_SIZE,
+    refresh_trending_scores,
+)
+
+
+@instrumented()
+def refresh_post_trending_scores(
+    queryset: Optional[QuerySet] = None,
+    *,
+    now: Optional[datetime] = None,
+    batch_size: int = TRENDING_BATCH_SIZE,
+) -> int:
+    """Recompute trending_score for top-level posts of ``queryset`` (all posts by default)."""
+    queryset = Post.objects.all() if queryset is None else queryset
+    return refresh_trending_scores(queryset.filter(parent_post__isnull=True), now=now, batch_size=batch_size)
+
+
+@instrumented()
+def trending_posts(forum_id: int, *, limit: int = TRENDING_PAGE_SIZE, viewer=None) -> List[Post]:
+    """Top ``limit`` trending top-level posts of ``forum_id``, via ``post_forum_trending_idx``."""
+    return list(
+        Post.objects.filter(forum_id=forum_id, parent_post__isnull=True, trending_score__gt=0)
+        .with_viewer_liked(viewer)
+        .select_related('user')
+        .prefetch_related('attachments')
+        .order_by(*TRENDING_ORDERING)[:limit]
+    )
@@ -3,6 +3,7 @@ from django.core.validators import MinValueValidator
 from django.db import models
 from app_models.community.models import Community, CommunityGroup
 from app_models.account.models import User
+from app_models.shared.instrumentation import instrumented
 
 
 class MeetingSeries(models.Model):
@@ -164,6 +165,7 @@ class MeetingSeries(models.Model):
                     {'recurrence_end_date': 'Must be empty when end type is after count.'}
                 )
 
+    @instrumented()
     def save(self, *args, **kwargs):
         self.full_clean()
         super().save(*args, **kwargs)
@@ -0,0 +1,27 @@
+"""Reconcile the denormalized PublicFeed counters (see ``app_models.shared.counters``)."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from django.db.models import QuerySet
+
+from app_models.community_publicfeeds.models import PublicFeed, PublicFeedsLike
+from app_models.shared.counters import RECONCILE_BATCH_SIZE, reconcile_counters
+from app_models.shared.instrumentation import instrumented
+
+
+@instrumented()
+def reconcile_public_feed_counters(
+    queryset: Optional[QuerySet] = None,
+    *,
+    batch_size: int = RECONCILE_BATCH_SIZE,
+) -> int:
+    """Recompute reply_count / like_count / last_reply_at for ``queryset`` (all feed items by default)."""
+    return reconcile_counters(
+        PublicFeed.objects.all() if queryset is None else queryset,
+        parent_field='parent_feed',
+        like_model=PublicFeedsLike,
+        like_field='public_feed',
+        batch_size=batch_size,
+    )
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from app_models.community_publicfeeds.counters import reconcile_public_feed_counters
+from app_models.community_publicfeeds.models import PublicFeed
+from app_models.shared.counters import RECONCILE_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = 'Recompute PublicFeed.reply_count, like_count and last_reply_at from replies and likes.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--community',
+            type=int,
+            action='append',
+            dest='community_ids',
+            help='Only this community id (repeatable)',
+        )
+        parser.add_argument('--batch-size', type=int, default=RECONCILE_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        queryset = PublicFeed.objects.all()
+        if options['community_ids']:
+            queryset = queryset.filter(community_id__in=options['community_ids'])
+        updated = reconcile_public_feed_counters(queryset, batch_size=options['batch_size'])
+        self.stdout.write(f'Reconciled counters on {updated} public feed items')
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from app_models.community_publicfeeds.models import PublicFeed
+from app_models.community_publicfeeds.trending import refresh_public_feed_trending_scores
+from app_models.shared.trending import TRENDING_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = 'Recompute PublicFeed.trending_score for recent top-level items and clear it on older ones. Run periodically.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--community',
+            type=int,
+            action='append',
+            dest='community_ids',
+            help='Only this community id (repeatable)',
+        )
+        parser.add_argument('--batch-size', type=int, default=TRENDING_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        queryset = PublicFeed.objects.all()
+        if options['community_ids']:
+            queryset = queryset.filter(community_id__in=options['community_ids'])
+        scored = refresh_public_feed_trending_scores(queryset, batch_size=options['batch_size'])
+        self.stdout.write(f'Refreshed trending scores on {scored} public feed items')
@@ -0,0 +1,37 @@
+# Backfill PublicFeed.reply_count / like_count / last_reply_at from existing replies and likes
+
+from django.db import migrations
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+CHUNK_SIZE = 2000
+
+
+def backfill_counters(apps, schema_editor):
+    Model = apps.get_model('community_publicfeeds', 'PublicFeed')
+    Like = apps.get_model('community_publicfeeds', 'PublicFeedsLike')
+
+    replies = Model.objects.filter(parent_feed=OuterRef('pk')).order_by().values('parent_feed')
+    likes = Like.objects.filter(public_feed=OuterRef('pk')).order_by().values('public_feed')
+    last_pk = 0
+    while True:
+        pks = list(Model.objects.filter(pk__gt=last_pk).order_by('pk').values_list('pk', flat=True)[:CHUNK_SIZE])
+        if not pks:
+            return
+        Model.objects.filter(pk__in=pks).update(
+            reply_count=Coalesce(Subquery(replies.annotate(n=Count('pk')).values('n')), 0),
+            like_count=Coalesce(Subquery(likes.annotate(n=Count('pk')).values('n')), 0),
+            last_reply_at=Subquery(replies.annotate(latest=Max('created_at')).values('latest')),
+        )
+        last_pk = pks[-1]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community_publicfeeds', '0003_publicfeed_counters'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
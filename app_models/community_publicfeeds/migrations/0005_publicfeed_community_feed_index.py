@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:33
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0030_community_bunny_collection_id'),
+        ('community_publicfeeds', '0004_backfill_publicfeed_counters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='publicfeed',
+            index=models.Index(condition=models.Q(('parent_feed__isnull', True)), fields=['community', '-created_at', '-id'], name='publicfeeds_comm_feed_idx'),
+        ),
+    ]
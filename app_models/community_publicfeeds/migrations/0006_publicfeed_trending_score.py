@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0030_community_bunny_collection_id'),
+        ('community_publicfeeds', '0005_publicfeed_community_feed_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='publicfeed',
+            name='trending_score',
+            field=models.FloatField(default=0, help_text='Likes and replies with time decay (refreshed periodically; see shared.trending)'),
+        ),
+        migrations.AddIndex(
+            model_name='publicfeed',
+            index=models.Index(condition=models.Q(('parent_feed__isnull', True), ('trending_score__gt', 0)), fields=['community', '-trending_score', '-id'], name='publicfeeds_comm_trend_idx'),
+        ),
+    ]
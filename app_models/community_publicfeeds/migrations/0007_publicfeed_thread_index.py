@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community_publicfeeds', '0006_publicfeed_trending_score'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='publicfeed',
+            index=models.Index(condition=models.Q(('parent_feed__isnull', False)), fields=['parent_feed', 'created_at', 'id'], name='publicfeeds_thread_idx'),
+        ),
+    ]
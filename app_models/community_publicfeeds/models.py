@@ -1,6 +1,11 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from app_models.account.models import User
-from app_models.community.models import Community
+from app_models.community.models import Community, CommunityMember
+from app_models.shared import counters
+from app_models.shared.instrumentation import instrumented
+from app_models.shared.likes import ViewerLikedQuerySet
 
 
 class PublicFeed(models.Model):
@@ -33,9 +38,28 @@ class PublicFeed(models.Model):
         default=True,
         help_text='If true, users can reply to this feed. If false, replies are disabled.',
     )
+    reply_count = models.PositiveIntegerField(
+        default=0,
+        help_text='Number of direct replies (maintained by signals; see shared.counters)',
+    )
+    like_count = models.PositiveIntegerField(
+        default=0,
+        help_text='Number of likes (maintained by signals; see shared.counters)',
+    )
+    last_reply_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text='created_at of the newest direct reply',
+    )
+    trending_score = models.FloatField(
+        default=0,
+        help_text='Likes and replies with time decay (refreshed periodically; see shared.trending)',
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ViewerLikedQuerySet.as_manager()
+
     class Meta:
         db_table = 'PublicFeeds'
         verbose_name = 'Public Feed'
@@ -47,6 +71,24 @@ class PublicFeed(models.Model):
                 name='publicfeeds_top_created_idx',
                 condition=models.Q(parent_feed__isnull=True),
             ),
+            # Keyset pages of one or more communities' top-level items (community_publicfeeds.timeline).
+            models.Index(
+                fields=['community', '-created_at', '-id'],
+                name='publicfeeds_comm_feed_idx',
+                condition=models.Q(parent_feed__isnull=True),
+            ),
+            # Trending lists per community (community_publicfeeds.trending).
+            models.Index(
+                fields=['community', '-trending_score', '-id'],
+                name='publicfeeds_comm_trend_idx',
+                condition=models.Q(parent_feed__isnull=True, trending_score__gt=0),
+            ),
+            # Replies of one item, oldest first (shared.threads).
+            models.Index(
+                fields=['parent_feed', 'created_at', 'id'],
+                name='publicfeeds_thread_idx',
+                condition=models.Q(parent_feed__isnull=False),
+            ),
         ]
 
     def __str__(self):
@@ -106,3 +148,52 @@ class PublicFeedsLike(models.Model):
 
     def __str__(self):
         return f"{self.user.email} liked public feed {self.public_feed.id}"
+
+
+# Denormalized counters on PublicFeed (see app_models.shared.counters)
+@receiver(post_save, sender=PublicFeed)
+@instrumented()
+def count_public_feed_reply(sender, instance, created, raw=False, **kwargs):
+    if created and not raw and instance.parent_feed_id is not None:
+        counters.increment_reply_count(PublicFeed, instance.parent_feed_id, instance.created_at)
+
+
+@receiver(post_delete, sender=PublicFeed)
+@instrumented()
+def uncount_public_feed_reply(sender, instance, origin=None, **kwargs):
+    if instance.parent_feed_id is None or counters.deleting_with(origin, (Community,)):
+        return
+    if isinstance(origin, PublicFeed) and origin.pk == instance.parent_feed_id:
+        return
+    counters.decrement_reply_count(PublicFeed, instance.parent_feed_id, 'parent_feed')
+
+
+@receiver(post_save, sender=PublicFeedsLike)
+@instrumented()
+def count_public_feed_like(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        counters.increment_like_count(PublicFeed, instance.public_feed_id)
+
+
+@receiver(post_delete, sender=PublicFeedsLike)
+@instrumented()
+def uncount_public_feed_like(sender, instance, origin=None, **kwargs):
+    if counters.deleting_with(origin, (Community,)):
+        return
+    if isinstance(origin, PublicFeed) and origin.pk == instance.public_feed_id:
+        return
+    counters.decrement_like_count(PublicFeed, instance.public_feed_id)
+
+
+@receiver(post_save, sender=CommunityMember)
+@receiver(post_delete, sender=CommunityMember)
+@instrumented()
+def invalidate_home_timeline(sender, instance, using, **kwargs):
+    """
+    Joining, leaving, approval or blocking changes which communities the member's home timeline
+    reads. The cached first page is dropped once the change commits.
+    """
+    from app_models.community_publicfeeds.timeline import invalidate_home_timeline_cache
+
+    user_id = instance.user_id
+    transaction.on_commit(lambda: invalidate_home_timeline_cache(user_id), using=using)
@@ -0,0 +1,179 @@
+"""
+Keyset-paginated public feed timelines across several communities.
+
+``community_timeline(community_ids)`` lists the top-level items of the given communities
+(every community when ``None``), newest first with ``id`` as the tiebreak. Each page continues
+strictly after the previous page's last ``(created_at, id)``. A page of ``limit`` items needs
+at most ``limit + 1`` items from any one community, so the query reads each community's newest
+``limit + 1`` ids after the cursor with its own ``ORDER BY ... LIMIT`` subquery (one range scan
+on the partial index ``publicfeeds_comm_feed_idx``: community, -created_at, -id WHERE
+parent_feed IS NULL), joins those subqueries with ``UNION ALL``, and orders only that union.
+The cost is bounded by communities x page size, however much history each community has.
+The global timeline uses ``publicfeeds_top_created_idx``.
+
+``home_timeline(user)`` is the timeline of the communities the user has joined: memberships
+that are neither ``applicant`` nor blocked. The first page is the one most clients request
+on every open, so its ids and ``next_cursor`` are cached per user in the Django cache
+(``HOME_TIMELINE_CACHE_ALIAS``) for ``HOME_TIMELINE_CACHE_TTL_SECONDS``. A cached page costs
+one query for the rows. ``CommunityMember`` receivers delete the entry once a membership
+change commits, so with a shared cache backend (e.g. Redis) every service sees it at once;
+with a per-process backend other processes see it within one TTL. New items appear after
+one TTL. Rows are always read fresh, so counters and deletions are current.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+from django.core.cache import caches
+from django.db import connections, router
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from app_models.community.models import CommunityMember
+from app_models.community_publicfeeds.models import PublicFeed
+from app_models.shared.cursors import decode_cursor, encode_cursor
+from app_models.shared.instrumentation import instrumented
+
+TIMELINE_PAGE_SIZE = 20
+TIMELINE_MAX_PAGE_SIZE = 100
+HOME_TIMELINE_CACHE_ALIAS = 'default'
+HOME_TIMELINE_CACHE_TTL_SECONDS = 30
+
+TIMELINE_ORDERING = ('-created_at', '-id')
+
+TimelineKey = Tuple[datetime, int]
+
+
+@dataclass
+class TimelinePage:
+    items: List[PublicFeed]
+    next_cursor: Optional[str]
+
+
+def timeline_key(item: PublicFeed) -> TimelineKey:
+    return (item.created_at, item.pk)
+
+
+def after_key(key: TimelineKey) -> Q:
+    """Rows strictly after ``key`` in ``TIMELINE_ORDERING``."""
+    created_at, pk = key
+    return Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+
+
+def _cache():
+    return caches[HOME_TIMELINE_CACHE_ALIAS]
+
+
+def _home_cache_key(user_id: int) -> str:
+    """Holds (page ids, next_cursor) of the user's first home timeline page at TIMELINE_PAGE_SIZE."""
+    return f'publicfeeds:home_timeline:{user_id}'
+
+
+def invalidate_home_timeline_cache(user_id: int) -> None:
+    _cache().delete(_home_cache_key(user_id))
+
+
+def joined_community_ids(user_id: int) -> List[int]:
+    return list(
+        CommunityMember.objects.filter(user_id=user_id, is_blocked=False)
+        .exclude(role='applicant')
+        .values_list('community_id', flat=True)
+    )
+
+
+def _timeline_items(viewer=None):
+    return (
+        PublicFeed.objects.filter(parent_feed__isnull=True)
+        .with_viewer_liked(viewer)
+        .select_related('community', 'posted_by')
+        .prefetch_related('attachments')
+    )
+
+
+def _newest_ids_sql(community_ids: List[int], after: Optional[TimelineKey], per_community: int) -> RawSQL:
+    """
+    ``UNION ALL`` of each community's newest ``per_community`` top-level ids after ``after``.
+    Each branch is wrapped in a derived table so SQLite accepts ``ORDER BY ... LIMIT`` in it.
+    """
+    connection = connections[router.db_for_read(PublicFeed)]
+    qn = connection.ops.quote_name
+    meta = PublicFeed._meta
+    table = qn(meta.db_table)
+    pk = qn(meta.pk.column)
+    community = qn(meta.get_field('community').column)
+    parent = qn(meta.get_field('parent_feed').column)
+    created = qn(meta.get_field('created_at').column)
+
+    keyset, keyset_params = '', []
+    if after is not None:
+        created_at, after_pk = after
+        created_at = connection.ops.adapt_datetimefield_value(created_at)
+        keyset = f'AND ({created} < %s OR ({created} = %s AND {pk} < %s)) '
+        keyset_params = [created_at, created_at, after_pk]
+
+    branches, params = [], []
+    for n, community_id in enumerate(community_ids):
+        branches.append(
+            f'SELECT c{n}.id FROM (SELECT {pk} AS id FROM {table} '
+            f'WHERE {community} = %s AND {parent} IS NULL {keyset}'
+            f'ORDER BY {created} DESC, {pk} DESC LIMIT %s) c{n}'
+        )
+        params += [community_id, *keyset_params, per_community]
+    return RawSQL(' UNION ALL '.join(branches), params)
+
+
+@instrumented()
+def community_timeline(
+    community_ids: Optional[Iterable[int]],
+    *,
+    after: Optional[str] = None,
+    limit: int = TIMELINE_PAGE_SIZE,
+    viewer=None,
+) -> TimelinePage:
+    """
+    One page of top-level items of ``community_ids`` (all communities when ``None``).
+    ``after`` is the ``next_cursor`` of the previous page; ``limit`` is capped at
+    ``TIMELINE_MAX_PAGE_SIZE``. Each item has ``viewer_liked`` for ``viewer``.
+    """
+    limit = max(1, min(limit, TIMELINE_MAX_PAGE_SIZE))
+    key = decode_cursor(after, (datetime, int)) if after is not None else None
+    qs = _timeline_items(viewer)
+    if community_ids is not None:
+        community_ids = list(dict.fromkeys(community_ids))
+        if not community_ids:
+            return TimelinePage(items=[], next_cursor=None)
+        qs = qs.filter(pk__in=_newest_ids_sql(community_ids, key, limit + 1))
+    elif key is not None:
+        qs = qs.filter(after_key(key))
+    rows = list(qs.order_by(*TIMELINE_ORDERING)[:limit + 1])
+    if len(rows) <= limit:
+        return TimelinePage(items=rows, next_cursor=None)
+    items = rows[:limit]
+    return TimelinePage(items=items, next_cursor=encode_cursor(*timeline_key(items[-1])))
+
+
+@instrumented()
+def home_timeline(user, *, after: Optional[str] = None, limit: int = TIMELINE_PAGE_SIZE) -> TimelinePage:
+    """
+    One page of the timeline of ``user``'s joined communities, with ``viewer_liked`` set.
+    The first page at the default size is served from the per-user snapshot when cached.
+    """
+    user_id = user.pk
+    if after is not None or limit != TIMELINE_PAGE_SIZE:
+        return community_timeline(joined_community_ids(user_id), after=after, limit=limit, viewer=user)
+
+    cache_key = _home_cache_key(user_id)
+    cached = _cache().get(cache_key)
+    if cached is None:
+        page = community_timeline(joined_community_ids(user_id), limit=limit, viewer=user)
+        _cache().set(cache_key, ([item.pk for item in page.items], page.next_cursor), HOME_TIMELINE_CACHE_TTL_SECONDS)
+        return page
+
+    ids, next_cursor = cached
+    if not ids:
+        return TimelinePage(items=[], next_cursor=None)
+    by_id = _timeline_items(user).in_bulk(ids)
+    return TimelinePage(items=[by_id[pk] for pk in ids if pk in by_id], next_cursor=next_cursor)
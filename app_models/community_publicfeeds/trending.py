@@ -0,0 +1,49 @@
+"""Trending public feed items (see ``app_models.shared.trending``)."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Iterable, List, Optional
+
+from django.db.models import QuerySet
+
+from app_models.community_publicfeeds.models import PublicFeed
+from app_models.shared.instrumentation import instrumented
+from app_models.shared.trending import (
+    TRENDING_BATCH_SIZE,
+    TRENDING_ORDERING,
+    TRENDING_PAGE_SIZE,
+    refresh_trending_scores,
+)
+
+
+@instrumented()
+def refresh_public_feed_trending_scores(
+    queryset: Optional[QuerySet] = None,
+    *,
+    now: Optional[datetime] = None,
+    batch_size: int = TRENDING_BATCH_SIZE,
+) -> int:
+    """Recompute trending_score for top-level items of ``queryset`` (all items by default)."""
+    queryset = PublicFeed.objects.all() if queryset is None else queryset
+    return refresh_trending_scores(queryset.filter(parent_feed__isnull=True), now=now, batch_size=batch_size)
+
+
+@instrumented()
+def trending_public_feeds(
+    community_ids: Iterable[int],
+    *,
+    limit: int = TRENDING_PAGE_SIZE,
+    viewer=None,
+) -> List[PublicFeed]:
+    """Top ``limit`` trending top-level items across ``community_ids``, via ``publicfeeds_comm_trend_idx``."""
+    community_ids = list(community_ids)
+    if not community_ids:
+        return []
+    return list(
+        PublicFeed.objects.filter(community_id__in=community_ids, parent_feed__isnull=True, trending_score__gt=0)
+        .with_viewer_liked(viewer)
+        .select_related('community', 'posted_by')
+        .prefetch_related('attachments')
+        .order_by(*TRENDING_ORDERING)[:limit]
+    )
@@ -1,6 +1,7 @@
 from django.db import models
 from app_models.community.models import Community, CommunityGroup
 from app_models.account.models import User
+from app_models.shared.instrumentation import instrumented
 
 
 class SimpleQuiz(models.Model):
@@ -39,6 +40,7 @@ class SimpleQuiz(models.Model):
         if self.max_attempts == 0:
             self.has_attempt_limit = False
 
+    @instrumented()
     def save(self, *args, **kwargs):
         self.clean()
         super().save(*args, **kwargs)
@@ -0,0 +1 @@
+# Community Search – full-text search documents over forum posts, public feeds, blog posts, lessons and resources
@@ -0,0 +1,247 @@
+"""
+Keeping ``SearchDocument`` in step with the searchable content.
+
+Each ``SearchSource`` maps one content model to a document: the community it belongs to, the
+fields indexed as title (weight A) and body (weight B), and an optional condition the row must
+meet to be searchable (published blog posts, active resource files). ``index_objects`` upserts
+the documents of a batch of rows and drops the documents of rows that are no longer
+searchable. ``remove_objects`` drops them on delete. Receivers in ``community_search.models``
+call both on every save/delete of a source model. ``bulk_create``, ``QuerySet.update`` and raw
+SQL bypass them, so run ``rebuild_index`` (``manage.py rebuild_search_index``) afterwards.
+
+The full-text side depends on the database:
+
+* PostgreSQL: ``search_vector`` is set in the same batch with one ``UPDATE``
+  (``setweight(to_tsvector(SEARCH_CONFIG, title), 'A') || ...``). Migration 0002 adds the GIN
+  index ``searchdoc_vector_gin`` on it.
+* SQLite, for tests and local runs: documents are mirrored into the FTS5 table
+  ``SearchDocumentFTS`` (rowid = document id). The table is created on first use, so it also
+  exists in test databases built without migrations.
+* Anything else: only the documents are kept, and ``search`` falls back to ``icontains``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+from django.apps import apps
+from django.contrib.postgres.search import SearchVector
+from django.db import connections, models, router, transaction
+from django.db.models import F, Q, Subquery
+
+from app_models.community_search.models import SearchDocument
+from app_models.shared.instrumentation import instrumented
+
+SEARCH_CONFIG = 'english'
+FTS_TABLE = 'SearchDocumentFTS'
+REBUILD_BATCH_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class SearchSource:
+    kind: str
+    model_label: str
+    community_path: str
+    title_fields: Tuple[str, ...]
+    body_fields: Tuple[str, ...]
+    searchable: Optional[Q] = None
+
+    @property
+    def model(self) -> Type[models.Model]:
+        return apps.get_model(self.model_label)
+
+
+SEARCH_SOURCES: Tuple[SearchSource, ...] = (
+    SearchSource(SearchDocument.KIND_POST, 'community_forum.Post', 'forum__community_id', (), ('message',)),
+    SearchSource(SearchDocument.KIND_PUBLIC_FEED, 'community_publicfeeds.PublicFeed', 'community_id', (), ('message',)),
+    SearchSource(
+        SearchDocument.KIND_BLOG_POST,
+        'community_blog.CommunityBlogPost',
+        'community_id',
+        ('title',),
+        ('description', 'blog_message'),
+        Q(is_published=True),
+    ),
+    SearchSource(
+        SearchDocument.KIND_LESSON,
+        'community_classroom_content.LessonDefinition',
+        'community_id',
+        ('title',),
+        ('description', 'notes'),
+    ),
+    SearchSource(
+        SearchDocument.KIND_RESOURCE,
+        'community_resource.ResourceContent',
+        'resource__community_id',
+        ('title',),
+        ('description',),
+        Q(is_active=True),
+    ),
+)
+
+SOURCES_BY_KIND: Dict[str, SearchSource] = {source.kind: source for source in SEARCH_SOURCES}
+_SOURCES_BY_LABEL: Dict[str, SearchSource] = {source.model_label: source for source in SEARCH_SOURCES}
+
+
+def source_for(model: Type[models.Model]) -> SearchSource:
+    try:
+        return _SOURCES_BY_LABEL[model._meta.label]
+    except KeyError:
+        raise ValueError(f'{model._meta.label} is not a community_search source') from None
+
+
+def _join(values: Dict[str, Optional[str]], fields: Sequence[str]) -> str:
+    return '\n'.join(values[f] for f in fields if values[f])
+
+
+def _connection():
+    return connections[router.db_for_write(SearchDocument)]
+
+
+def ensure_sqlite_fts(connection) -> None:
+    """Create the FTS5 mirror table on SQLite connections that do not have it yet."""
+    connection.ensure_connection()
+    if getattr(connection, '_community_search_fts', None) == id(connection.connection):
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS {connection.ops.quote_name(FTS_TABLE)} '
+            f"USING fts5(title, body, tokenize='porter unicode61')"
+        )
+    connection._community_search_fts = id(connection.connection)
+
+
+def _sync_sqlite_fts(connection, kind: str, object_ids: Sequence[int]) -> None:
+    ensure_sqlite_fts(connection)
+    fts = connection.ops.quote_name(FTS_TABLE)
+    docs = list(SearchDocument.objects.filter(kind=kind, object_id__in=object_ids).values_list('id', 'title', 'body'))
+    if not docs:
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {fts} WHERE rowid IN ({", ".join(["%s"] * len(docs))})', [d[0] for d in docs])
+        cursor.executemany(f'INSERT INTO {fts} (rowid, title, body) VALUES (%s, %s, %s)', docs)
+
+
+def _delete_documents(connection, kind: str, object_ids: Sequence[int]) -> None:
+    docs = SearchDocument.objects.filter(kind=kind, object_id__in=object_ids)
+    if connection.vendor == 'sqlite':
+        ensure_sqlite_fts(connection)
+        doc_ids = list(docs.values_list('id', flat=True))
+        if not doc_ids:
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'DELETE FROM {connection.ops.quote_name(FTS_TABLE)} WHERE rowid IN ({", ".join(["%s"] * len(doc_ids))})',
+                doc_ids,
+            )
+        docs = SearchDocument.objects.filter(id__in=doc_ids)
+    docs.delete()
+
+
+@instrumented()
+def index_objects(model: Type[models.Model], pks: Iterable[int]) -> int:
+    """
+    Upsert the documents of the ``model`` rows ``pks`` and drop those of rows that are gone or
+    not searchable. Returns the number of documents written.
+    """
+    source = source_for(model)
+    pks = list(pks)
+    if not pks:
+        return 0
+    rows = model.objects.filter(pk__in=pks)
+    if source.searchable is not None:
+        rows = rows.filter(source.searchable)
+    values = rows.values('pk', 'created_at', *source.title_fields, *source.body_fields, search_community_id=F(source.community_path))
+    docs = [
+        SearchDocument(
+            community_id=row['search_community_id'],
+            kind=source.kind,
+            object_id=row['pk'],
+            title=_join(row, source.title_fields),
+            body=_join(row, source.body_fields),
+            created_at=row['created_at'],
+        )
+        for row in values
+    ]
+    indexed = [doc.object_id for doc in docs]
+    connection = _connection()
+    with transaction.atomic(using=connection.alias):
+        stale = sorted(set(pks) - set(indexed))
+        if stale:
+            _delete_documents(connection, source.kind, stale)
+        if not docs:
+            return 0
+        SearchDocument.objects.bulk_create(
+            docs,
+            update_conflicts=True,
+            unique_fields=['kind', 'object_id'],
+            update_fields=['community', 'title', 'body', 'created_at', 'indexed_at'],
+        )
+        if connection.vendor == 'postgresql':
+            SearchDocument.objects.filter(kind=source.kind, object_id__in=indexed).update(
+                search_vector=(
+                    SearchVector('title', weight='A', config=SEARCH_CONFIG)
+                    + SearchVector('body', weight='B', config=SEARCH_CONFIG)
+                ),
+            )
+        elif connection.vendor == 'sqlite':
+            _sync_sqlite_fts(connection, source.kind, indexed)
+    return len(docs)
+
+
+@instrumented()
+def remove_objects(model: Type[models.Model], pks: Iterable[int]) -> None:
+    pks = list(pks)
+    if pks:
+        connection = _connection()
+        with transaction.atomic(using=connection.alias):
+            _delete_documents(connection, source_for(model).kind, pks)
+
+
+def purge_orphan_fts() -> None:
+    """Drop FTS5 rows whose document is gone (e.g. deleted with its community). SQLite only."""
+    connection = _connection()
+    if connection.vendor != 'sqlite':
+        return
+    ensure_sqlite_fts(connection)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {connection.ops.quote_name(FTS_TABLE)} '
+            f'WHERE rowid NOT IN (SELECT id FROM {connection.ops.quote_name(SearchDocument._meta.db_table)})'
+        )
+
+
+@instrumented()
+def rebuild_index(
+    kinds: Optional[Iterable[str]] = None,
+    *,
+    community_id: Optional[int] = None,
+    batch_size: int = REBUILD_BATCH_SIZE,
+) -> int:
+    """
+    Re-index every source row of ``kinds`` (all kinds by default), optionally in one community,
+    in primary-key batches, and drop documents whose source row no longer exists. Returns the
+    number of documents written.
+    """
+    sources: List[SearchSource] = [SOURCES_BY_KIND[k] for k in kinds] if kinds else list(SEARCH_SOURCES)
+    written = 0
+    for source in sources:
+        model = source.model
+        rows = model.objects.all()
+        docs = SearchDocument.objects.filter(kind=source.kind)
+        if community_id is not None:
+            rows = rows.filter(**{source.community_path: community_id})
+            docs = docs.filter(community_id=community_id)
+        orphans = list(docs.exclude(object_id__in=Subquery(model.objects.values('pk'))).values_list('object_id', flat=True))
+        if orphans:
+            remove_objects(model, orphans)
+        last_pk = 0
+        while True:
+            pks = list(rows.filter(pk__gt=last_pk).order_by('pk').values_list('pk', flat=True)[:batch_size])
+            if not pks:
+                break
+            written += index_objects(model, pks)
+            last_pk = pks[-1]
+    purge_orphan_fts()
+    return written
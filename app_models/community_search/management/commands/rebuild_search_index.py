@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from app_models.community_search.indexing import REBUILD_BATCH_SIZE, SOURCES_BY_KIND, rebuild_index
+
+
+class Command(BaseCommand):
+    help = 'Re-index searchable content into SearchDocument and drop documents of deleted rows.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--kind',
+            action='append',
+            dest='kinds',
+            choices=sorted(SOURCES_BY_KIND),
+            help='Only this content kind (repeatable)',
+        )
+        parser.add_argument('--community', type=int, dest='community_id', help='Only this community id')
+        parser.add_argument('--batch-size', type=int, default=REBUILD_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        written = rebuild_index(options['kinds'], community_id=options['community_id'], batch_size=options['batch_size'])
+        self.stdout.write(f'Indexed {written} search documents')
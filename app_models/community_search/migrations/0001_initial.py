@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:37
+
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('community', '0030_community_bunny_collection_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('post', 'Forum post'), ('public_feed', 'Public feed item'), ('blog_post', 'Blog post'), ('lesson', 'Lesson'), ('resource', 'Resource content')], help_text='Type of the source content', max_length=20)),
+                ('object_id', models.BigIntegerField(help_text='Primary key of the source row')),
+                ('title', models.TextField(blank=True, default='', help_text='Indexed title (weight A)')),
+                ('body', models.TextField(blank=True, default='', help_text='Indexed body text (weight B)')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(editable=False, help_text='tsvector of title + body (PostgreSQL only)', null=True)),
+                ('created_at', models.DateTimeField(help_text='created_at of the source row')),
+                ('indexed_at', models.DateTimeField(auto_now=True)),
+                ('community', models.ForeignKey(help_text='Community the source content belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='search_documents', to='community.community')),
+            ],
+            options={
+                'verbose_name': 'Search Document',
+                'verbose_name_plural': 'Search Documents',
+                'db_table': 'SearchDocument',
+                'indexes': [models.Index(fields=['community', 'kind'], name='searchdoc_comm_kind_idx')],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='searchdoc_kind_object_uniq')],
+            },
+        ),
+    ]
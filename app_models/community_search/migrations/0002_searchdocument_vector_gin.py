@@ -0,0 +1,29 @@
+# GIN index on SearchDocument.search_vector. PostgreSQL only: SQLite uses the FTS5 mirror
+# table that community_search.indexing creates on first use.
+
+from django.db import migrations
+
+INDEX_NAME = 'searchdoc_vector_gin'
+
+
+def create_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON "SearchDocument" USING gin (search_vector)')
+
+
+def drop_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS {INDEX_NAME}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community_search', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_gin_index, drop_gin_index),
+    ]
@@ -0,0 +1,94 @@
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+from django.db.models.signals import post_delete, post_save
+
+from app_models.community.models import Community
+from app_models.shared.instrumentation import instrumented
+
+
+class SearchDocument(models.Model):
+    """
+    Full-text search entry for one piece of community content (see community_search.indexing).
+    Kept in step with the source row by signals; search_vector is written by the indexer on PostgreSQL.
+    """
+    KIND_POST = 'post'
+    KIND_PUBLIC_FEED = 'public_feed'
+    KIND_BLOG_POST = 'blog_post'
+    KIND_LESSON = 'lesson'
+    KIND_RESOURCE = 'resource'
+    KIND_CHOICES = [
+        (KIND_POST, 'Forum post'),
+        (KIND_PUBLIC_FEED, 'Public feed item'),
+        (KIND_BLOG_POST, 'Blog post'),
+        (KIND_LESSON, 'Lesson'),
+        (KIND_RESOURCE, 'Resource content'),
+    ]
+
+    community = models.ForeignKey(
+        Community,
+        on_delete=models.CASCADE,
+        related_name='search_documents',
+        help_text='Community the source content belongs to',
+    )
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, help_text='Type of the source content')
+    object_id = models.BigIntegerField(help_text='Primary key of the source row')
+    title = models.TextField(blank=True, default='', help_text='Indexed title (weight A)')
+    body = models.TextField(blank=True, default='', help_text='Indexed body text (weight B)')
+    search_vector = SearchVectorField(null=True, editable=False, help_text='tsvector of title + body (PostgreSQL only)')
+    created_at = models.DateTimeField(help_text='created_at of the source row')
+    indexed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'SearchDocument'
+        verbose_name = 'Search Document'
+        verbose_name_plural = 'Search Documents'
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'object_id'], name='searchdoc_kind_object_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['community', 'kind'], name='searchdoc_comm_kind_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.kind}#{self.object_id} in community {self.community_id}'
+
+
+_SEARCH_SENDERS = (
+    'community_forum.Post',
+    'community_publicfeeds.PublicFeed',
+    'community_blog.CommunityBlogPost',
+    'community_classroom_content.LessonDefinition',
+    'community_resource.ResourceContent',
+)
+
+
+@instrumented()
+def index_search_document(sender, instance, raw=False, **kwargs):
+    """Re-index the saved row (or drop its document when it is no longer searchable)."""
+    if raw:
+        return
+    from app_models.community_search.indexing import index_objects
+
+    index_objects(sender, [instance.pk])
+
+
+@instrumented()
+def remove_search_document(sender, instance, origin=None, **kwargs):
+    if isinstance(origin, Community):
+        return  # the documents cascade with the community
+    from app_models.community_search.indexing import remove_objects
+
+    remove_objects(sender, [instance.pk])
+
+
+for _sender in _SEARCH_SENDERS:
+    post_save.connect(
+        index_search_document,
+        sender=_sender,
+        dispatch_uid=f'community_search.document_saved:{_sender}',
+    )
+    post_delete.connect(
+        remove_search_document,
+        sender=_sender,
+        dispatch_uid=f'community_search.document_deleted:{_sender}',
+    )
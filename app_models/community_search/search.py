@@ -0,0 +1,142 @@
+"""
+Ranked full-text search across a community's content.
+
+    hits = search(community_id, 'sourdough starter', types=['post', 'blog_post'], limit=20)
+
+One query returns the best ``limit`` documents of the community across the requested kinds
+(``SearchDocument.KIND_*``, all kinds by default). On PostgreSQL it matches
+``websearch_to_tsquery`` against the GIN-indexed ``search_vector`` and ranks with
+``ts_rank``, where title matches weigh more than body matches. On SQLite it matches the FTS5
+mirror and ranks with ``bm25``. Other databases fall back to ``icontains`` ordered by recency.
+With ``load=True`` (the default) each hit's source object is fetched with one ``in_bulk`` per
+kind present, and hits whose source row has disappeared are dropped.
+
+Access control (community groups, tiers, membership) is the caller's job: filter ``hits``
+the same way the corresponding list endpoints do.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connections, models, router
+from django.db.models import F, Q
+
+from app_models.community_search.indexing import FTS_TABLE, SEARCH_CONFIG, SOURCES_BY_KIND, ensure_sqlite_fts
+from app_models.community_search.models import SearchDocument
+from app_models.shared.instrumentation import instrumented
+
+SEARCH_PAGE_SIZE = 20
+SEARCH_MAX_PAGE_SIZE = 100
+
+_WORD = re.compile(r'\w+', re.UNICODE)
+
+
+@dataclass
+class SearchHit:
+    kind: str
+    object_id: int
+    title: str
+    rank: float
+    created_at: datetime
+    obj: Optional[models.Model] = None
+
+
+def _kinds(types: Optional[Iterable[str]]) -> List[str]:
+    if types is None:
+        return list(SOURCES_BY_KIND)
+    kinds = list(dict.fromkeys(types))
+    unknown = [k for k in kinds if k not in SOURCES_BY_KIND]
+    if unknown:
+        raise ValueError(f'Unknown search types {unknown}; expected some of {sorted(SOURCES_BY_KIND)}')
+    return kinds
+
+
+def _fts5_query(query: str) -> str:
+    """Every word must match; each word is quoted so FTS5 operators in user input are literal."""
+    return ' '.join(f'"{word}"' for word in _WORD.findall(query))
+
+
+def _postgres_hits(community_id: int, query: str, kinds: List[str], limit: int) -> List[SearchHit]:
+    tsquery = SearchQuery(query, config=SEARCH_CONFIG, search_type='websearch')
+    rows = (
+        SearchDocument.objects.filter(community_id=community_id, kind__in=kinds, search_vector=tsquery)
+        .annotate(rank=SearchRank(F('search_vector'), tsquery))
+        .order_by('-rank', '-created_at', '-id')
+        .values_list('kind', 'object_id', 'title', 'rank', 'created_at')[:limit]
+    )
+    return [SearchHit(*row) for row in rows]
+
+
+def _sqlite_hits(connection, community_id: int, query: str, kinds: List[str], limit: int) -> List[SearchHit]:
+    match = _fts5_query(query)
+    if not match:
+        return []
+    ensure_sqlite_fts(connection)
+    qn = connection.ops.quote_name
+    fts = qn(FTS_TABLE)
+    docs = SearchDocument.objects.raw(
+        f'SELECT d.id, d.kind, d.object_id, d.title, d.created_at, -bm25({fts}, 2.0, 1.0) AS rank '
+        f'FROM {fts} JOIN {qn(SearchDocument._meta.db_table)} d ON d.id = {fts}.rowid '
+        f'WHERE {fts} MATCH %s AND d.community_id = %s AND d.kind IN ({", ".join(["%s"] * len(kinds))}) '
+        f'ORDER BY rank DESC, d.created_at DESC, d.id DESC LIMIT %s',
+        [match, community_id, *kinds, limit],
+    )
+    return [SearchHit(d.kind, d.object_id, d.title, d.rank, d.created_at) for d in docs]
+
+
+def _fallback_hits(community_id: int, query: str, kinds: List[str], limit: int) -> List[SearchHit]:
+    words = _WORD.findall(query)
+    if not words:
+        return []
+    condition = Q()
+    for word in words:
+        condition &= Q(title__icontains=word) | Q(body__icontains=word)
+    rows = (
+        SearchDocument.objects.filter(condition, community_id=community_id, kind__in=kinds)
+        .order_by('-created_at', '-id')
+        .values_list('kind', 'object_id', 'title', 'created_at')[:limit]
+    )
+    return [SearchHit(kind, object_id, title, 0.0, created) for kind, object_id, title, created in rows]
+
+
+def _attach_objects(hits: List[SearchHit]) -> List[SearchHit]:
+    ids_by_kind: Dict[str, List[int]] = {}
+    for hit in hits:
+        ids_by_kind.setdefault(hit.kind, []).append(hit.object_id)
+    objects = {kind: SOURCES_BY_KIND[kind].model.objects.in_bulk(ids) for kind, ids in ids_by_kind.items()}
+    loaded = []
+    for hit in hits:
+        hit.obj = objects[hit.kind].get(hit.object_id)
+        if hit.obj is not None:
+            loaded.append(hit)
+    return loaded
+
+
+@instrumented()
+def search(
+    community_id: int,
+    query: str,
+    types: Optional[Iterable[str]] = None,
+    *,
+    limit: int = SEARCH_PAGE_SIZE,
+    load: bool = True,
+) -> List[SearchHit]:
+    """Best matches for ``query`` in ``community_id``, highest rank first (see module docstring)."""
+    kinds = _kinds(types)
+    query = (query or '').strip()
+    if not query or not kinds:
+        return []
+    limit = max(1, min(limit, SEARCH_MAX_PAGE_SIZE))
+    connection = connections[router.db_for_read(SearchDocument)]
+    if connection.vendor == 'postgresql':
+        hits = _postgres_hits(community_id, query, kinds, limit)
+    elif connection.vendor == 'sqlite':
+        hits = _sqlite_hits(connection, community_id, query, kinds, limit)
+    else:
+        hits = _fallback_hits(community_id, query, kinds, limit)
+    return _attach_objects(hits) if load else hits
@@ -9,8 +9,8 @@ from django.db.models.signals import post_save
 from django.dispatch import receiver
 
 from app_models.account.models import User
-from app_models.app_payments.models import PaymentGateway
-from app_models.community.models import Community
+from app_models.app_payments.choices import PaymentGateway
+from app_models.shared.instrumentation import instrumented
 
 
 class CommunityStore(models.Model):
@@ -19,7 +19,7 @@ class CommunityStore(models.Model):
     existing communities are backfilled via migration).
     """
     community = models.OneToOneField(
-        Community,
+        'community.Community',
         on_delete=models.CASCADE,
         related_name='store',
         help_text='Community that owns this store',
@@ -490,6 +490,7 @@ class StorePurchase(models.Model):
             ),
         ]
 
+    @instrumented()
     def save(self, *args, **kwargs):
         if self.buyer_email:
             self.buyer_email = self.buyer_email.strip().lower()
@@ -528,7 +529,8 @@ class StoreDownloadToken(models.Model):
         return f"{self.token} (expires {self.expires_at})"
 
 
-@receiver(post_save, sender=Community)
+@receiver(post_save, sender='community.Community')
+@instrumented()
 def _create_community_store(sender, instance, created, **kwargs):
     if created:
         CommunityStore.objects.get_or_create(community=instance)
@@ -12,6 +12,7 @@ from typing import Iterable, List, Optional, Sequence, Tuple
 
 from django.utils import timezone
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from app_models.shared.instrumentation import instrumented
 
 
 def normalize_utc_start(dt: datetime) -> datetime:
@@ -37,6 +38,7 @@ def _daterange(d0: date, d1: date) -> Iterable[date]:
         d += timedelta(days=1)
 
 
+@instrumented()
 def generate_meeting_slot_intervals(
     *,
     time_zone: str,
@@ -110,6 +112,7 @@ def generate_meeting_slot_intervals(
     return results
 
 
+@instrumented()
 def list_meeting_slots_for_product_public(
     product,
     *,
@@ -196,6 +199,7 @@ def list_meeting_slots_for_product_public(
     return out
 
 
+@instrumented()
 def validate_booked_slot_start_for_checkout(product, slot_start_utc: datetime, *, now_utc: Optional[datetime] = None) -> Tuple[bool, str]:
     """
     Return (ok, error_message). ``error_message`` is empty when ``ok``.
@@ -3,6 +3,7 @@ from django.db.models.signals import post_save
 from django.dispatch import receiver
 
 from app_models.community.models import Community
+from app_models.shared.instrumentation import instrumented
 
 
 class CommunityTelegram(models.Model):
@@ -76,6 +77,7 @@ class CommunityTelegram(models.Model):
 
 
 @receiver(post_save, sender=Community)
+@instrumented()
 def _create_community_telegram(sender, instance, created, **kwargs):
     if created:
         CommunityTelegram.objects.get_or_create(community=instance)
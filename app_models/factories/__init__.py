@@ -0,0 +1,23 @@
+"""
+Synthetic data factories for load tests and benchmarks.
+
+``seed_dataset(scale)`` writes FK-valid communities, members, forum activity, chat, engagement
+telemetry, store purchases and their payment rows with batched ``bulk_create`` (or ``COPY`` on
+PostgreSQL with psycopg 3). The per-domain modules (``community``, ``forum``, ``chat``,
+``engagement``, ``store``, ``payments``) can be used on their own with a ``FactoryContext``.
+"""
+
+from app_models.factories.base import DEFAULT_BATCH_SIZE, BulkWriter, copy_supported
+from app_models.factories.context import FactoryContext
+from app_models.factories.dataset import SCALES, Dataset, FactoryScale, seed_dataset
+
+__all__ = [
+    'DEFAULT_BATCH_SIZE',
+    'SCALES',
+    'BulkWriter',
+    'Dataset',
+    'FactoryContext',
+    'FactoryScale',
+    'copy_supported',
+    'seed_dataset',
+]
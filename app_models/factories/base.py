@@ -0,0 +1,102 @@
+"""
+Batched row writer used by the factories.
+
+``BulkWriter`` buffers unsaved model instances and writes them ``batch_size`` at a time with
+``bulk_create`` (no ``save()``, no signals). On PostgreSQL with psycopg 3 it can stream rows
+with ``COPY ... FROM STDIN`` instead: primary keys are reserved up front from the table's
+identity sequence so instances still carry their ids for the rows that reference them.
+"""
+
+from __future__ import annotations
+
+from typing import Generic, List, Optional, Sequence, Type, TypeVar
+
+from django.db import connections, models, router
+
+DEFAULT_BATCH_SIZE = 5000
+
+M = TypeVar('M', bound=models.Model)
+
+
+def copy_supported(model: Type[models.Model]) -> bool:
+    """True when ``model``'s database is PostgreSQL driven by psycopg 3 (cursor.copy)."""
+    connection = connections[router.db_for_write(model)]
+    if connection.vendor != 'postgresql':
+        return False
+    try:
+        import psycopg  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class BulkWriter(Generic[M]):
+    """
+    Buffer instances of one model and flush them in batches.
+
+    ``add`` returns the instance; its ``pk`` is set once the batch holding it is flushed
+    (call ``flush`` before reading ids). Use as a context manager to flush on exit.
+    """
+
+    def __init__(self, model: Type[M], *, batch_size: int = DEFAULT_BATCH_SIZE, use_copy: Optional[bool] = None):
+        self.model = model
+        self.batch_size = batch_size
+        self.use_copy = copy_supported(model) if use_copy is None else use_copy
+        self.written = 0
+        self._pending: List[M] = []
+
+    def __enter__(self) -> 'BulkWriter[M]':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
+
+    def add(self, obj: M) -> M:
+        self._pending.append(obj)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+        return obj
+
+    def extend(self, objs) -> None:
+        for obj in objs:
+            self.add(obj)
+
+    def flush(self) -> List[M]:
+        batch, self._pending = self._pending, []
+        if not batch:
+            return batch
+        if self.use_copy:
+            self._copy(batch)
+        else:
+            self.model.objects.bulk_create(batch, batch_size=self.batch_size)
+        self.written += len(batch)
+        return batch
+
+    def _copy(self, batch: Sequence[M]) -> None:
+        opts = self.model._meta
+        connection = connections[router.db_for_write(self.model)]
+        qn = connection.ops.quote_name
+        pk = opts.pk
+        missing = [obj for obj in batch if obj.pk is None] if getattr(pk, 'db_returning', False) else []
+        with connection.cursor() as cursor:
+            if missing:
+                cursor.execute(
+                    'SELECT setval(pg_get_serial_sequence(%s, %s), nextval(pg_get_serial_sequence(%s, %s)) + %s)',
+                    [qn(opts.db_table), pk.column, qn(opts.db_table), pk.column, len(missing) - 1],
+                )
+                first_id = cursor.fetchone()[0] - len(missing) + 1
+                for offset, obj in enumerate(missing):
+                    setattr(obj, pk.attname, first_id + offset)
+            fields = list(opts.concrete_fields)
+            columns = ', '.join(qn(f.column) for f in fields)
+            raw = cursor.cursor
+            with raw.copy(f'COPY {qn(opts.db_table)} ({columns}) FROM STDIN') as copy:
+                for obj in batch:
+                    copy.write_row([
+                        f.get_db_prep_save(f.pre_save(obj, True), connection)
+                        for f in fields
+                    ])
+        for obj in batch:
+            obj._state.adding = False
+            obj._state.db = connection.alias
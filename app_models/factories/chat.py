@@ -0,0 +1,51 @@
+"""Two-person conversations with participants and messages."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Sequence
+
+from app_models.factories.context import FactoryContext
+
+
+def create_conversations(
+    ctx: FactoryContext,
+    community_id: int,
+    member_user_ids: Sequence[int],
+    count: int,
+    messages_per_conversation: int,
+) -> None:
+    from app_models.community_chat.direct_messages import dm_key
+    from app_models.community_chat.models import Conversation, ConversationParticipant, Message
+
+    if len(member_user_ids) < 2 or not count:
+        return
+    rng = ctx.rng
+    pairs = [tuple(rng.sample(member_user_ids, 2)) for _ in range(count)]
+    # The first conversation of each pair is its direct-message conversation (dm_key set).
+    keyed = set()
+    dm_keys = []
+    for pair in pairs:
+        key = dm_key(community_id, *pair)
+        dm_keys.append(None if key in keyed else key)
+        keyed.add(key)
+    conversations = ctx.write(Conversation, (
+        Conversation(community_id=community_id, last_message_at=ctx.now if messages_per_conversation else None, dm_key=key)
+        for key in dm_keys
+    ))
+    ctx.write(ConversationParticipant, (
+        ConversationParticipant(conversation=c, user_id=user_id, last_read_at=ctx.now - timedelta(hours=1))
+        for c, pair in zip(conversations, pairs)
+        for user_id in pair
+    ))
+    messages = ctx.write(Message, (
+        Message(conversation=c, sender_id=pair[m % 2], content=f'Factory message {m}', is_read=m < messages_per_conversation - 1)
+        for c, pair in zip(conversations, pairs)
+        for m in range(messages_per_conversation)
+    ))
+    if messages_per_conversation:
+        # bulk writes skip the Message receivers; the last message written per conversation is its newest.
+        for c, last in zip(conversations, messages[messages_per_conversation - 1::messages_per_conversation]):
+            c.last_message = last
+            c.last_message_at = last.created_at
+        Conversation.objects.bulk_update(conversations, ['last_message', 'last_message_at'], batch_size=ctx.batch_size)
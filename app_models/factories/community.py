@@ -0,0 +1,108 @@
+"""Users, communities (with the rows their post_save receivers would create), members and views."""
+
+from __future__ import annotations
+
+from typing import List, Sequence
+
+from app_models.factories.context import FactoryContext
+
+UNUSABLE_PASSWORD = '!'
+
+
+def create_users(ctx: FactoryContext, count: int, *, prefix: str = 'user') -> List[int]:
+    """Verified users with unusable passwords; returns their ids (built ``batch_size`` at a time)."""
+    from app_models.account.models import User
+
+    ids: List[int] = []
+    for start in range(0, count, ctx.batch_size):
+        rows = ctx.write(User, (
+            User(
+                email=f'{prefix}-{ctx.tag}-{n}@factory.test',
+                password=UNUSABLE_PASSWORD,
+                is_verified=True,
+            )
+            for n in range(start, min(count, start + ctx.batch_size))
+        ))
+        ids.extend(u.pk for u in rows)
+    return ids
+
+
+def create_communities(ctx: FactoryContext, owner_ids: Sequence[int]) -> List[dict]:
+    """
+    One community per owner, plus the owner membership and the companion rows the
+    ``Community`` post_save receivers create (free 'hobby plan' group, settings, town_hall
+    forum, telegram settings, store). Returns dicts of the ids later factories need.
+    """
+    from app_models.community.models import Community, CommunityGroup, CommunityMember, CommunitySettings
+    from app_models.community_forum.models import Forum
+    from app_models.community_store.models import CommunityStore
+    from app_models.community_telegram.models import CommunityTelegram
+
+    communities = ctx.write(Community, (
+        Community(name=f'Factory community {n}', alias=f'factory-{ctx.tag}-{n}', category='education')
+        for n in range(len(owner_ids))
+    ))
+    ctx.write(CommunityGroup, (
+        CommunityGroup(
+            community=c,
+            name='hobby plan',
+            description='Default free tier for the community',
+            billing_period=CommunityGroup.BillingPeriod.LIFETIME,
+        )
+        for c in communities
+    ))
+    ctx.write(CommunitySettings, (CommunitySettings(community=c) for c in communities))
+    ctx.write(CommunityTelegram, (CommunityTelegram(community=c) for c in communities))
+    stores = ctx.write(CommunityStore, (CommunityStore(community=c) for c in communities))
+    forums = ctx.write(Forum, (
+        Forum(community=c, name='town_hall', description='Town Hall discussion forum for the community')
+        for c in communities
+    ))
+    owners = ctx.write(CommunityMember, (
+        CommunityMember(community=c, user_id=owner_id, role='owner', approved_at=ctx.now)
+        for c, owner_id in zip(communities, owner_ids)
+    ))
+    return [
+        {
+            'community_id': c.pk,
+            'owner_id': owner_id,
+            'owner_member_id': m.pk,
+            'store_id': s.pk,
+            'forum_id': f.pk,
+        }
+        for c, owner_id, m, s, f in zip(communities, owner_ids, owners, stores, forums)
+    ]
+
+
+def create_members(ctx: FactoryContext, community_id: int, user_ids: Sequence[int]) -> List[int]:
+    """Approved ``member`` rows for ``user_ids``; returns CommunityMember ids."""
+    from app_models.community.models import CommunityMember
+
+    rows = ctx.write(CommunityMember, (
+        CommunityMember(
+            community_id=community_id,
+            user_id=user_id,
+            role='member',
+            approved_at=ctx.now,
+            points=ctx.rng.randrange(0, 500),
+        )
+        for user_id in user_ids
+    ))
+    return [m.pk for m in rows]
+
+
+def create_views(ctx: FactoryContext, community_id: int, viewer_ids: Sequence[int], count: int) -> None:
+    """``count`` views, about a third anonymous, from a handful of countries."""
+    from app_models.community.models import CommunityView
+
+    countries = ('Nigeria', 'Ghana', 'Kenya', 'United States', 'United Kingdom')
+    rng = ctx.rng
+    ctx.write(CommunityView, (
+        CommunityView(
+            community_id=community_id,
+            user_id=rng.choice(viewer_ids) if viewer_ids and rng.random() > 0.33 else None,
+            country=rng.choice(countries),
+            referrer_domain=rng.choice(('google.com', 'x.com', None)),
+        )
+        for _ in range(count)
+    ))
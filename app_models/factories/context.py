@@ -0,0 +1,39 @@
+"""Shared state for one factory run: deterministic RNG, batching options and a unique run tag."""
+
+from __future__ import annotations
+
+import random
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Type
+
+from django.db import models
+from django.utils import timezone
+
+from app_models.factories.base import DEFAULT_BATCH_SIZE, BulkWriter
+
+
+@dataclass
+class FactoryContext:
+    seed: int = 0
+    batch_size: int = DEFAULT_BATCH_SIZE
+    use_copy: Optional[bool] = None
+    tag: str = field(default_factory=lambda: uuid.uuid4().hex[:8])
+    now: datetime = field(default_factory=timezone.now)
+    written: Dict[str, int] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.rng = random.Random(self.seed)
+
+    def writer(self, model: Type[models.Model]) -> BulkWriter:
+        return BulkWriter(model, batch_size=self.batch_size, use_copy=self.use_copy)
+
+    def write(self, model: Type[models.Model], objs: Iterable[models.Model]) -> List[models.Model]:
+        """Write ``objs`` in batches, count them, and return them with primary keys set."""
+        rows = list(objs)
+        with self.writer(model) as writer:
+            writer.extend(rows)
+        label = model._meta.label
+        self.written[label] = self.written.get(label, 0) + len(rows)
+        return rows
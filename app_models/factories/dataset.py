@@ -0,0 +1,112 @@
+"""Scale presets and the top-level ``seed_dataset`` entry point."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+
+from django.db import transaction
+
+from app_models.factories.base import DEFAULT_BATCH_SIZE
+from app_models.factories.context import FactoryContext
+
+
+@dataclass(frozen=True)
+class FactoryScale:
+    communities: int
+    members_per_community: int
+    posts_per_community: int
+    replies_per_post: int
+    likes_per_post: int
+    views_per_community: int
+    conversations_per_community: int
+    messages_per_conversation: int
+    engagement_events_per_member: int
+    purchases_per_product: int
+
+
+SCALES: Dict[str, FactoryScale] = {
+    'small': FactoryScale(5, 20, 50, 2, 3, 100, 5, 10, 2, 20),
+    'medium': FactoryScale(20, 100, 500, 3, 5, 2000, 25, 20, 5, 200),
+    'large': FactoryScale(50, 500, 5000, 3, 10, 20000, 100, 50, 10, 1000),
+}
+
+
+@dataclass
+class Dataset:
+    scale: str
+    counts: Dict[str, int]
+    community_ids: List[int] = field(default_factory=list)
+    owner_ids: List[int] = field(default_factory=list)
+    member_ids: List[int] = field(default_factory=list)
+    forum_ids: List[int] = field(default_factory=list)
+    file_product_ids: List[int] = field(default_factory=list)
+    meeting_product_ids: List[int] = field(default_factory=list)
+    written: Dict[str, int] = field(default_factory=dict)
+
+
+def seed_dataset(
+    scale: str = 'small',
+    *,
+    seed: int = 0,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    use_copy: Optional[bool] = None,
+    gateway_references: bool = True,
+) -> Dataset:
+    """
+    Write a complete synthetic dataset for ``scale`` (a ``SCALES`` key) in one transaction.
+
+    Each community gets an owner with an app subscription, its default companion rows, approved
+    members, forum posts with replies/likes/attachments, views, two-person conversations,
+    engagement sessions, and a file and a meeting product with completed, paid purchases.
+    Rows are written in bulk, so model ``save()`` methods and signals do not run; anything
+    they would derive is set explicitly, and ``GatewayReference`` rows are rebuilt at the end
+    unless ``gateway_references`` is False.
+    """
+    from app_models.factories import chat, community, engagement, forum, payments, store
+
+    plan = SCALES[scale]
+    ctx = FactoryContext(seed=seed, batch_size=batch_size, use_copy=use_copy)
+    data = Dataset(scale=scale, counts=asdict(plan))
+    with transaction.atomic():
+        owner_ids = community.create_users(ctx, plan.communities, prefix='owner')
+        member_user_ids = community.create_users(ctx, plan.communities * plan.members_per_community, prefix='member')
+        payments.create_app_subscriptions(ctx, owner_ids)
+        created = community.create_communities(ctx, owner_ids)
+        for n, c in enumerate(created):
+            start = n * plan.members_per_community
+            user_ids = member_user_ids[start:start + plan.members_per_community]
+            data.community_ids.append(c['community_id'])
+            data.owner_ids.append(c['owner_id'])
+            data.forum_ids.append(c['forum_id'])
+            data.member_ids.extend(community.create_members(ctx, c['community_id'], user_ids))
+            community.create_views(ctx, c['community_id'], user_ids, plan.views_per_community)
+            forum.create_posts(
+                ctx,
+                c['forum_id'],
+                user_ids,
+                plan.posts_per_community,
+                replies_per_post=plan.replies_per_post,
+                likes_per_post=plan.likes_per_post,
+            )
+            chat.create_conversations(
+                ctx, c['community_id'], user_ids, plan.conversations_per_community, plan.messages_per_conversation,
+            )
+            engagement.create_engagement(ctx, c['community_id'], user_ids, plan.engagement_events_per_member)
+
+            file_product_id, meeting_product_id = store.create_products(ctx, c['store_id'], c['owner_id'])
+            data.file_product_ids.append(file_product_id)
+            data.meeting_product_ids.append(meeting_product_id)
+            buyers = [(user_id, f'member-{ctx.tag}-{start + k}@factory.test') for k, user_id in enumerate(user_ids)]
+            purchases = store.create_purchases(ctx, file_product_id, buyers, plan.purchases_per_product)
+            purchases += store.create_purchases(ctx, meeting_product_id, buyers, plan.purchases_per_product, meeting=True)
+            payments.create_purchase_payments(ctx, c['community_id'], c['owner_id'], purchases)
+
+        if gateway_references:
+            from app_models.app_payments.gateway_references import rebuild_gateway_references
+
+            ctx.written['app_payments.GatewayReference'] = rebuild_gateway_references(
+                ['app_payments.PaymentTransaction', 'community_store.StorePurchase'],
+            )
+    data.written = dict(ctx.written)
+    return data
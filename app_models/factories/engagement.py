@@ -0,0 +1,40 @@
+"""Engagement telemetry sessions and events."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import timedelta
+from typing import Sequence
+
+from app_models.factories.context import FactoryContext
+
+
+def create_engagement(
+    ctx: FactoryContext,
+    community_id: int,
+    user_ids: Sequence[int],
+    events_per_session: int,
+) -> None:
+    """One session per user with ``events_per_session`` events on random surfaces."""
+    from app_models.member_engagement.models import EngagementEvent, EngagementSession
+
+    if not user_ids:
+        return
+    rng = ctx.rng
+    surfaces = [choice for choice, _label in EngagementEvent.Surface.choices]
+    sessions = ctx.write(EngagementSession, (
+        EngagementSession(user_id=user_id, community_id=community_id, client_session_key=uuid.uuid4().hex)
+        for user_id in user_ids
+    ))
+    ctx.write(EngagementEvent, (
+        EngagementEvent(
+            session=s,
+            occurred_at_client=ctx.now - timedelta(seconds=rng.randrange(0, 86400)),
+            surface=rng.choice(surfaces),
+            event_type=rng.choice(('view', 'heartbeat', 'complete')),
+            duration_ms=rng.randrange(1000, 600000),
+            idempotency_key=uuid.uuid4().hex,
+        )
+        for s in sessions
+        for _ in range(events_per_session)
+    ))
@@ -0,0 +1,55 @@
+"""Forum posts, replies, likes and attachments."""
+
+from __future__ import annotations
+
+from typing import List, Sequence
+
+from app_models.factories.context import FactoryContext
+
+
+def create_posts(
+    ctx: FactoryContext,
+    forum_id: int,
+    author_ids: Sequence[int],
+    count: int,
+    *,
+    replies_per_post: int = 0,
+    likes_per_post: int = 0,
+    attachment_ratio: float = 0.1,
+) -> List[int]:
+    """
+    Top-level posts (the first two pinned) with replies, likes and some image attachments; the
+    denormalized counters are reconciled afterwards. Returns top-level ids.
+    """
+    from app_models.community_forum.counters import reconcile_post_counters
+    from app_models.community_forum.models import Post, PostAttachment, PostLike
+
+    if not author_ids or not count:
+        return []
+    rng = ctx.rng
+    posts = ctx.write(Post, (
+        Post(forum_id=forum_id, user_id=rng.choice(author_ids), message=f'Factory post {n}', is_pinned=n < 2)
+        for n in range(count)
+    ))
+    if replies_per_post:
+        ctx.write(Post, (
+            Post(forum_id=forum_id, user_id=rng.choice(author_ids), parent_post=p, message=f'Reply {r}')
+            for p in posts
+            for r in range(replies_per_post)
+        ))
+    if likes_per_post:
+        per_post = min(likes_per_post, len(author_ids))
+        ctx.write(PostLike, (
+            PostLike(post=p, user_id=user_id)
+            for p in posts
+            for user_id in rng.sample(author_ids, per_post)
+        ))
+    if attachment_ratio:
+        ctx.write(PostAttachment, (
+            PostAttachment(post=p, file_url=f'https://cdn.factory.test/{ctx.tag}/{p.pk}.jpg', file_type='image')
+            for p in posts
+            if rng.random() < attachment_ratio
+        ))
+    if replies_per_post or likes_per_post:
+        reconcile_post_counters(Post.objects.filter(forum_id=forum_id, parent_post__isnull=True), batch_size=ctx.batch_size)
+    return [p.pk for p in posts]
@@ -0,0 +1,80 @@
+"""Owner app subscriptions, and the ledger rows and checkout sessions behind store purchases."""
+
+from __future__ import annotations
+
+import hashlib
+from decimal import Decimal
+from typing import Dict, Sequence
+
+from app_models.factories.context import FactoryContext
+
+PLATFORM_FEE_RATE = Decimal('0.02')
+FACTORY_TIER_NAME = 'professional'
+FACTORY_TIER_ENTITLEMENTS = {'limits': {'max_members': None}, 'features': {'has_store_access': True}}
+
+
+def create_app_subscriptions(ctx: FactoryContext, owner_ids: Sequence[int]) -> None:
+    """An active ``professional`` app subscription per owner (tier created once, with store access)."""
+    from app_models.app_subscription.models import AppSubscription, AppSubscriptionTier
+
+    tier, _ = AppSubscriptionTier.objects.get_or_create(
+        tier_name=FACTORY_TIER_NAME,
+        defaults={'display_name': 'Professional', 'entitlements': FACTORY_TIER_ENTITLEMENTS},
+    )
+    ctx.write(AppSubscription, (
+        AppSubscription(user_id=owner_id, tier=tier, status='active', activated_at=ctx.now, payment_gateway='stripe')
+        for owner_id in owner_ids
+    ))
+
+
+def create_purchase_payments(ctx: FactoryContext, community_id: int, owner_id: int, purchases: Sequence) -> None:
+    """
+    For each completed purchase: a succeeded Stripe ``PaymentTransaction`` (2% platform fee) and the
+    completed ``PaymentCheckoutSession`` that led to it. Bulk writes skip ``save()``, so the
+    denormalized ``community`` / ``owner_user`` are set here and the purchase gets its
+    ``stripe_payment_intent_id`` through a bulk update.
+    """
+    from app_models.app_payments.models import PaymentCheckoutSession, PaymentTransaction
+    from app_models.community_store.models import StorePurchase
+
+    if not purchases:
+        return
+    intent_ids: Dict[int, str] = {}
+    for p in purchases:
+        intent_ids[p.pk] = p.stripe_payment_intent_id = f'pi_{ctx.tag}_{p.pk}'
+        p.payment_gateway = 'stripe'
+    StorePurchase.objects.bulk_update(purchases, ['stripe_payment_intent_id', 'payment_gateway'], batch_size=ctx.batch_size)
+
+    def fee(amount: Decimal) -> Decimal:
+        return (amount * PLATFORM_FEE_RATE).quantize(Decimal('0.01'))
+
+    ctx.write(PaymentTransaction, (
+        PaymentTransaction(
+            transaction_type='store_purchase',
+            store_purchase_id=p.pk,
+            total_amount=p.amount_paid,
+            platform_fee=fee(p.amount_paid),
+            owner_amount=p.amount_paid - fee(p.amount_paid),
+            currency=p.currency,
+            status='succeeded',
+            payment_gateway='stripe',
+            stripe_payment_intent_id=intent_ids[p.pk],
+            community_id=community_id,
+            owner_user_id=owner_id,
+            completed_at=ctx.now,
+        )
+        for p in purchases
+    ))
+    ctx.write(PaymentCheckoutSession, (
+        PaymentCheckoutSession(
+            user_id=p.buyer_user_id,
+            session_kind='store_purchase',
+            status=PaymentCheckoutSession.STATUS_COMPLETED,
+            token_hash=hashlib.sha256(f'{ctx.tag}:checkout:{p.pk}'.encode()).hexdigest(),
+            store_purchase_id=p.pk,
+            payment_gateway='stripe',
+            expires_at=ctx.now,
+            used_at=ctx.now,
+        )
+        for p in purchases
+    ))
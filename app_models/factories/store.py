@@ -0,0 +1,100 @@
+"""Store products (file downloads and bookable meetings) and completed purchases."""
+
+from __future__ import annotations
+
+from datetime import time, timedelta
+from decimal import Decimal
+from typing import List, Sequence, Tuple
+
+from app_models.factories.context import FactoryContext
+
+PRODUCT_AMOUNT = Decimal('25.00')
+SLOTS_PER_DAY = 16
+
+
+def create_products(ctx: FactoryContext, store_id: int, owner_id: int) -> Tuple[int, int]:
+    """
+    One file product and one 30-minute meeting product (USD + NGN prices, Monday–Sunday
+    09:00–17:00 windows, no minimum notice). Returns ``(file_product_id, meeting_product_id)``.
+    """
+    from app_models.community_store.models import (
+        StoreBookableMeetingSettings,
+        StoreOwnerAvailabilityWindow,
+        StoreProduct,
+        StoreProductKind,
+        StoreProductPrice,
+    )
+
+    file_product, meeting_product = ctx.write(StoreProduct, [
+        StoreProduct(
+            store_id=store_id,
+            name='Starter kit',
+            product_kind=StoreProductKind.FILE,
+            amount=PRODUCT_AMOUNT,
+            listed_by_id=owner_id,
+            file_url=f'https://cdn.factory.test/{ctx.tag}/starter-kit.zip',
+        ),
+        StoreProduct(
+            store_id=store_id,
+            name='Office hours',
+            product_kind=StoreProductKind.MEETING,
+            amount=PRODUCT_AMOUNT,
+            listed_by_id=owner_id,
+        ),
+    ])
+    ctx.write(StoreProductPrice, (
+        StoreProductPrice(store_product=p, currency=currency, amount=amount)
+        for p in (file_product, meeting_product)
+        for currency, amount in (('USD', PRODUCT_AMOUNT), ('NGN', Decimal('37500.00')))
+    ))
+    (settings,) = ctx.write(StoreBookableMeetingSettings, [
+        StoreBookableMeetingSettings(store_product=meeting_product, minimum_notice_minutes=0),
+    ])
+    ctx.write(StoreOwnerAvailabilityWindow, (
+        StoreOwnerAvailabilityWindow(settings=settings, weekday=day, local_start=time(9), local_end=time(17))
+        for day in range(1, 8)
+    ))
+    return file_product.pk, meeting_product.pk
+
+
+def create_purchases(
+    ctx: FactoryContext,
+    product_id: int,
+    buyers: Sequence[Tuple[int, str]],
+    count: int,
+    *,
+    meeting: bool = False,
+) -> List[object]:
+    """
+    Completed purchases by ``(user_id, email)`` buyers. Emails are stored lower-cased as
+    ``StorePurchase.save`` would. File purchases use distinct buyers (at most one completed
+    purchase per product and email); meeting purchases get consecutive 30-minute slots from
+    tomorrow 09:00 UTC, so no two share a start time.
+    """
+    from app_models.community_store.models import StorePurchase
+
+    if not buyers:
+        return []
+    rng = ctx.rng
+    if meeting:
+        picked = [rng.choice(buyers) for _ in range(count)]
+        day_start = (ctx.now + timedelta(days=1)).replace(hour=9, minute=0, second=0, microsecond=0)
+        slots = [
+            day_start + timedelta(days=n // SLOTS_PER_DAY, minutes=30 * (n % SLOTS_PER_DAY))
+            for n in range(count)
+        ]
+    else:
+        picked = rng.sample(list(buyers), min(count, len(buyers)))
+        slots = [None] * len(picked)
+    return ctx.write(StorePurchase, (
+        StorePurchase(
+            product_id=product_id,
+            buyer_user_id=user_id,
+            buyer_email=email.strip().lower(),
+            status=StorePurchase.STATUS_COMPLETED,
+            amount_paid=PRODUCT_AMOUNT,
+            booked_slot_start_utc=slot,
+            purchased_at=ctx.now,
+        )
+        for (user_id, email), slot in zip(picked, slots)
+    ))
@@ -0,0 +1,225 @@
+"""
+``INSTALLED_APPS`` profiles for services that use only part of the model graph.
+
+Every profile is closed under cross-app foreign keys, many-to-many relations and lazy signal
+senders, so ``django.setup()`` and the system checks pass with just those apps installed::
+
+    from app_models.profiles import NOTIFICATION_APPS
+
+    INSTALLED_APPS = [
+        'django.contrib.auth',
+        *NOTIFICATION_APPS,
+        'notifications',
+    ]
+
+``profile_apps('payment', 'content')`` combines profiles; ``resolve_apps(...)`` closes any
+list of apps. The closure comes from ``APP_DEPENDENCIES``. When a model gains a relation to
+another app, add it there: ``verify_profiles()`` compares the map with the live registry
+(with every app installed) and returns the edges that are missing.
+
+Signal receivers only run in processes that install the receiving app. For example, the
+town_hall forum, store and telegram rows created on ``Community`` insert come from
+``community_forum``, ``community_store`` and ``community_telegram``, so only a process with
+``FULL_APPS`` installed should create communities.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Set, Tuple
+
+CONTENTTYPES = 'django.contrib.contenttypes'
+
+ALL_APPS: Tuple[str, ...] = (
+    'app_models.shared',
+    'app_models.account',
+    'app_models.user_profile',
+    'app_models.community',
+    'app_models.app_payments',
+    'app_models.app_subscription',
+    'app_models.storage_usage',
+    'app_models.community_classroom',
+    'app_models.community_classroom_content',
+    'app_models.community_forum',
+    'app_models.community_blog',
+    'app_models.blog',
+    'app_models.community_resource',
+    'app_models.community_quiz',
+    'app_models.community_polls',
+    'app_models.community_meetings',
+    'app_models.community_chat',
+    'app_models.community_wheel',
+    'app_models.community_publicfeeds',
+    'app_models.community_feedback',
+    'app_models.community_leave_reason',
+    'app_models.community_abuse_report',
+    'app_models.community_telegram',
+    'app_models.badges',
+    'app_models.learning_journey',
+    'app_models.member_engagement',
+    'app_models.metrics',
+    'app_models.community_store',
+    'app_models.community_event',
+    'app_models.community_search',
+)
+
+# Direct cross-app model dependencies (relations and lazy signal senders), not transitive.
+APP_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    'app_models.shared': (),
+    'app_models.account': (),
+    'app_models.user_profile': ('app_models.account', 'app_models.shared'),
+    'app_models.community': ('app_models.account', 'app_models.shared'),
+    'app_models.app_payments': (
+        CONTENTTYPES,
+        'app_models.account',
+        'app_models.app_subscription',
+        'app_models.community',
+        'app_models.community_event',
+        'app_models.community_store',
+    ),
+    'app_models.app_subscription': ('app_models.account', 'app_models.community'),
+    'app_models.storage_usage': ('app_models.account', 'app_models.community'),
+    'app_models.community_classroom': ('app_models.account', 'app_models.community'),
+    'app_models.community_classroom_content': (
+        'app_models.account',
+        'app_models.community',
+        'app_models.community_classroom',
+    ),
+    'app_models.community_forum': ('app_models.account', 'app_models.community'),
+    'app_models.community_blog': ('app_models.account', 'app_models.community'),
+    'app_models.blog': ('app_models.account',),
+    'app_models.community_resource': ('app_models.community',),
+    'app_models.community_quiz': ('app_models.account', 'app_models.community'),
+    'app_models.community_polls': ('app_models.account', 'app_models.community'),
+    'app_models.community_meetings': ('app_models.account', 'app_models.community'),
+    'app_models.community_chat': ('app_models.account', 'app_models.community'),
+    'app_models.community_wheel': ('app_models.account', 'app_models.community'),
+    'app_models.community_publicfeeds': ('app_models.account', 'app_models.community'),
+    'app_models.community_feedback': ('app_models.account', 'app_models.community'),
+    'app_models.community_leave_reason': ('app_models.account', 'app_models.community'),
+    'app_models.community_abuse_report': ('app_models.account', 'app_models.community'),
+    'app_models.community_telegram': ('app_models.community',),
+    'app_models.badges': ('app_models.account',),
+    'app_models.learning_journey': (
+        'app_models.account',
+        'app_models.community',
+        'app_models.community_classroom',
+    ),
+    'app_models.member_engagement': (
+        'app_models.account',
+        'app_models.community',
+        'app_models.community_classroom',
+    ),
+    'app_models.metrics': ('app_models.account', 'app_models.community'),
+    'app_models.community_store': ('app_models.account', 'app_models.community', 'app_models.community_meetings'),
+    'app_models.community_event': ('app_models.account', 'app_models.community'),
+    'app_models.community_search': (
+        'app_models.community',
+        'app_models.community_blog',
+        'app_models.community_classroom_content',
+        'app_models.community_forum',
+        'app_models.community_publicfeeds',
+        'app_models.community_resource',
+    ),
+}
+
+# Apps each profile needs directly; the installed list is their closure.
+PROFILE_ROOTS: Dict[str, Tuple[str, ...]] = {
+    # Checkout, ledger, payouts, subscriptions and the buyer's billing address.
+    'payment': ('app_models.app_payments', 'app_models.user_profile', 'app_models.storage_usage'),
+    # Recipients, community notification preferences, Telegram delivery and chat.
+    'notification': (
+        'app_models.user_profile',
+        'app_models.community',
+        'app_models.community_telegram',
+        'app_models.community_chat',
+    ),
+    # Member-facing content surfaces.
+    'content': (
+        'app_models.user_profile',
+        'app_models.community_classroom_content',
+        'app_models.community_forum',
+        'app_models.community_blog',
+        'app_models.blog',
+        'app_models.community_resource',
+        'app_models.community_quiz',
+        'app_models.community_polls',
+        'app_models.community_meetings',
+        'app_models.community_publicfeeds',
+        'app_models.learning_journey',
+        'app_models.community_search',
+    ),
+    # Engagement telemetry and aggregates (MES).
+    'analytics': ('app_models.member_engagement', 'app_models.metrics', 'app_models.storage_usage'),
+}
+
+_ORDER = {label: i for i, label in enumerate((CONTENTTYPES,) + ALL_APPS)}
+
+
+def resolve_apps(apps: Iterable[str]) -> List[str]:
+    """``apps`` plus everything they depend on, in ``ALL_APPS`` order (contenttypes first)."""
+    resolved: Set[str] = set()
+    stack = list(apps)
+    while stack:
+        label = stack.pop()
+        if label in resolved:
+            continue
+        if label not in _ORDER:
+            raise ValueError(f'Unknown app {label!r}; expected one of app_models.profiles.ALL_APPS')
+        resolved.add(label)
+        stack.extend(APP_DEPENDENCIES.get(label, ()))
+    return sorted(resolved, key=_ORDER.__getitem__)
+
+
+def profile_apps(*profiles: str) -> List[str]:
+    """``INSTALLED_APPS`` entries for the union of ``profiles`` (keys of ``PROFILE_ROOTS``)."""
+    roots: List[str] = []
+    for name in profiles:
+        try:
+            roots.extend(PROFILE_ROOTS[name])
+        except KeyError:
+            raise ValueError(f'Unknown profile {name!r}; expected one of {sorted(PROFILE_ROOTS)}') from None
+    return resolve_apps(roots)
+
+
+PAYMENT_APPS = profile_apps('payment')
+NOTIFICATION_APPS = profile_apps('notification')
+CONTENT_APPS = profile_apps('content')
+ANALYTICS_APPS = profile_apps('analytics')
+FULL_APPS = resolve_apps(ALL_APPS)
+
+
+def live_dependencies() -> Dict[str, Set[str]]:
+    """Cross-app relation targets (FK, one-to-one, many-to-many) per app, read from the loaded registry."""
+    from django.apps import apps
+
+    found: Dict[str, Set[str]] = {}
+    for model in apps.get_models(include_auto_created=True):
+        source = model._meta.app_config.name
+        for field in model._meta.get_fields(include_hidden=True):
+            if not (field.is_relation and field.concrete) or field.related_model is None:
+                continue
+            target = field.related_model._meta.app_config.name
+            if target != source:
+                found.setdefault(source, set()).add(target)
+    return found
+
+
+def verify_profiles() -> List[str]:
+    """
+    Problems with ``APP_DEPENDENCIES``: relations in the loaded registry that the map does not
+    list, and installed apps it does not know. Call it with every app installed;
+    ``python -m benchmarks.check_profiles`` does that in CI and also boots each profile alone,
+    where Django's system checks catch lazy signal senders to missing apps.
+    """
+    from django.apps import apps
+
+    problems: List[str] = []
+    for source, targets in sorted(live_dependencies().items()):
+        if source not in APP_DEPENDENCIES:
+            continue
+        for target in sorted(targets - set(APP_DEPENDENCIES[source])):
+            problems.append(f'{source} depends on {target}, missing from APP_DEPENDENCIES')
+    for config in apps.get_app_configs():
+        if config.name.startswith('app_models.') and config.name not in APP_DEPENDENCIES:
+            problems.append(f'{config.name} is not listed in APP_DEPENDENCIES')
+    return problems
@@ -0,0 +1,83 @@
+"""
+Small in-process TTL cache for read-mostly lookups (price tables, routing, payout accounts).
+
+Entries expire after ``ttl`` seconds. Model signal receivers call ``invalidate`` / ``clear``
+so writes made in the same process are visible immediately; writes made by another
+service process are picked up within one TTL.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, Hashable, Iterable
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe dict with per-entry expiry and a soft size cap (oldest entries evicted first)."""
+
+    def __init__(self, ttl: float, maxsize: int = 10000):
+        self.ttl = float(ttl)
+        self.maxsize = int(maxsize)
+        self._data: Dict[Hashable, tuple] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        """Return ``{key: value}`` for keys that are cached and not expired."""
+        now = time.monotonic()
+        out: Dict[Hashable, Any] = {}
+        with self._lock:
+            for key in keys:
+                entry = self._data.get(key, _MISSING)
+                if entry is _MISSING:
+                    continue
+                expires_at, value = entry
+                if expires_at <= now:
+                    del self._data[key]
+                    continue
+                out[key] = value
+        return out
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                self._evict()
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def set_many(self, items: Dict[Hashable, Any]) -> None:
+        for key, value in items.items():
+            self.set(key, value)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        for key in [k for k, (expires_at, _v) in self._data.items() if expires_at <= now]:
+            del self._data[key]
+        while len(self._data) >= self.maxsize:
+            # dicts keep insertion order, so the first key is the oldest write.
+            del self._data[next(iter(self._data))]
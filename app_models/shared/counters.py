@@ -0,0 +1,97 @@
+"""
+Denormalized ``reply_count`` / ``like_count`` / ``last_reply_at`` maintenance.
+
+Forum ``Post`` and ``PublicFeed`` rows carry their own reply and like counters, so listing
+pages never ``COUNT`` per row. Signal receivers in each app call the helpers below on
+insert/delete of a reply or like. Each helper is a single ``UPDATE`` with ``F()``
+expressions, so concurrent likes cannot lose increments. Decrements never go below zero.
+After a reply is deleted, ``last_reply_at`` is recomputed from the remaining replies.
+
+Receivers skip updates on rows that a cascade is about to delete anyway (see
+``deleting_with``). Writes that bypass signals (``bulk_create``, ``QuerySet.update`` of
+``parent_*``, raw SQL) leave the counters stale until ``reconcile_counters`` runs. It
+recomputes every counter from the source rows in primary-key batches and backs the
+``reconcile_*_counters`` management commands.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Iterable, Type
+
+from django.db import models
+from django.db.models import Case, Count, F, Max, OuterRef, Subquery, Value, When
+from django.db.models.functions import Coalesce
+
+RECONCILE_BATCH_SIZE = 2000
+
+
+def deleting_with(origin, container_models: Iterable[Type[models.Model]]) -> bool:
+    """True when the delete that triggered this signal started at one of ``container_models``."""
+    if origin is None:
+        return False
+    origin_model = origin.model if isinstance(origin, models.QuerySet) else type(origin)
+    return any(issubclass(origin_model, m) for m in container_models)
+
+
+def increment_reply_count(model: Type[models.Model], parent_id: int, replied_at: datetime) -> None:
+    model.objects.filter(pk=parent_id).update(
+        reply_count=F('reply_count') + 1,
+        last_reply_at=Case(
+            When(last_reply_at__gt=replied_at, then=F('last_reply_at')),
+            default=Value(replied_at),
+        ),
+    )
+
+
+def decrement_reply_count(model: Type[models.Model], parent_id: int, parent_field: str) -> None:
+    latest = (
+        model.objects.filter(**{parent_field: OuterRef('pk')})
+        .order_by()
+        .values(parent_field)
+        .annotate(latest=Max('created_at'))
+        .values('latest')
+    )
+    model.objects.filter(pk=parent_id).update(
+        reply_count=Case(When(reply_count__gt=0, then=F('reply_count') - 1), default=Value(0)),
+        last_reply_at=Subquery(latest),
+    )
+
+
+def increment_like_count(model: Type[models.Model], pk: int) -> None:
+    model.objects.filter(pk=pk).update(like_count=F('like_count') + 1)
+
+
+def decrement_like_count(model: Type[models.Model], pk: int) -> None:
+    model.objects.filter(pk=pk, like_count__gt=0).update(like_count=F('like_count') - 1)
+
+
+def reconcile_counters(
+    queryset: models.QuerySet,
+    *,
+    parent_field: str,
+    like_model: Type[models.Model],
+    like_field: str,
+    batch_size: int = RECONCILE_BATCH_SIZE,
+) -> int:
+    """
+    Recompute ``reply_count``, ``like_count`` and ``last_reply_at`` for every row of
+    ``queryset`` from its replies (rows whose ``parent_field`` points at it) and its likes
+    (``like_model`` rows whose ``like_field`` points at it). One ``UPDATE`` per ``batch_size``
+    primary keys; returns the number of rows written.
+    """
+    model = queryset.model
+    replies = model.objects.filter(**{parent_field: OuterRef('pk')}).order_by().values(parent_field)
+    likes = like_model.objects.filter(**{like_field: OuterRef('pk')}).order_by().values(like_field)
+    updated = 0
+    last_pk = 0
+    while True:
+        pks = list(queryset.filter(pk__gt=last_pk).order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not pks:
+            return updated
+        updated += model.objects.filter(pk__in=pks).update(
+            reply_count=Coalesce(Subquery(replies.annotate(n=Count('pk')).values('n')), 0),
+            like_count=Coalesce(Subquery(likes.annotate(n=Count('pk')).values('n')), 0),
+            last_reply_at=Subquery(replies.annotate(latest=Max('created_at')).values('latest')),
+        )
+        last_pk = pks[-1]
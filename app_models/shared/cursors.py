@@ -0,0 +1,42 @@
+"""
+Opaque keyset-pagination cursors for API responses.
+
+A cursor is the sort key of the last row on a page (e.g. ``(is_pinned, created_at, id)``),
+serialized as URL-safe base64 JSON so clients pass it back verbatim. ``decode_cursor`` takes
+the expected types and raises ``ValidationError`` for anything malformed, so services can
+map a tampered or stale cursor to a 400.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Sequence, Tuple
+
+from django.core.exceptions import ValidationError
+
+
+def encode_cursor(*values: Any) -> str:
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(token: str, types: Sequence[type]) -> Tuple[Any, ...]:
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(types):
+            raise ValueError
+        values = []
+        for value, kind in zip(payload, types):
+            if kind is datetime:
+                value = datetime.fromisoformat(value)
+            elif type(value) is not kind:
+                raise ValueError
+            values.append(value)
+    except (binascii.Error, TypeError, ValueError, UnicodeDecodeError):
+        raise ValidationError('Invalid cursor.', code='invalid_cursor') from None
+    return tuple(values)
@@ -0,0 +1,246 @@
+"""
+Opt-in timing and query-count instrumentation for model-layer helpers.
+
+Helpers, custom ``save()`` methods and signal receivers in this package are wrapped with
+``@instrumented()`` (named ``module.qualname``). While instrumentation is disabled (the
+default) the wrapper is a single flag check before calling through. Once a service calls
+``enable_instrumentation()`` (or sets ``APP_MODELS_INSTRUMENTATION=1`` in the environment),
+each call records:
+
+* wall time (``time.perf_counter``);
+* the number of SQL statements it issued, counted with ``connection.execute_wrapper`` on
+  every configured database alias. Nested instrumented calls are counted in both the inner
+  and the outer measurement.
+
+Measurements are aggregated per name into counters and fixed-bucket histograms
+(``instrumentation_snapshot()``) and passed to every registered reporter — any callable
+taking a ``Measurement``. ``logging_reporter`` and ``statsd_reporter`` adapt the two common
+sinks::
+
+    from app_models.shared import instrumentation
+
+    instrumentation.enable_instrumentation(
+        instrumentation.statsd_reporter(timing=statsd.timing, incr=statsd.incr),
+    )
+"""
+
+from __future__ import annotations
+
+import bisect
+import functools
+import logging
+import os
+import threading
+import time
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence
+
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100)
+
+
+@dataclass(frozen=True)
+class Measurement:
+    name: str
+    duration_ms: float
+    query_count: int
+    failed: bool
+
+
+Reporter = Callable[[Measurement], None]
+
+
+@dataclass
+class FunctionStats:
+    """
+    Running totals for one instrumented name. Histogram counts align with the bucket bounds,
+    plus one overflow slot.
+    """
+
+    calls: int = 0
+    failures: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    total_queries: int = 0
+    max_queries: int = 0
+    latency_histogram: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    query_histogram: List[int] = field(default_factory=lambda: [0] * (len(QUERY_COUNT_BUCKETS) + 1))
+
+    def add(self, m: Measurement) -> None:
+        self.calls += 1
+        self.failures += int(m.failed)
+        self.total_ms += m.duration_ms
+        self.max_ms = max(self.max_ms, m.duration_ms)
+        self.total_queries += m.query_count
+        self.max_queries = max(self.max_queries, m.query_count)
+        self.latency_histogram[bisect.bisect_left(LATENCY_BUCKETS_MS, m.duration_ms)] += 1
+        self.query_histogram[bisect.bisect_left(QUERY_COUNT_BUCKETS, m.query_count)] += 1
+
+    def as_dict(self) -> dict:
+        return {
+            'calls': self.calls,
+            'failures': self.failures,
+            'total_ms': self.total_ms,
+            'max_ms': self.max_ms,
+            'mean_ms': self.total_ms / self.calls if self.calls else 0.0,
+            'total_queries': self.total_queries,
+            'max_queries': self.max_queries,
+            'latency_buckets_ms': list(LATENCY_BUCKETS_MS),
+            'latency_histogram': list(self.latency_histogram),
+            'query_count_buckets': list(QUERY_COUNT_BUCKETS),
+            'query_histogram': list(self.query_histogram),
+        }
+
+
+_enabled = os.environ.get('APP_MODELS_INSTRUMENTATION', '').lower() in ('1', 'true', 'yes')
+_reporters: List[Reporter] = []
+_stats: Dict[str, FunctionStats] = {}
+_stats_lock = threading.Lock()
+
+
+def enable_instrumentation(*reporters: Reporter) -> None:
+    """Turn measurement on for this process and register ``reporters`` (optional)."""
+    global _enabled
+    for reporter in reporters:
+        add_reporter(reporter)
+    _enabled = True
+
+
+def disable_instrumentation() -> None:
+    global _enabled
+    _enabled = False
+
+
+def instrumentation_enabled() -> bool:
+    return _enabled
+
+
+def add_reporter(reporter: Reporter) -> None:
+    if reporter not in _reporters:
+        _reporters.append(reporter)
+
+
+def remove_reporter(reporter: Reporter) -> None:
+    if reporter in _reporters:
+        _reporters.remove(reporter)
+
+
+def instrumentation_snapshot() -> Dict[str, dict]:
+    """Per-name counters and histograms collected since the last reset."""
+    with _stats_lock:
+        return {name: stats.as_dict() for name, stats in _stats.items()}
+
+
+def reset_instrumentation() -> None:
+    with _stats_lock:
+        _stats.clear()
+
+
+class _QueryCounter:
+    __slots__ = ('count',)
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def _record(m: Measurement) -> None:
+    with _stats_lock:
+        stats = _stats.get(m.name)
+        if stats is None:
+            stats = _stats[m.name] = FunctionStats()
+        stats.add(m)
+    for reporter in list(_reporters):
+        try:
+            reporter(m)
+        except Exception:
+            logger.exception('Instrumentation reporter %r failed for %s', reporter, m.name)
+
+
+def _measure(name: str, func: Callable, args, kwargs):
+    counter = _QueryCounter()
+    failed = False
+    start = time.perf_counter()
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(counter))
+            return func(*args, **kwargs)
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        _record(Measurement(name, (time.perf_counter() - start) * 1000.0, counter.count, failed))
+
+
+def instrumented(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """
+    Decorator recording timing and query count for each call while instrumentation is enabled.
+
+    ``name`` defaults to ``module.qualname``. Apply it under ``@receiver`` so the connected
+    receiver is the wrapper.
+    """
+
+    def decorate(func: Callable) -> Callable:
+        label = name or f'{func.__module__}.{func.__qualname__}'
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            return _measure(label, func, args, kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def logging_reporter(log: Optional[logging.Logger] = None, level: int = logging.DEBUG) -> Reporter:
+    """Reporter writing one log line per measurement."""
+    log = log or logger
+
+    def report(m: Measurement) -> None:
+        log.log(
+            level,
+            '%s took %.2fms, %d queries%s',
+            m.name,
+            m.duration_ms,
+            m.query_count,
+            ' (failed)' if m.failed else '',
+        )
+
+    return report
+
+
+def statsd_reporter(
+    *,
+    timing: Callable[[str, float], None],
+    incr: Callable[[str, int], None],
+    prefix: str = '',
+    tags: Sequence[str] = (),
+) -> Reporter:
+    """
+    Adapt statsd-style callables: ``timing(metric, ms)`` gets the latency,
+    ``incr(metric, n)`` the call, query and failure counts. Metric names are the
+    instrumented name (already ``app_models.``-qualified) under an optional ``prefix``;
+    ``tags`` are appended with dots for sinks without native tagging.
+    """
+    suffix = ''.join(f'.{t}' for t in tags)
+
+    def report(m: Measurement) -> None:
+        base = f'{prefix}.{m.name}' if prefix else m.name
+        timing(f'{base}.duration_ms{suffix}', m.duration_ms)
+        incr(f'{base}.calls{suffix}', 1)
+        incr(f'{base}.queries{suffix}', m.query_count)
+        if m.failed:
+            incr(f'{base}.failures{suffix}', 1)
+
+    return report
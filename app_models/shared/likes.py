@@ -0,0 +1,86 @@
+"""
+"Liked by the viewer" lookups for feeds.
+
+Three models can be liked: forum ``Post`` (``PostLike``), ``PublicFeed`` (``PublicFeedsLike``)
+and ``Community`` (``CommunityLike``). Each like model is unique on (user, object), so both
+forms below are an index probe on that unique index:
+
+* ``viewer_liked_ids(Post, user, ids)`` returns the subset of ``ids`` the viewer liked, with
+  one query per call. Use it for pages that are already loaded. ``attach_viewer_liked`` sets
+  ``viewer_liked`` on each object from that set.
+* ``Post.objects.filter(...).with_viewer_liked(user)`` annotates ``viewer_liked`` with an
+  ``EXISTS`` subquery, in the same query as the page.
+
+Anonymous viewers (``None`` or ``is_anonymous``) never hit the database and get ``False``.
+Like models are resolved by label, so this module loads under any ``app_models.profiles``
+profile. It only needs the liked model's app when it is actually called.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Set, Tuple, Type
+
+from django.apps import apps
+from django.db import models
+from django.db.models import Exists, OuterRef, Value
+
+from app_models.shared.instrumentation import instrumented
+
+# Liked model label -> (like model label, FK field on the like model pointing at it)
+LIKE_MODELS: Dict[str, Tuple[str, str]] = {
+    'community_forum.Post': ('community_forum.PostLike', 'post'),
+    'community_publicfeeds.PublicFeed': ('community_publicfeeds.PublicFeedsLike', 'public_feed'),
+    'community.Community': ('community.CommunityLike', 'community'),
+}
+
+
+def _like_relation(model: Type[models.Model]) -> Tuple[Type[models.Model], str]:
+    try:
+        like_label, field = LIKE_MODELS[model._meta.label]
+    except KeyError:
+        raise ValueError(f'{model._meta.label} has no like model registered in shared.likes.LIKE_MODELS') from None
+    return apps.get_model(like_label), field
+
+
+def _viewer_id(user):
+    if user is None or getattr(user, 'is_anonymous', False):
+        return None
+    return getattr(user, 'pk', user)
+
+
+@instrumented()
+def viewer_liked_ids(model: Type[models.Model], user, ids: Iterable[int]) -> Set[int]:
+    """Subset of ``ids`` (primary keys of ``model``) liked by ``user``; one query, none if anonymous or empty."""
+    user_id = _viewer_id(user)
+    ids = set(ids)
+    if user_id is None or not ids:
+        return set()
+    like_model, field = _like_relation(model)
+    return set(
+        like_model.objects.filter(user_id=user_id, **{f'{field}_id__in': ids})
+        .values_list(f'{field}_id', flat=True)
+    )
+
+
+def attach_viewer_liked(objs, user) -> None:
+    """Set ``viewer_liked`` on each of ``objs`` (all of one model) with a single lookup."""
+    objs = list(objs)
+    if not objs:
+        return
+    liked = viewer_liked_ids(type(objs[0]), user, (o.pk for o in objs))
+    for obj in objs:
+        obj.viewer_liked = obj.pk in liked
+
+
+class ViewerLikedQuerySet(models.QuerySet):
+    """QuerySet for likeable models (see ``LIKE_MODELS``)."""
+
+    def with_viewer_liked(self, user) -> 'ViewerLikedQuerySet':
+        """Annotate ``viewer_liked`` (bool) using ``EXISTS`` on the like table."""
+        user_id = _viewer_id(user)
+        if user_id is None:
+            return self.annotate(viewer_liked=Value(False, output_field=models.BooleanField()))
+        like_model, field = _like_relation(self.model)
+        return self.annotate(
+            viewer_liked=Exists(like_model.objects.filter(user_id=user_id, **{field: OuterRef('pk')})),
+        )
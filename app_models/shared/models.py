@@ -1,5 +1,5 @@
-from rest_framework.exceptions import APIException
 from django.db import models
+from app_models.shared.instrumentation import instrumented
 
 class Tag(models.Model):
     """Tag model for communities and user interests"""
@@ -10,6 +10,7 @@ class Tag(models.Model):
     def __str__(self):
         return self.name
 
+    @instrumented()
     def save(self, *args, **kwargs):
         from django.utils.text import slugify
         if not self.slug:
@@ -23,42 +24,15 @@ class Tag(models.Model):
         verbose_name_plural = 'Tags'
         ordering = ['name']
 
-class InternalServerError(APIException):
-    status_code = 500
-    default_detail = "An unexpected error occurred. Please try again later."
-    default_code = "internal_error"
 
-    def __init__(self, detail=None):
-        """
-        Allow passing a custom error message.
-        If no message is provided, use the default.
-        """
-        if detail is None:
-            detail = self.default_detail
-        super().__init__(detail)
+_LAZY_EXCEPTIONS = ('InternalServerError', 'CustomWebApiException')
 
 
-class CustomWebApiException(APIException):
-    status_code = 400
-    default_detail = "Something went wrong."
-    default_code = "server exception error"
+def __getattr__(name):
+    # Backwards-compatible ``from app_models.shared.models import CustomWebApiException``
+    # without importing rest_framework when the app registry loads.
+    if name in _LAZY_EXCEPTIONS:
+        from app_models.shared import exceptions
 
-    def __init__(self, error=None, code=None):
-        # Use the passed-in error or fall back to the default
-        if error is not None:
-            self.detail = error
-        else:
-            self.detail = self.default_detail
-
-        # Use the passed-in code or fall back to the default
-        if code is not None:
-            self.default_code = code
-
-        super().__init__(self.detail, self.default_code)
-
-    def get_full_details(self):
-
-        return {
-            "error": self.detail,
-            "code": self.default_code
-        }
+        return getattr(exceptions, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
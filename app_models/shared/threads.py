@@ -0,0 +1,145 @@
+"""
+Reply-tree loading for self-referencing posts.
+
+Forum ``Post`` (``parent_post``) and ``PublicFeed`` (``parent_feed``) replies nest to any
+depth. Walking them level by level costs one query per level, plus one per level for authors
+and attachments. ``load_threads`` collects the whole tree in the database instead: a
+recursive CTE walks down from the roots, and the rows come back in a single query with the
+author joined (``select_related``). Attachments come in one more query (``prefetch_related``),
+and ``viewer_liked`` is annotated when a viewer is given (``app_models.shared.likes``).
+
+The walk stops at ``max_depth`` levels below each root and keeps at most
+``replies_per_node`` replies (oldest first) under each node; replies past the limit and
+everything below them are never walked. Both sides read the partial (parent, created_at, id)
+indexes ``post_thread_replies_idx`` / ``publicfeeds_thread_idx``. On PostgreSQL each visited
+node takes its first replies with a ``LATERAL ... LIMIT`` subquery, so it reads at most
+``replies_per_node`` index entries. Other databases (SQLite has neither ``LATERAL`` nor window
+functions in the recursive term) keep a reply when its id is among the first
+``replies_per_node`` of its parent (``IN (... ORDER BY ... LIMIT)``), so a node with more
+replies than the limit still has every reply's index entry checked.
+
+Rows are then linked into ``ThreadNode`` trees in one pass. ``ThreadNode.has_more`` compares
+the loaded replies with the denormalized ``reply_count``, so clients know where to offer
+"load more" (``load_thread`` on that node).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple, Type
+
+from django.db import connections, models, router
+from django.db.models.expressions import RawSQL
+
+from app_models.shared.instrumentation import instrumented
+
+THREAD_MAX_DEPTH = 8
+THREAD_REPLIES_PER_NODE = 50
+
+# Threaded model label -> (self-referencing parent FK, author FK)
+THREAD_MODELS: Dict[str, Tuple[str, str]] = {
+    'community_forum.Post': ('parent_post', 'user'),
+    'community_publicfeeds.PublicFeed': ('parent_feed', 'posted_by'),
+}
+
+
+@dataclass
+class ThreadNode:
+    obj: models.Model
+    depth: int = 0
+    replies: List['ThreadNode'] = field(default_factory=list)
+
+    @property
+    def has_more(self) -> bool:
+        """True when the node has replies that were not loaded (depth or per-node limit)."""
+        return self.obj.reply_count > len(self.replies)
+
+
+def _thread_fields(model: Type[models.Model]) -> Tuple[str, str]:
+    try:
+        return THREAD_MODELS[model._meta.label]
+    except KeyError:
+        raise ValueError(f'{model._meta.label} is not registered in shared.threads.THREAD_MODELS') from None
+
+
+def _thread_ids_sql(model: Type[models.Model], parent_field: str, root_count: int) -> str:
+    connection = connections[router.db_for_read(model)]
+    qn = connection.ops.quote_name
+    table = qn(model._meta.db_table)
+    pk = qn(model._meta.pk.column)
+    parent = qn(model._meta.get_field(parent_field).column)
+    created = qn(model._meta.get_field('created_at').column)
+    roots = ', '.join(['%s'] * root_count)
+    if connection.vendor == 'postgresql':
+        replies = (
+            f'SELECT c.id, t.depth + 1 FROM thread t CROSS JOIN LATERAL ('
+            f'SELECT s.{pk} AS id FROM {table} s WHERE s.{parent} = t.id '
+            f'ORDER BY s.{created}, s.{pk} LIMIT %s'
+            f') c WHERE t.depth < %s'
+        )
+    else:
+        replies = (
+            f'SELECT c.{pk}, t.depth + 1 FROM {table} c JOIN thread t ON c.{parent} = t.id '
+            f'WHERE c.{pk} IN ('
+            f'SELECT s.{pk} FROM {table} s WHERE s.{parent} = c.{parent} '
+            f'ORDER BY s.{created}, s.{pk} LIMIT %s'
+            f') AND t.depth < %s'
+        )
+    return (
+        f'WITH RECURSIVE thread (id, depth) AS ('
+        f'SELECT {pk}, 0 FROM {table} WHERE {pk} IN ({roots}) '
+        f'UNION ALL {replies}'
+        f') SELECT id FROM thread'
+    )
+
+
+@instrumented()
+def load_threads(
+    model: Type[models.Model],
+    root_ids: Iterable[int],
+    *,
+    max_depth: int = THREAD_MAX_DEPTH,
+    replies_per_node: int = THREAD_REPLIES_PER_NODE,
+    viewer=None,
+) -> Dict[int, ThreadNode]:
+    """
+    Reply trees under each of ``root_ids`` (primary keys of ``model``), keyed by root id.
+    Replies are ordered oldest first. Missing roots are left out. Two queries: the rows with
+    their authors, and their attachments.
+    """
+    parent_field, author_field = _thread_fields(model)
+    root_ids = list(dict.fromkeys(root_ids))
+    if not root_ids:
+        return {}
+    sql = _thread_ids_sql(model, parent_field, len(root_ids))
+    params = (*root_ids, replies_per_node, max_depth)
+    qs = (
+        model.objects.filter(pk__in=RawSQL(sql, params))
+        .select_related(author_field)
+        .prefetch_related('attachments')
+        .order_by('created_at', 'pk')
+    )
+    if viewer is not None:
+        qs = qs.with_viewer_liked(viewer)
+
+    nodes = {obj.pk: ThreadNode(obj) for obj in qs}
+    parent_attname = model._meta.get_field(parent_field).attname
+    roots: Dict[int, ThreadNode] = {}
+    for pk, node in nodes.items():
+        parent = nodes.get(getattr(node.obj, parent_attname))
+        if pk in root_ids or parent is None:
+            roots[pk] = node
+        else:
+            parent.replies.append(node)
+    stack = list(roots.values())
+    while stack:
+        node = stack.pop()
+        for reply in node.replies:
+            reply.depth = node.depth + 1
+            stack.append(reply)
+    return {pk: roots[pk] for pk in root_ids if pk in roots}
+
+
+def load_thread(model: Type[models.Model], root_id: int, **options) -> Optional[ThreadNode]:
+    """The reply tree under ``root_id`` (see ``load_threads``), or ``None`` if it does not exist."""
+    return load_threads(model, [root_id], **options).get(root_id)
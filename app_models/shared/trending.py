@@ -0,0 +1,92 @@
+"""
+Periodically refreshed ``trending_score`` for forum ``Post`` and ``PublicFeed`` items.
+
+The score combines the denormalized counters (``app_models.shared.counters``) with time
+decay, in the style of Hacker News ranking::
+
+    (like_count + TRENDING_REPLY_WEIGHT * reply_count + 1) / (age_hours + 2) ** TRENDING_GRAVITY
+
+The score depends on the clock, so it cannot be kept current by signals.
+``refresh_trending_scores`` recomputes it in the database: one ``UPDATE`` per
+``batch_size`` primary keys, for top-level items created within ``TRENDING_WINDOW_DAYS``. It
+then zeroes the scores of items that have aged out of the window. Run it periodically through
+the ``refresh_*_trending_scores`` management commands. Scores are only ever
+compared with each other, so a few minutes of staleness does not change the ranking
+noticeably.
+
+Trending lists read ``trending_score > 0`` through the per-forum / per-community partial
+indexes on (container, -trending_score, -id). They are a plain index range scan.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+from django.db import models
+from django.db.models import F, FloatField, Func, Value
+from django.db.models.functions import Power
+from django.utils import timezone
+
+TRENDING_REPLY_WEIGHT = 2
+TRENDING_GRAVITY = 1.5
+TRENDING_WINDOW_DAYS = 7
+TRENDING_BATCH_SIZE = 2000
+TRENDING_PAGE_SIZE = 20
+
+TRENDING_ORDERING = ('-trending_score', '-id')
+
+
+class AgeHours(Func):
+    """Hours between ``now`` and a datetime column, as a float."""
+
+    arg_joiner = ' - '
+    template = 'EXTRACT(EPOCH FROM (%(expressions)s)) / 3600.0'
+    output_field = FloatField()
+
+    def __init__(self, expression, now: datetime, **extra):
+        super().__init__(Value(now, output_field=models.DateTimeField()), expression, **extra)
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler,
+            connection,
+            template='(julianday(%(expressions)s)) * 24.0',
+            arg_joiner=') - julianday(',
+            **extra_context,
+        )
+
+
+def trending_score(now: datetime):
+    """Expression computing the trending score of each row at ``now``."""
+    engagement = F('like_count') + TRENDING_REPLY_WEIGHT * F('reply_count') + 1
+    return models.ExpressionWrapper(
+        engagement * 1.0 / Power(AgeHours('created_at', now) + 2, TRENDING_GRAVITY),
+        output_field=FloatField(),
+    )
+
+
+def refresh_trending_scores(
+    queryset: models.QuerySet,
+    *,
+    now: Optional[datetime] = None,
+    batch_size: int = TRENDING_BATCH_SIZE,
+) -> int:
+    """
+    Recompute ``trending_score`` for the rows of ``queryset`` created within the window and
+    zero it for older rows that still have one. Returns the number of rows scored.
+    """
+    now = now or timezone.now()
+    cutoff = now - timedelta(days=TRENDING_WINDOW_DAYS)
+    model = queryset.model
+    recent = queryset.filter(created_at__gte=cutoff)
+    scored = 0
+    last_pk = 0
+    while True:
+        pks = list(recent.filter(pk__gt=last_pk).order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not pks:
+            break
+        scored += model.objects.filter(pk__in=pks).update(trending_score=trending_score(now))
+        last_pk = pks[-1]
+    queryset.filter(created_at__lt=cutoff, trending_score__gt=0).update(trending_score=0)
+    return scored
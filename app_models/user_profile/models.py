@@ -1,6 +1,9 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from app_models.account.models import User
 from app_models.shared.models import Tag
+from app_models.shared.instrumentation import instrumented
 
 def user_directory_path(instance, filename):
     # Extract the file extension (if any)
@@ -151,3 +154,17 @@ class UserAddress(models.Model):
             self.country or self.country_code,
         ]
         return ', '.join(p for p in parts if p) or f'Address #{self.pk}'
+
+
+@receiver(post_save, sender=UserAddress)
+@receiver(post_delete, sender=UserAddress)
+@instrumented()
+def invalidate_buyer_routing_country(sender, instance, using, **kwargs):
+    """
+    Drop the cached checkout routing country whenever one of the user's addresses changes. The
+    delete waits for the commit so a concurrent reader cannot re-cache the old address.
+    """
+    from app_models.app_payments.buyer_routing import invalidate_buyer_country
+
+    user_id = instance.user_id
+    transaction.on_commit(lambda: invalidate_buyer_country(user_id), using=using)
@@ -0,0 +1,13 @@
+"""
+Benchmarks for the shared model layer.
+
+Run from the repository root::
+
+    python -m benchmarks.run --scale small --output bench.json
+    BENCH_DATABASE=postgres BENCH_PG_NAME=bench python -m benchmarks.run --output bench.json
+    python -m benchmarks.compare before.json after.json
+
+The suite builds a throw-away test database (``test_<name>`` on PostgreSQL, in-memory on
+SQLite) from the current models, seeds a synthetic dataset, then times the hot operations
+the services run against these models. Not part of the installed package.
+"""
@@ -0,0 +1,145 @@
+"""
+Benchmark cases. Each case is registered with ``@case(name)``; its function receives the
+seeded ``Dataset`` and returns the operation to time, called with the iteration number.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Callable, Dict
+
+from django.db.models import F
+from django.utils import timezone
+
+from benchmarks.seed import Dataset
+
+Operation = Callable[[int], object]
+CASES: Dict[str, Callable[[Dataset], Operation]] = {}
+
+
+def case(name: str):
+    def register(setup: Callable[[Dataset], Operation]) -> Callable[[Dataset], Operation]:
+        CASES[name] = setup
+        return setup
+
+    return register
+
+
+@case('community_create')
+def community_create(data: Dataset) -> Operation:
+    """Community insert plus its post_save fan-out (default group, settings, forum, telegram, store)."""
+    from app_models.community.models import Community
+
+    return lambda i: Community.objects.create(name=f'Created community {i}')
+
+
+@case('slot_listing')
+def slot_listing(data: Dataset) -> Operation:
+    from app_models.community_store.models import StoreProduct
+    from app_models.community_store.slot_utils import list_meeting_slots_for_product_public
+
+    product_id = data.meeting_product_ids[0]
+    today = timezone.now().date()
+
+    def op(i):
+        product = StoreProduct.objects.get(pk=product_id)
+        return list_meeting_slots_for_product_public(product, range_start=today, range_end=today + timedelta(days=14))
+
+    return op
+
+
+@case('checkout_validation')
+def checkout_validation(data: Dataset) -> Operation:
+    from app_models.community_store.models import StoreProduct
+    from app_models.community_store.slot_utils import (
+        list_meeting_slots_for_product_public,
+        validate_booked_slot_start_for_checkout,
+    )
+
+    product_id = data.meeting_product_ids[0]
+    today = timezone.now().date()
+    slots = list_meeting_slots_for_product_public(
+        StoreProduct.objects.get(pk=product_id),
+        range_start=today,
+        range_end=today + timedelta(days=14),
+    )
+    starts = [datetime.fromisoformat(s['start'].replace('Z', '+00:00')) for s in slots if s['available']]
+
+    def op(i):
+        product = StoreProduct.objects.get(pk=product_id)
+        return validate_booked_slot_start_for_checkout(product, starts[i % len(starts)])
+
+    return op
+
+
+@case('leaderboard_award')
+def leaderboard_award(data: Dataset) -> Operation:
+    """Idempotent one-time award row plus the points increment on the member."""
+    from app_models.community.models import CommunityMember, LeaderboardPointAward
+
+    member_ids = data.member_ids
+
+    def op(i):
+        member_id = member_ids[i % len(member_ids)]
+        _award, created = LeaderboardPointAward.objects.get_or_create(
+            community_member_id=member_id,
+            action_key='bench_action',
+            source_id=str(i),
+        )
+        if created:
+            CommunityMember.objects.filter(pk=member_id).update(points=F('points') + 10)
+
+    return op
+
+
+@case('forum_listing')
+def forum_listing(data: Dataset) -> Operation:
+    """First page of top-level posts with author and attachments."""
+    from app_models.community_forum.models import Post
+
+    forum_ids = data.forum_ids
+
+    def op(i):
+        return list(
+            Post.objects.filter(forum_id=forum_ids[i % len(forum_ids)], parent_post__isnull=True)
+            .select_related('user')
+            .prefetch_related('attachments')[:20]
+        )
+
+    return op
+
+
+@case('forum_feed')
+def forum_feed_pages(data: Dataset) -> Operation:
+    """First three keyset pages of a forum feed (community_forum.feed)."""
+    from app_models.community_forum.feed import forum_feed
+
+    forum_ids = data.forum_ids
+
+    def op(i):
+        cursor = None
+        for _ in range(3):
+            page = forum_feed(forum_ids[i % len(forum_ids)], after=cursor, limit=20)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+    return op
+
+
+@case('entitlement_check')
+def entitlement_check(data: Dataset) -> Operation:
+    """Owner's active app subscription tier and one feature flag."""
+    from app_models.app_subscription.models import AppSubscription
+
+    owner_ids = data.owner_ids
+
+    def op(i):
+        sub = (
+            AppSubscription.objects.filter(user_id=owner_ids[i % len(owner_ids)], status='active')
+            .select_related('tier')
+            .first()
+        )
+        return bool(sub and (sub.tier.entitlements.get('features') or {}).get('has_store_access'))
+
+    return op
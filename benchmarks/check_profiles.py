@@ -0,0 +1,73 @@
+"""
+Check the ``app_models.profiles`` INSTALLED_APPS profiles (run it in CI).
+
+    python -m benchmarks.check_profiles [--profile payment,...]
+
+First a fresh interpreter boots every app (``benchmarks.settings``) and runs
+``verify_profiles()``; any ``APP_DEPENDENCIES`` edge it reports fails the check. Then each
+profile (all of ``PROFILE_ROOTS`` by default) is booted alone with
+``benchmarks.startup.run_once``, which fails on import errors and system-check errors such as
+a lazy signal sender pointing at an app the profile does not install. Exits 1 on any failure.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import List, Optional
+
+from app_models.profiles import PROFILE_ROOTS
+from benchmarks.startup import run_once
+
+_VERIFY_CHILD = """
+import django
+django.setup()
+import json
+from app_models.profiles import verify_profiles
+print(json.dumps(verify_profiles()))
+"""
+
+
+def missing_dependencies() -> List[str]:
+    """``verify_profiles()`` with every app installed, run in a fresh interpreter."""
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE='benchmarks.settings')
+    env.pop('BENCH_APPS', None)
+    env.pop('BENCH_PROFILE', None)
+    proc = subprocess.run([sys.executable, '-c', _VERIFY_CHILD], capture_output=True, text=True, env=env, check=False)
+    if proc.returncode != 0:
+        raise RuntimeError(f'verify_profiles child failed:\n{proc.stderr[-4000:]}')
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--profile', help='Comma-separated profiles to boot (default: all)')
+    args = parser.parse_args(argv)
+
+    profiles = [p.strip() for p in args.profile.split(',') if p.strip()] if args.profile else sorted(PROFILE_ROOTS)
+    unknown = [p for p in profiles if p not in PROFILE_ROOTS]
+    if unknown:
+        parser.error(f'unknown profiles {unknown}; expected some of {sorted(PROFILE_ROOTS)}')
+
+    problems = missing_dependencies()
+    for problem in problems:
+        print(f'APP_DEPENDENCIES: {problem}', file=sys.stderr)
+    failed = bool(problems)
+    print(f'verify_profiles(): {"FAIL" if problems else "ok"}')
+
+    for name in profiles:
+        try:
+            meta = run_once(None, [name])['meta']
+        except RuntimeError as exc:
+            failed = True
+            print(f'profile {name}: FAIL\n{exc}', file=sys.stderr)
+            continue
+        print(f'profile {name}: ok ({meta["setup_ms"]:.0f}ms)')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
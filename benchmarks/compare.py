@@ -0,0 +1,50 @@
+"""
+Compare two benchmark JSON reports (e.g. before/after a model change).
+
+    python -m benchmarks.compare before.json after.json [--threshold 10]
+
+Prints median time and queries per case (startup reports from ``benchmarks.startup`` have no
+queries); exits 1 when any case's median regressed by more than ``--threshold`` percent or its
+query count grew.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('before')
+    parser.add_argument('after')
+    parser.add_argument('--threshold', type=float, default=10.0, help='Allowed median slowdown in percent')
+    args = parser.parse_args(argv)
+
+    with open(args.before) as fh:
+        before = json.load(fh)['results']
+    with open(args.after) as fh:
+        after = json.load(fh)['results']
+
+    regressed = False
+    print(f'{"case":<24} {"before ms":>10} {"after ms":>10} {"change":>8} {"queries":>14}')
+    for name in sorted(before.keys() | after.keys()):
+        if name not in before or name not in after:
+            print(f'{name:<24} {"only in " + ("after" if name in after else "before"):>44}')
+            continue
+        b, a = before[name], after[name]
+        change = (a['median_ms'] - b['median_ms']) / b['median_ms'] * 100.0 if b['median_ms'] else 0.0
+        b_queries, a_queries = b.get('queries_per_op', 0.0), a.get('queries_per_op', 0.0)
+        queries = f'{b_queries:.1f} -> {a_queries:.1f}'
+        flag = ''
+        if change > args.threshold or a_queries > b_queries:
+            regressed = True
+            flag = '  REGRESSION'
+        print(f'{name:<24} {b["median_ms"]:>10.2f} {a["median_ms"]:>10.2f} {change:>7.1f}% {queries:>14}{flag}')
+    return 1 if regressed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+Per-module import timing for ``benchmarks.startup``.
+
+``-X importtime`` only sees imports that go through the C import path, so it misses the
+``models`` modules Django loads with ``importlib.import_module``. ``install()`` puts a finder
+at the front of ``sys.meta_path`` that wraps each loader's ``exec_module`` and records self
+time (excluding nested imports) per module. Garbage-collector pauses are recorded under
+``GC_KEY`` rather than charged to whichever module happened to trigger a collection. It
+imports nothing beyond ``gc``, ``sys`` and ``time`` so the modules being measured are not
+preloaded.
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import time
+
+GC_KEY = ':gc'
+
+self_ms: dict[str, float] = {}
+_stack: list[float] = []
+_gc_start = 0.0
+
+
+def _on_gc(phase, info):
+    global _gc_start
+    if phase == 'start':
+        _gc_start = time.perf_counter()
+        return
+    elapsed = (time.perf_counter() - _gc_start) * 1000.0
+    self_ms[GC_KEY] = self_ms.get(GC_KEY, 0.0) + elapsed
+    if _stack:
+        _stack[-1] += elapsed
+
+
+class _TimingLoader:
+    def __init__(self, loader, name: str):
+        self._loader = loader
+        self._name = name
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        _stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000.0
+            nested = _stack.pop()
+            self_ms[self._name] = self_ms.get(self._name, 0.0) + elapsed - nested
+            if _stack:
+                _stack[-1] += elapsed
+
+
+class _TimingFinder:
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                    spec.loader = _TimingLoader(spec.loader, fullname)
+                return spec
+        return None
+
+
+def install() -> None:
+    if not any(isinstance(f, _TimingFinder) for f in sys.meta_path):
+        sys.meta_path.insert(0, _TimingFinder())
+        gc.callbacks.append(_on_gc)
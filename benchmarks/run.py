@@ -0,0 +1,128 @@
+"""
+Run the benchmark cases and emit JSON.
+
+    python -m benchmarks.run [--scale small|medium|large] [--iterations 50] [--case NAME ...] [--output FILE]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone as dt_timezone
+from typing import Dict, List, Optional
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+class _QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_case(name: str, op, iterations: int, warmup: int) -> Dict[str, float]:
+    from django.db import connection
+
+    for i in range(warmup):
+        op(-1 - i)
+    timings: List[float] = []
+    counter = _QueryCounter()
+    with connection.execute_wrapper(counter):
+        for i in range(iterations):
+            start = time.perf_counter()
+            op(i)
+            timings.append((time.perf_counter() - start) * 1000.0)
+    return {
+        'iterations': iterations,
+        'min_ms': min(timings),
+        'median_ms': statistics.median(timings),
+        'mean_ms': statistics.fmean(timings),
+        'p95_ms': _percentile(timings, 95),
+        'max_ms': max(timings),
+        'queries_per_op': counter.count / iterations,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', default='small')
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--warmup', type=int, default=3)
+    parser.add_argument('--case', action='append', dest='cases', help='Run only this case (repeatable)')
+    parser.add_argument('--output', help='Write JSON here instead of stdout')
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'benchmarks.settings')
+    import django
+
+    django.setup()
+    from django.db import connection
+
+    from benchmarks.cases import CASES
+    from benchmarks.seed import SCALES, seed
+
+    if args.scale not in SCALES:
+        parser.error(f'unknown scale {args.scale!r}; choose from {sorted(SCALES)}')
+    names = args.cases or list(CASES)
+    unknown = sorted(set(names) - CASES.keys())
+    if unknown:
+        parser.error(f'unknown case(s) {unknown}; choose from {sorted(CASES)}')
+
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        seed_start = time.perf_counter()
+        data = seed(args.scale)
+        seed_seconds = time.perf_counter() - seed_start
+        results = {}
+        for name in names:
+            op = CASES[name](data)
+            results[name] = run_case(name, op, args.iterations, args.warmup)
+            print(f'{name}: median {results[name]["median_ms"]:.2f}ms, {results[name]["queries_per_op"]:.1f} queries', file=sys.stderr)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    report = {
+        'meta': {
+            'commit': _git_commit(),
+            'timestamp': datetime.now(dt_timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+            'scale': args.scale,
+            'counts': data.counts,
+            'seed_seconds': seed_seconds,
+        },
+        'results': results,
+    }
+    payload = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as fh:
+            fh.write(payload + '\n')
+    else:
+        print(payload)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,15 @@
+"""
+Synthetic dataset for the benchmarks, built with ``app_models.factories``: communities with
+owners and members, forum activity, views, chat, engagement, store products with paid
+purchases, and owner app subscriptions.
+"""
+
+from __future__ import annotations
+
+from app_models.factories import SCALES, Dataset, seed_dataset
+
+__all__ = ['SCALES', 'Dataset', 'seed']
+
+
+def seed(scale: str = 'small') -> Dataset:
+    return seed_dataset(scale, seed=0)
@@ -0,0 +1,86 @@
+"""
+Django settings for the benchmark suite.
+
+Tables are created straight from the current models (migrations disabled) so a run measures
+the model definitions being benchmarked, not the migration history. Pick the backend with
+``BENCH_DATABASE=sqlite`` (default) or ``BENCH_DATABASE=postgres`` plus ``BENCH_PG_*``;
+``BENCH_APPS`` (comma-separated) installs only those app_models apps, ``BENCH_PROFILE`` only
+the apps of those ``app_models.profiles`` profiles.
+"""
+
+import os
+
+SECRET_KEY = 'benchmarks-not-secret'
+DEBUG = False
+USE_TZ = True
+TIME_ZONE = 'UTC'
+DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+AUTH_USER_MODEL = 'account.User'
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+MODEL_APPS = [
+    'app_models.shared',
+    'app_models.account',
+    'app_models.user_profile',
+    'app_models.community',
+    'app_models.app_payments',
+    'app_models.app_subscription',
+    'app_models.storage_usage',
+    'app_models.community_classroom',
+    'app_models.community_classroom_content',
+    'app_models.community_forum',
+    'app_models.community_blog',
+    'app_models.blog',
+    'app_models.community_resource',
+    'app_models.community_quiz',
+    'app_models.community_polls',
+    'app_models.community_meetings',
+    'app_models.community_chat',
+    'app_models.community_wheel',
+    'app_models.community_publicfeeds',
+    'app_models.community_feedback',
+    'app_models.community_leave_reason',
+    'app_models.community_abuse_report',
+    'app_models.community_telegram',
+    'app_models.badges',
+    'app_models.learning_journey',
+    'app_models.member_engagement',
+    'app_models.metrics',
+    'app_models.community_store',
+    'app_models.community_event',
+    'app_models.community_search',
+]
+
+if os.environ.get('BENCH_PROFILE'):
+    from app_models.profiles import profile_apps
+
+    MODEL_APPS = [a for a in profile_apps(*os.environ['BENCH_PROFILE'].split(',')) if a.startswith('app_models.')]
+elif os.environ.get('BENCH_APPS'):
+    # Subset used by benchmarks.startup --apps; must be closed under FK dependencies.
+    MODEL_APPS = [a for a in os.environ['BENCH_APPS'].split(',') if a]
+
+INSTALLED_APPS = [
+    'django.contrib.contenttypes',
+    'django.contrib.auth',
+] + MODEL_APPS
+
+MIGRATION_MODULES = {label.rsplit('.', 1)[1]: None for label in INSTALLED_APPS}
+
+if os.environ.get('BENCH_DATABASE', 'sqlite') == 'postgres':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('BENCH_PG_NAME', 'app_models_bench'),
+            'USER': os.environ.get('BENCH_PG_USER', 'postgres'),
+            'PASSWORD': os.environ.get('BENCH_PG_PASSWORD', ''),
+            'HOST': os.environ.get('BENCH_PG_HOST', 'localhost'),
+            'PORT': os.environ.get('BENCH_PG_PORT', '5432'),
+        },
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.environ.get('BENCH_SQLITE_NAME', ':memory:'),
+        },
+    }
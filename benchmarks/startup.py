@@ -0,0 +1,155 @@
+"""
+Measure app_models import and app-registry startup cost.
+
+    python -m benchmarks.startup [--runs 5] [--apps app_models.account,... | --profile notification,...] [--output FILE]
+
+Each run is a fresh interpreter that installs ``benchmarks.importtimer`` and calls
+``django.setup()`` with ``benchmarks.settings`` (or only the ``--apps`` subset or the apps of
+the ``--profile`` profiles, plus contenttypes/auth), then runs the system checks and fails on
+errors, so it also verifies that a profile is self-contained. Reported per run and summarised
+as medians:
+
+* ``django_setup``: wall time of ``import django; django.setup()``;
+* ``app:<label>``: self-time of every ``app_models.<label>`` module, so time spent
+  in one app's models is charged to that app, not to whichever app imported it first;
+* ``package:<name>``: self-time of the heaviest third-party top-level packages;
+* ``gc``: garbage-collector pauses during startup (kept out of the module timings).
+
+Run ``python -m compileall app_models`` first: stale bytecode is recompiled on every start
+when ``PYTHONDONTWRITEBYTECODE`` is set and would dominate the timings.
+
+The JSON has the same ``results`` shape as ``benchmarks.run`` so ``benchmarks.compare`` works
+on two startup reports.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from datetime import datetime, timezone as dt_timezone
+from typing import Dict, List, Optional
+
+from benchmarks import importtimer
+from benchmarks.run import _git_commit
+
+TOP_PACKAGES = 10
+
+_CHILD = """
+import sys, time
+from benchmarks import importtimer
+importtimer.install()
+start = time.perf_counter()
+import django
+django.setup()
+elapsed = (time.perf_counter() - start) * 1000.0
+import json
+from django.core import checks
+errors = [str(m) for m in checks.run_checks() if m.level >= checks.ERROR]
+print(json.dumps({
+    'check_errors': errors,
+    'setup_ms': elapsed,
+    'django': django.get_version(),
+    'rest_framework_loaded': 'rest_framework' in sys.modules,
+    'modules': importtimer.self_ms,
+}))
+"""
+
+
+def _bucket(module: str) -> str:
+    if module == importtimer.GC_KEY:
+        return 'gc'
+    parts = module.split('.')
+    if parts[0] == 'app_models':
+        return f'app:{parts[1]}' if len(parts) > 1 else 'app:app_models'
+    return f'package:{parts[0]}'
+
+
+def run_once(apps: Optional[List[str]], profiles: Optional[List[str]] = None) -> Dict[str, object]:
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE='benchmarks.settings')
+    if profiles:
+        env['BENCH_PROFILE'] = ','.join(profiles)
+    elif apps:
+        env['BENCH_APPS'] = ','.join(apps)
+    proc = subprocess.run(
+        [sys.executable, '-c', _CHILD],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f'startup child failed:\n{proc.stderr[-4000:]}')
+    meta = json.loads(proc.stdout.strip().splitlines()[-1])
+    if meta['check_errors']:
+        raise RuntimeError('system check errors:\n' + '\n'.join(meta['check_errors']))
+    buckets: Dict[str, float] = defaultdict(float)
+    for module, ms in meta.pop('modules').items():
+        buckets[_bucket(module)] += ms
+    return {'meta': meta, 'buckets': dict(buckets)}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--apps', help='Comma-separated app_models apps to install instead of all of them')
+    parser.add_argument('--profile', help='Comma-separated app_models.profiles profiles to install')
+    parser.add_argument('--output', help='Write JSON here instead of stdout')
+    args = parser.parse_args(argv)
+
+    apps = [a.strip() for a in args.apps.split(',') if a.strip()] if args.apps else None
+    profiles = [p.strip() for p in args.profile.split(',') if p.strip()] if args.profile else None
+    runs = [run_once(apps, profiles) for _ in range(args.runs)]
+
+    setup = [r['meta']['setup_ms'] for r in runs]
+    samples: Dict[str, List[float]] = defaultdict(list)
+    for r in runs:
+        for name, ms in r['buckets'].items():
+            samples[name].append(ms)
+    packages = sorted(
+        (name for name in samples if name.startswith('package:')),
+        key=lambda name: statistics.median(samples[name]),
+        reverse=True,
+    )[:TOP_PACKAGES]
+    keep = sorted(name for name in samples if name.startswith('app:')) + packages + (['gc'] if 'gc' in samples else [])
+
+    def summary(values: List[float]) -> Dict[str, float]:
+        return {
+            'iterations': len(values),
+            'min_ms': min(values),
+            'median_ms': statistics.median(values),
+            'mean_ms': statistics.fmean(values),
+            'max_ms': max(values),
+        }
+
+    results = {'django_setup': summary(setup)}
+    results.update((name, summary(samples[name])) for name in keep)
+    report = {
+        'meta': {
+            'commit': _git_commit(),
+            'timestamp': datetime.now(dt_timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'django': runs[0]['meta']['django'],
+            'apps': apps or 'all',
+            'profiles': profiles,
+            'rest_framework_loaded': any(r['meta']['rest_framework_loaded'] for r in runs),
+        },
+        'results': results,
+    }
+    print(f'django.setup(): median {results["django_setup"]["median_ms"]:.1f}ms', file=sys.stderr)
+    payload = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as fh:
+            fh.write(payload + '\n')
+    else:
+        print(payload)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())